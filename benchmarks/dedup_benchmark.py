@@ -0,0 +1,92 @@
+"""Verificação da detecção de quase-duplicados em pares de vagas típicos (republicações e vagas distintas).
+
+Uso:
+    python -m benchmarks.dedup_benchmark [--threshold 0.7] [--company-threshold 0.5]
+"""
+
+import argparse
+import sys
+
+from modules.core.dedup import company_key, fingerprint, required_similarity, similarity, title_words
+
+DESCRIPTION = (
+    "Estamos contratando pessoa desenvolvedora Python para atuar no time de dados. Requisitos: experiência com Python, "
+    "Django e PostgreSQL; conhecimento em Docker e AWS; inglês intermediário. Benefícios: vale refeição, plano de saúde, home office."
+)
+BOILERPLATE = "Sobre a empresa: somos líderes no mercado de tecnologia financeira. Benefícios: vale refeição, plano de saúde, home office."
+
+# (nome, duplicado esperado, job A, job B), com os jobs no formato (título, empresa, descrição)
+PAIRS = [
+    (
+        "republicação (título e empresa reformatados)",
+        True,
+        ("Desenvolvedor Python Pleno", "Empresa X Ltda", DESCRIPTION),
+        ("Desenvolvedor(a) Python Pleno - Remoto", "Empresa X", DESCRIPTION),
+    ),
+    (
+        "republicação (título e descrição editados)",
+        True,
+        ("Desenvolvedor Python Pleno", "Empresa X Ltda", DESCRIPTION),
+        (
+            "Pessoa Desenvolvedora Python Pleno",
+            "EMPRESA X S.A.",
+            DESCRIPTION.replace("inglês intermediário", "inglês intermediário ou avançado").replace("home office", "trabalho remoto"),
+        ),
+    ),
+    (
+        "mesma vaga em outro site",
+        True,
+        ("Desenvolvedor Python Pleno", "Empresa X", DESCRIPTION),
+        ("Desenvolvedor Python Pleno", "Empresa X Tecnologia", DESCRIPTION),
+    ),
+    (
+        "mesma empresa, outra vaga (texto institucional em comum)",
+        False,
+        ("Desenvolvedor Python Pleno", "Empresa X", f"{BOILERPLATE} Requisitos: Python, Django, AWS."),
+        ("Analista de Marketing", "Empresa X", f"{BOILERPLATE} Requisitos: Google Ads, SEO, inglês."),
+    ),
+    (
+        "mesma empresa, outro nível",
+        False,
+        ("Desenvolvedor Python Júnior", "Empresa X", DESCRIPTION),
+        (
+            "Desenvolvedor Python Sênior",
+            "Empresa X",
+            DESCRIPTION.replace("Python, Django", "Python avançado, Django, arquitetura de microsserviços, liderança técnica"),
+        ),
+    ),
+    (
+        "mesmo título, outra empresa",
+        False,
+        ("Desenvolvedor Python Pleno", "Empresa X", DESCRIPTION),
+        ("Desenvolvedor Python Pleno", "Empresa Y", "Vaga para backend com Python e FastAPI, MongoDB, Kubernetes. Benefícios: VR, VA, Gympass."),
+    ),
+]
+
+
+def entry(title: str, company: str, description: str) -> dict:
+    return {"signature": fingerprint(title, company, description), "title": title_words(title), "company": company_key(company)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verifica a detecção de quase-duplicados em pares de vagas típicos.")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Similaridade mínima entre empresas diferentes (dedup_threshold)")
+    parser.add_argument("--company-threshold", type=float, default=0.5, help="Similaridade mínima na mesma empresa (dedup_company_threshold)")
+    args = parser.parse_args()
+
+    errors = 0
+    for name, expected, first, second in PAIRS:
+        first, second = entry(*first), entry(*second)
+        score = similarity(first["signature"], second["signature"])
+        required = required_similarity(first, second, args.threshold, args.company_threshold)
+        duplicate = score >= required
+        errors += duplicate != expected
+        status = "ok" if duplicate == expected else "ERRO"
+        print(f"{status:<4} {name:<58} similaridade: {score:.2f} | mínimo: {required:.2f} | duplicado: {'sim' if duplicate else 'não'}")
+    if errors:
+        print(f"{errors} par(es) classificado(s) incorretamente")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
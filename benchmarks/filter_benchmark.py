@@ -0,0 +1,95 @@
+"""Micro-benchmark do motor de filtros.
+
+Uso:
+    python -m benchmarks.filter_benchmark --jobs 5000 [--clean-ratio 0.5]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from modules.bot.indeed import IndeedJob
+from modules.configs import load_config
+from modules.core.filter_engine import FilterEngine
+from modules.utils import normalize_string
+
+WORDS = [
+    "desenvolvedor", "java", "spring", "junior", "pleno", "senior", "python", "empresa", "vaga",
+    "experiência", "inglês", "avançado", "remoto", "híbrido", "react", "typescript", "banco", "dados",
+    "api", "rest", "microsserviços", "docker", "aws", "equipe", "ágil", "scrum", "c#", "php", "lead",
+]
+# Sem os termos excluídos pelos filtros de exemplo: os jobs só são reprovados pela falta de uma linguagem
+# incluída (descrições curtas) ou pela empresa
+CLEAN_WORDS = [
+    "desenvolvedor", "java", "spring", "junior", "python", "vaga", "experiência", "remoto", "híbrido",
+    "react", "typescript", "banco", "dados", "api", "rest", "microsserviços", "docker", "aws", "equipe", "ágil", "scrum",
+]
+COMPANIES = ["empresa de dados", "banco ágil", "equipe remota", "netvagas"]
+
+
+def build_jobs(total: int, clean_ratio: float = 0.5, seed: int = 42):
+    """Jobs sintéticos: uma fração `clean_ratio` com vocabulário limpo (a maioria aprovada), os demais reprovados logo no início."""
+    rnd = random.Random(seed)
+    jobs = []
+    for i in range(total):
+        job = IndeedJob(id=str(i))
+        job.location = "Rio de Janeiro, RJ"
+        if rnd.random() < clean_ratio:
+            job.title = " ".join(rnd.choices(CLEAN_WORDS, k=rnd.randint(2, 6)))
+            job.company = rnd.choice(COMPANIES)
+            job.description = " ".join(rnd.choices(CLEAN_WORDS, k=rnd.randint(3, 400)))
+        else:
+            job.title = " ".join(rnd.choices(WORDS, k=rnd.randint(2, 6)))
+            job.company = " ".join(rnd.choices(WORDS, k=2))
+            job.description = " ".join(rnd.choices(WORDS, k=rnd.randint(200, 600)))
+        jobs.append(job)
+    return jobs
+
+
+def legacy_filter(job, filters) -> bool:
+    """Reprodução da implementação anterior (regex reconstruída por palavra e por job)."""
+    for job_filter in filters:
+        include = [rf"\b{re.escape(word)}\b" for word in job_filter.keywords or []]
+        exclude = [rf"\b{re.escape(word)}\b" for word in job_filter.exclude_keywords or []]
+        text = normalize_string((getattr(job, job_filter.key) or "").lower().strip())
+        include_condition = True
+        if include:
+            matches = (re.search(p, text, re.IGNORECASE) is not None for p in include)
+            include_condition = all(matches) if job_filter.full_match else any(matches)
+        if not include_condition or any(re.search(p, text, re.IGNORECASE) for p in exclude):
+            return False
+    return True
+
+
+def measure(name: str, jobs, fn) -> list[bool]:
+    start = time.perf_counter()
+    results = [fn(job) for job in jobs]
+    duration = time.perf_counter() - start
+    passed = sum(results)
+    print(
+        f"{name:<10} {len(jobs) / duration:>12,.0f} jobs/s | aprovados: {passed}/{len(jobs)} "
+        f"({passed / len(jobs):.1%}) | {duration:.3f}s"
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do motor de filtros de jobs.")
+    parser.add_argument("--jobs", type=int, default=5000, help="Quantidade de jobs sintéticos")
+    parser.add_argument("--clean-ratio", type=float, default=0.5, help="Fração dos jobs gerados com vocabulário limpo")
+    args = parser.parse_args()
+
+    filters = list(load_config().filters)
+    jobs = build_jobs(args.jobs, args.clean_ratio)
+    engine = FilterEngine(filters)
+    print(f"Filtros: {len(filters)} | Jobs: {len(jobs)}")
+    legacy = measure("legado", jobs, lambda job: legacy_filter(job, filters))
+    compiled = measure("compilado", jobs, lambda job: engine.first_failure(job) is None)
+    divergent = [job.id for job, first, second in zip(jobs, legacy, compiled) if first != second]
+    if divergent:
+        print(f"AVISO: resultados divergentes entre as implementações em {len(divergent)} jobs (ex.: {', '.join(divergent[:5])})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,533 @@
+"""Simulador offline dos sites de vagas (Indeed, InfoJobs e LinkedIn).
+
+Serve páginas de pesquisa e de detalhes com a mesma estrutura (IDs, classes e XPaths) usada pelos bots,
+com volume de vagas, latência e captchas configuráveis. Cada site roda em sua própria porta.
+
+Uso:
+    python -m benchmarks.simulator --jobs 10000 --latency 0.2 --captcha-rate 0.05
+"""
+
+import argparse
+import html
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+ROLES = ["Desenvolvedor", "Engenheiro de Software", "Analista de Sistemas", "Programador", "Arquiteto de Software", "Cientista de Dados"]
+STACKS = ["Python", "Java", "Back-end", "Front-end", "Full Stack", "React", "Node.js", "C#", "PHP", "Go", "DevOps", "Dados"]
+LEVELS = ["Júnior", "Pleno", "Sênior", "Especialista", "Estágio", "Trainee"]
+COMPANIES = ["Alfa Tecnologia", "Beta Sistemas", "Gama Consultoria", "Delta Software", "Ômega Digital", "Sigma Labs", "Zeta Bank", "Kappa Saúde"]
+LOCATIONS = ["Rio de Janeiro, RJ", "São Paulo, SP", "Belo Horizonte, MG", "Curitiba, PR", "Porto Alegre, RS", "Recife, PE", "Remoto"]
+TYPES = ["Presencial", "Híbrido", "Home office"]
+CONTRACTS = ["Efetivo", "PJ", "Temporário", "Estágio"]
+BENEFITS = ["Vale-refeição", "Vale-transporte", "Plano de saúde", "Plano odontológico", "Seguro de vida", "Gympass", "Auxílio home office"]
+SKILLS = ["Python", "SQL", "Docker", "AWS", "Git", "Kubernetes", "Spring", "TypeScript", "MongoDB", "Linux", "Scrum"]
+WORDS = [
+    "experiência", "desenvolvimento", "aplicações", "equipe", "projetos", "clientes", "sistemas", "banco", "dados", "integração",
+    "apis", "rest", "microsserviços", "testes", "automatizados", "metodologias", "ágeis", "conhecimento", "inglês", "avançado",
+    "responsável", "manutenção", "arquitetura", "nuvem", "qualidade", "código", "entregas", "produto", "negócio", "soluções",
+]
+
+
+@dataclass
+class SimulatorOptions:
+    jobs: int = 10000  # Vagas por site (todas as pesquisas retornam o mesmo acervo, da mais nova para a mais antiga)
+    latency: float = 0  # Atraso médio (s) de cada resposta (varia entre 50% e 150%)
+    captcha_rate: float = 0  # Probabilidade de uma página de pesquisa exibir um captcha (apenas Indeed)
+    captcha_duration: float = 3  # Tempo (s) até o captcha desaparecer
+    seed: int = 42
+
+
+@dataclass
+class SimulatedJob:
+    index: int
+    title: str
+    company: Optional[str]  # None = empresa confidencial
+    location: str
+    description: str
+    type: str
+    contract: str
+    salary: str
+    benefits: list[str]
+    skills: list[str]
+    easy_application: bool
+    posted_minutes: int
+
+
+class JobCatalog:
+    """Acervo de vagas gerado de forma determinística (a vaga `index` é sempre a mesma para a mesma `seed`)."""
+
+    def __init__(self, total: int, seed: int = 42):
+        self.total = total
+        self.__seed = seed
+
+    @lru_cache(maxsize=4096)
+    def job(self, index: int) -> SimulatedJob:
+        rnd = random.Random(self.__seed * 1_000_003 + index)
+        salary = rnd.randrange(2000, 20000, 500)
+        return SimulatedJob(
+            index=index,
+            title=f"{rnd.choice(ROLES)} {rnd.choice(STACKS)} {rnd.choice(LEVELS)}",
+            company=None if rnd.random() < 0.1 else rnd.choice(COMPANIES),
+            location=rnd.choice(LOCATIONS),
+            description=" ".join(rnd.choices(WORDS, k=rnd.randint(80, 250))).capitalize() + ".",
+            type=rnd.choice(TYPES),
+            contract=rnd.choice(CONTRACTS),
+            salary=f"R$ {salary:,} - R$ {salary + 2000:,}".replace(",", "."),
+            benefits=rnd.sample(BENEFITS, rnd.randint(0, 4)),
+            skills=rnd.sample(SKILLS, rnd.randint(1, 5)),
+            easy_application=rnd.random() < 0.4,
+            posted_minutes=index * 7,
+        )
+
+    def page(self, start: int, size: int) -> list[SimulatedJob]:
+        return [self.job(index) for index in range(max(0, start), min(start + size, self.total))]
+
+
+def _escape(text) -> str:
+    return html.escape(str(text), quote=True)
+
+
+def _document(title: str, body: str, script: str = "") -> str:
+    script = f"<script>{script}</script>" if script else ""
+    return (
+        "<!DOCTYPE html><html lang='pt-BR'><head><meta charset='utf-8'>"
+        f"<title>{_escape(title)}</title><style>{CSS}</style></head><body>{body}{script}</body></html>"
+    )
+
+
+CSS = ".card { min-height: 120px; border-bottom: 1px solid #ddd; cursor: pointer; } .hidden { display: none; }"
+
+# Carrega mais cards quando a página é rolada até o fim (InfoJobs e LinkedIn)
+INFINITE_SCROLL_SCRIPT = """
+(() => {
+    const list = document.querySelector(%s);
+    const url = %s;
+    const step = %d;
+    let page = 1, loading = false, done = false;
+    const load = async () => {
+        if (loading || done || !list) return;
+        if (window.innerHeight + window.scrollY < document.documentElement.scrollHeight - 300) return;
+        loading = true;
+        const content = await (await fetch(url + page * step)).text();
+        if (content.trim()) { list.insertAdjacentHTML("beforeend", content); page++; } else { done = true; }
+        loading = false;
+    };
+    window.addEventListener("scroll", load);
+})();
+"""
+
+
+class SimulatedSite:
+    """Base dos sites simulados: roteamento, latência, captchas e contadores de requisições."""
+
+    NAME: str = None
+    PAGE_SIZE: int = 25
+
+    def __init__(self, catalog: JobCatalog, options: SimulatorOptions):
+        self.catalog = catalog
+        self.options = options
+        self.stats: dict[str, int] = {"pages": 0, "details": 0, "captchas": 0}
+        self.__random = random.Random(options.seed)
+        self.__lock = threading.Lock()
+
+    def route(self, path: str, query: dict[str, str]) -> Optional[str]:
+        """Retorna o HTML da rota, ou `None` se ela não existe."""
+        raise NotImplementedError
+
+    def job_id(self, job: SimulatedJob) -> str:
+        return str(job.index)
+
+    def find_job(self, id: str) -> Optional[SimulatedJob]:
+        try:
+            index = int(id)
+        except (TypeError, ValueError):
+            return None
+        return self.catalog.job(index) if 0 <= index < self.catalog.total else None
+
+    def delay(self):
+        if self.options.latency > 0:
+            time.sleep(self.options.latency * self.__random.uniform(0.5, 1.5))
+
+    def count(self, name: str):
+        with self.__lock:
+            self.stats[name] += 1
+
+    def captcha(self, html: str) -> str:
+        """Sorteia se a página exibe um captcha, removido do DOM após `captcha_duration` segundos."""
+        if self.options.captcha_rate <= 0 or self.__random.random() >= self.options.captcha_rate:
+            return ""
+        self.count("captchas")
+        return html
+
+
+class IndeedSite(SimulatedSite):
+    NAME = "indeed"
+    PAGE_SIZE = 15
+
+    def job_id(self, job: SimulatedJob) -> str:
+        return f"{job.index:016x}"
+
+    def find_job(self, id: str) -> Optional[SimulatedJob]:
+        try:
+            return super().find_job(str(int(id, 16)))
+        except (TypeError, ValueError):
+            return None
+
+    def route(self, path: str, query: dict[str, str]) -> Optional[str]:
+        if path == "/":
+            return self.__home()
+        if path == "/jobs":
+            return self.__search(query)
+        if path == "/viewjob":
+            job = self.find_job(query.get("jk"))
+            if job is None:
+                return None
+            self.count("details")
+            return _document(job.title, f"<div class='jobsearch-JobComponent'>{self.__detail(job, 'h1')}</div>")
+        return None
+
+    def __home(self) -> str:
+        body = (
+            "<div id='onetrust-banner-sdk'><button id='onetrust-reject-all-handler' onclick='this.parentElement.remove()'>"
+            "Rejeitar todos</button></div><form action='/jobs'><input name='q'><input name='l'><button>Achar vagas</button></form>"
+        )
+        return _document("Indeed", body)
+
+    def __search(self, query: dict[str, str]) -> str:
+        self.count("pages")
+        start = int(query.get("start") or 0)
+        jobs = self.catalog.page(start, self.PAGE_SIZE)
+        if not jobs:
+            return _document("Indeed", "<div id='mosaic-jobResults'><p>Nenhuma vaga encontrada.</p></div>")
+        base = {key: query[key] for key in ("q", "l", "sort", "start") if key in query}
+        cards = "".join(
+            f"<li><div class='card'><h2 class='jobTitle'><a id='job_{self.job_id(job)}' href='/jobs?{_escape(urlencode({**base, 'vjk': self.job_id(job)}))}'>"
+            f"<span>{_escape(job.title)}</span></a></h2><span data-testid='company-name'>{_escape(job.company or 'Empresa confidencial')}</span>"
+            f"<div data-testid='text-location'>{_escape(job.location)}</div></div></li>"
+            for job in jobs
+        )
+        selected = self.find_job(query.get("vjk"))
+        if selected is not None:
+            self.count("details")
+        pane = self.__detail(selected, "h2") if selected is not None else ""
+        body = (
+            f"<div id='mosaic-jobResults'><ul>{cards}</ul></div>"
+            f"<div id='jobsearch-ViewjobPaneWrapper'>{pane}</div>"
+            f"<div id='jobsearch-JapanPage'>{self.__pagination(base, start)}</div>"
+        )
+        captcha = self.captcha(
+            "<div id='RInW4'><div><div>Verificação de segurança</div></div></div>"
+            f"<script>setTimeout(() => document.getElementById('RInW4').remove(), {int(self.options.captcha_duration * 1000)});</script>"
+        )
+        return _document("Indeed", body + captcha)
+
+    def __pagination(self, base: dict, start: int) -> str:
+        PAGES = -(-self.catalog.total // self.PAGE_SIZE)
+        current = start // self.PAGE_SIZE
+        links = []
+        for page in range(max(0, current - 2), min(PAGES, current + 3)):
+            url = _escape(f"/jobs?{urlencode({**base, 'start': page * self.PAGE_SIZE})}")
+            attribute = " aria-current='page'" if page == current else ""
+            links.append(f"<li><a href='{url}'{attribute}>{page + 1}</a></li>")
+        return f"<nav><ul>{''.join(links)}</ul></nav>"
+
+    def __detail(self, job: SimulatedJob, heading: str) -> str:
+        button = "<button id='indeedApplyButton'>Candidatura simplificada</button>" if job.easy_application else "<button id='applyButtonLinkContainer'>Candidatar-se no site da empresa</button>"
+        benefits = "".join(f"<li>{_escape(benefit)}</li>" for benefit in job.benefits)
+        return (
+            f"<div><{heading} class='jobsearch-JobInfoHeader-title'><span>{_escape(job.title)}<span> - job post</span></span></{heading}>"
+            f"<div data-testid='jobsearch-CompanyInfoContainer'><div><div data-company-name='true'><a>{_escape(job.company or 'Empresa confidencial')}</a></div></div>"
+            f"<div>{_escape(job.location)}</div><div>{_escape(job.type)}</div></div></div>"
+            f"<div id='jobsearch-ViewJobButtons-container'>{button}</div>"
+            "<div id='jobDetailsSection'>"
+            f"<div role='group' aria-label='Tipo de vaga'><ul><li><div><span>{_escape(job.contract)}</span></div></li></ul></div>"
+            f"<div role='group' aria-label='Salário'><ul><li><div><span>{_escape(job.salary)}</span></div></li></ul></div></div>"
+            + (f"<div id='benefits'><ul>{benefits}</ul></div>" if benefits else "")
+            + f"<div id='jobDescriptionText'><p>{_escape(job.description)}</p></div>"
+        )
+
+
+class InfoJobSite(SimulatedSite):
+    NAME = "infojob"
+    PAGE_SIZE = 20
+    SEARCH_PATTERN = re.compile(r"^/empregos(-em-.+)?\.aspx$")
+    DETAIL_PATTERN = re.compile(r"^/vaga-de-.*__(\d+)\.aspx$")
+
+    def job_id(self, job: SimulatedJob) -> str:
+        return str(10_000_000 + job.index)
+
+    def find_job(self, id: str) -> Optional[SimulatedJob]:
+        try:
+            return super().find_job(str(int(id) - 10_000_000))
+        except (TypeError, ValueError):
+            return None
+
+    def route(self, path: str, query: dict[str, str]) -> Optional[str]:
+        if path == "/":
+            return self.__home()
+        if self.SEARCH_PATTERN.match(path):
+            return self.__search(path, query)
+        if path == "/vacancies":
+            # Próximos cards da rolagem infinita
+            self.count("pages")
+            page = int(query.get("page") or 0)
+            return "".join(map(self.__card, self.catalog.page(page * self.PAGE_SIZE, self.PAGE_SIZE)))
+        if path == "/vacancy":
+            job = self.find_job(query.get("id"))
+            if job is None:
+                return None
+            self.count("details")
+            return self.__detail(job)
+        match = self.DETAIL_PATTERN.match(path)
+        if match:
+            job = self.find_job(match[1])
+            if job is None:
+                return None
+            self.count("details")
+            return _document(job.title, f"<main>{self.__detail(job)}</main>")
+        return None
+
+    def __home(self) -> str:
+        body = (
+            "<div id='didomi-host'><div id='didomi-notice'><button id='didomi-notice-learn-more-button' "
+            "onclick=\"document.getElementById('btn-toggle-disagree').classList.remove('hidden')\">Saiba mais</button>"
+            "<button id='btn-toggle-disagree' class='hidden' onclick=\"document.getElementById('didomi-host').remove()\">"
+            "Recusar todos</button></div></div><main><div>InfoJobs</div></main>"
+        )
+        return _document("InfoJobs", body)
+
+    def __search(self, path: str, query: dict[str, str]) -> str:
+        self.count("pages")
+        cards = "".join(map(self.__card, self.catalog.page(0, self.PAGE_SIZE)))
+        # Os cards ficam no caminho absoluto usado pelo bot: /html/body/main/div[2]/form/div/div[1]/div[2]/div/div/div
+        body = (
+            "<main><div>InfoJobs</div><div><form><div>"
+            f"<div><div id='filterSideBar'>Filtros</div><div><div><div id='vacancyList'>{cards}</div></div></div></div>"
+            "<div id='vacancyDetail'></div>"
+            "</div></form></div></main>"
+        )
+        script = INFINITE_SCROLL_SCRIPT % ("'#vacancyList'", f"'/vacancies?{urlencode(query)}&page='", 1)
+        script += """
+        document.addEventListener("click", async (event) => {
+            const card = event.target.closest("[id^='vacancy'][data-id]");
+            if (!card) return;
+            const detail = document.getElementById("vacancyDetail");
+            detail.innerHTML = "";  // Remove os detalhes da vaga anterior antes de carregar a nova
+            detail.innerHTML = await (await fetch(`/vacancy?id=${card.dataset.id}`)).text();
+        });
+        """
+        return _document("InfoJobs", body, script)
+
+    def __card(self, job: SimulatedJob) -> str:
+        id = self.job_id(job)
+        slug = re.sub(r"[^a-z0-9]+", "-", job.title.lower()).strip("-")
+        company = f"<div><a>{_escape(job.company)}</a></div>" if job.company else "<div>Empresa confidencial</div>"
+        return (
+            f"<div id='vacancy{id}' class='card' data-id='{id}' data-href='/vaga-de-{slug}__{id}.aspx'>"
+            f"<h2>{_escape(job.title)}</h2>{company}<div>{_escape(job.location)}</div></div>"
+        )
+
+    def __detail(self, job: SimulatedJob) -> str:
+        company = f"<div><a>{_escape(job.company)}</a></div>" if job.company else "<div>Empresa confidencial</div>"
+        benefits = "".join(f"<li>{_escape(benefit)}</li>" for benefit in job.benefits)
+        skills = "".join(f"<span>{_escape(skill)}</span>" for skill in job.skills)
+        return (
+            f"<div id='VacancyHeader'><div><div><h2>{_escape(job.title)}</h2><div>{company}</div>"
+            f"<div><div>{_escape(job.location)}</div><div>{_escape(job.salary)}</div><div>{_escape(job.type)}</div></div>"
+            "</div></div></div>"
+            "<div id='vacancylistDetail'><div>Descrição</div><div>"
+            f"<p>{_escape(job.description)}</p><p>Tipo de contrato e Jornada: {_escape(job.contract)}</p>"
+            + (f"<div>Benefícios</div><div><ul>{benefits}</ul></div>" if benefits else "")
+            + f"<div>Habilidades</div><div>{skills}</div></div></div>"
+        )
+
+
+class LinkedinSite(SimulatedSite):
+    NAME = "linkedin"
+    PAGE_SIZE = 25
+
+    def job_id(self, job: SimulatedJob) -> str:
+        return str(4_000_000_000 + job.index)
+
+    def find_job(self, id: str) -> Optional[SimulatedJob]:
+        try:
+            return super().find_job(str(int(id) - 4_000_000_000))
+        except (TypeError, ValueError):
+            return None
+
+    def route(self, path: str, query: dict[str, str]) -> Optional[str]:
+        if path == "/jobs/search":
+            return self.__search(query)
+        if path == "/jobs-guest/jobs/api/seeMoreJobPostings/search":
+            self.count("pages")
+            return "".join(map(self.__card, self.catalog.page(int(query.get("start") or 0), self.PAGE_SIZE)))
+        if path.startswith("/jobs-guest/jobs/api/jobPosting/"):
+            job = self.find_job(path.rsplit("/", 1)[-1])
+            if job is None:
+                return None
+            self.count("details")
+            return self.__detail(job)
+        if path.startswith("/jobs/view/"):
+            job = self.find_job(path.rstrip("/").rsplit("/", 1)[-1])
+            if job is None:
+                return None
+            self.count("details")
+            return _document(job.title, f"<main>{self.__detail(job)}</main>")
+        return None
+
+    def __search(self, query: dict[str, str]) -> str:
+        self.count("pages")
+        form = (
+            "<section id='jobs-search-panel'><form action='/jobs/search'>"
+            f"<input id='job-search-bar-keywords' name='keywords' value='{_escape(query.get('keywords', ''))}'>"
+            f"<input id='job-search-bar-location' name='location' value='{_escape(query.get('location', ''))}'>"
+            "<button type='submit'>Pesquisar</button></form></section>"
+            "<div id='base-contextual-sign-in-modal'><div><section><button onclick=\"document.getElementById('base-contextual-sign-in-modal').remove()\">"
+            "Fechar</button></section></div></div>"
+        )
+        if not query.get("keywords"):
+            # Página inicial: apenas o formulário de pesquisa
+            return _document("LinkedIn", f"<main id='main-content'><section>{form}</section></main>")
+        cards = "".join(map(self.__card, self.catalog.page(0, self.PAGE_SIZE)))
+        body = (
+            f"<main id='main-content'><section>{form}</section>"
+            f"<section><ul class='jobs-search__results-list'>{cards}</ul><button class='hidden'>Ver mais vagas</button></section></main>"
+            "<div class='two-pane-serp-page__detail-view'><div class='details-pane__content'></div></div>"
+        )
+        more = f"/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(query)}&start="
+        script = INFINITE_SCROLL_SCRIPT % ("'.jobs-search__results-list'", f"'{more}'", self.PAGE_SIZE)
+        script += """
+        document.addEventListener("click", async (event) => {
+            const card = event.target.closest("[data-entity-urn]");
+            if (!card) return;
+            const id = card.dataset.entityUrn.split(":").pop();
+            const pane = document.querySelector(".details-pane__content");
+            pane.innerHTML = "";  // Remove os detalhes da vaga anterior antes de carregar a nova
+            pane.innerHTML = await (await fetch(`/jobs-guest/jobs/api/jobPosting/${id}`)).text();
+            const url = new URL(location.href);
+            url.searchParams.set("currentJobId", id);
+            history.pushState({}, "", url);  // A URL só muda depois que o painel foi preenchido
+        });
+        """
+        return _document("LinkedIn", body, script)
+
+    def __card(self, job: SimulatedJob) -> str:
+        return (
+            f"<li><div class='base-card base-search-card job-search-card card' data-entity-urn='urn:li:jobPosting:{self.job_id(job)}'>"
+            f"<div class='base-search-card__info'><h3 class='base-search-card__title'>{_escape(job.title)}</h3>"
+            f"<h4 class='base-search-card__subtitle'>{_escape(job.company or 'Empresa confidencial')}</h4>"
+            f"<span class='job-search-card__location'>{_escape(job.location)}</span></div></div></li>"
+        )
+
+    def __detail(self, job: SimulatedJob) -> str:
+        button = "Candidatura simplificada" if job.easy_application else "Candidatar-se"
+        criteria = [("Nível de experiência", job.title.rsplit(" ", 1)[-1]), ("Tipo de emprego", job.contract), ("Modelo de trabalho", job.type)]
+        items = "".join(
+            f"<li class='description__job-criteria-item'><h3 class='description__job-criteria-subheader'>{_escape(key)}</h3>"
+            f"<span class='description__job-criteria-text'>{_escape(value)}</span></li>"
+            for key, value in criteria
+        )
+        return (
+            f"<section class='top-card-layout'><h2 class='top-card-layout__title topcard__title'>{_escape(job.title)}</h2>"
+            f"<h4 class='topcard__flavor-row'><span class='topcard__flavor'><a>{_escape(job.company or 'Empresa confidencial')}</a></span>"
+            f"<span class='topcard__flavor topcard__flavor--bullet'>{_escape(job.location)}</span></h4>"
+            f"<button class='sign-up-modal__outlet top-card-layout__cta'>{button}</button></section>"
+            "<div class='description__text description__text--rich'><section class='show-more-less-html'>"
+            f"<div class='show-more-less-html__markup'>{_escape(job.description)}</div></section></div>"
+            f"<ul class='description__job-criteria-list'>{items}</ul>"
+        )
+
+
+SITES: dict[str, type[SimulatedSite]] = {site.NAME: site for site in (IndeedSite, InfoJobSite, LinkedinSite)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    site: SimulatedSite = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        try:
+            content = self.site.route(url.path, query)
+        except (TypeError, ValueError):
+            content = None
+        self.site.delay()
+        if content is None:
+            self.send_error(404)
+            return
+        body = content.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Sem log por requisição (milhares durante um benchmark)
+
+
+class Simulator:
+    """Servidores HTTP locais dos sites simulados, um por porta (porta 0 = porta livre qualquer)."""
+
+    def __init__(self, options: SimulatorOptions = None, host: str = "127.0.0.1", port: int = 0):
+        self.options = options or SimulatorOptions()
+        self.catalog = JobCatalog(self.options.jobs, self.options.seed)
+        self.sites: dict[str, SimulatedSite] = {}
+        self.__servers: dict[str, ThreadingHTTPServer] = {}
+        for offset, (name, site_class) in enumerate(SITES.items()):
+            site = self.sites[name] = site_class(self.catalog, self.options)
+            handler = type(f"{site_class.__name__}Handler", (_Handler,), {"site": site})
+            server = ThreadingHTTPServer((host, port + offset if port else 0), handler)
+            server.daemon_threads = True
+            self.__servers[name] = server
+
+    def url(self, site: str) -> str:
+        host, port = self.__servers[site].server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        for name, server in self.__servers.items():
+            threading.Thread(target=server.serve_forever, name=f"simulator-{name}", daemon=True).start()
+        return self
+
+    def close(self):
+        for server in self.__servers.values():
+            server.shutdown()
+            server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador offline dos sites de vagas.")
+    parser.add_argument("--jobs", type=int, default=10000, help="Vagas por site")
+    parser.add_argument("--latency", type=float, default=0, help="Atraso médio (s) de cada resposta")
+    parser.add_argument("--captcha-rate", type=float, default=0, help="Probabilidade de captcha nas páginas de pesquisa")
+    parser.add_argument("--captcha-duration", type=float, default=3, help="Tempo (s) até o captcha desaparecer")
+    parser.add_argument("--port", type=int, default=8100, help="Porta do primeiro site (os demais usam as seguintes)")
+    args = parser.parse_args()
+
+    options = SimulatorOptions(args.jobs, args.latency, args.captcha_rate, args.captcha_duration)
+    with Simulator(options, port=args.port) as simulator:
+        for name in simulator.sites:
+            print(f"{name:<10} {simulator.url(name)}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,62 +1,43 @@
-import asyncio
+import argparse
 import os
+import time
 
-import nest_asyncio
 from dotenv import load_dotenv
 
-from modules.bot.indeed import IndeedBot, IndeedBotOptions
-from modules.bot.infojob import InfoJobBot, InfoJobBotOptions
-from modules.bot.linkedin import LinkedinBot, LinkedinBotOptions
-from modules.configs.indeed_config import IndeedConfig
-from modules.configs.infojob_config import InfoJobConfig
-from modules.configs.linkedin_config import LinkedinConfig
+from modules.core.profiler import MODES as PROFILE_MODES
+from modules.runner import BOTS, DaemonOptions, format_summary, run_bots, run_daemons
 
-nest_asyncio.apply()
+load_dotenv()
 
-load_dotenv("../")
 
-
-async def infojob():
-    bot = "infojobbot"
-    configs = InfoJobConfig()
-    options = InfoJobBotOptions(
-        username=os.getenv("INFOJOB_USER"),
-        password=os.getenv("INFOJOB_PASS"),
-        searches=configs.get_searches(bot),
-        filters=configs.get_filters(),
-    )
-    bot = InfoJobBot(options)
-    await bot.start()
-
-
-async def indeed():
-    bot = "indeedbot"
-    configs = IndeedConfig()
-    options = IndeedBotOptions(
-        username=os.getenv("INDEED_USER"),
-        searches=configs.get_searches(bot),
-        filters=configs.get_filters(),
-    )
-    bot = IndeedBot(options)
-    await bot.start()
-
-
-async def linkedin():
-    bot = "linkedinbot"
-    configs = LinkedinConfig()
-    options = LinkedinBotOptions(
-        username=os.getenv("LINKEDIN_USER"),
-        password=os.getenv("LINKEDIN_PASS"),
-        searches=configs.get_searches(bot),
-        filters=configs.get_filters(),
-    )
-    bot = LinkedinBot(options)
-    await bot.start()
+def parse_args():
+    parser = argparse.ArgumentParser(description="Executa os bots de scraping de vagas em paralelo.")
+    parser.add_argument("bots", nargs="*", metavar="BOT", help=f"Bots a executar: {', '.join(BOTS)} (padrão: todos)")
+    parser.add_argument("-w", "--workers", type=int, help="Quantidade máxima de bots executando ao mesmo tempo")
+    parser.add_argument("-t", "--tabs", type=int, help="Abas extras por bot para extrair os detalhes das vagas em paralelo")
+    parser.add_argument("--html", action="store_true", default=None, help="Extrai os detalhes das vagas a partir de um snapshot do HTML")
+    parser.add_argument("--parse-workers", type=int, help="Processos para interpretar o HTML das vagas (com --html)")
+    parser.add_argument("--http", action="store_true", default=None, help="Baixa as páginas das vagas via HTTP, sem navegador")
+    parser.add_argument("-d", "--daemon", action="store_true", help="Mantém os navegadores abertos e repete as pesquisas periodicamente (até Ctrl+C)")
+    parser.add_argument("--interval", type=float, default=900, help="Intervalo padrão (s) entre as execuções de cada pesquisa no modo daemon")
+    parser.add_argument("--recycle-cycles", type=int, default=50, help="Ciclos até reciclar o navegador no modo daemon (0 = nunca)")
+    parser.add_argument("--profile", choices=PROFILE_MODES, help="Grava o perfil de CPU de cada bot em ./logs/<Bot>/ (cprofile ou sample)")
+    args = parser.parse_args()
+    invalid = [bot for bot in args.bots if bot not in BOTS]
+    if invalid:
+        parser.error(f"Bot(s) inválido(s): {', '.join(invalid)}. Opções: {', '.join(BOTS)}")
+    args.bots = args.bots or [*BOTS]
+    return args
 
 
 if __name__ == "__main__":
-    # Escolha um dos bots para executar
-    # asyncio.run(infojob())
-    # asyncio.run(indeed())
-    # asyncio.run(linkedin())
-    pass
+    args = parse_args()
+    if args.profile:
+        os.environ["BOT_PROFILE"] = args.profile  # Herdada pelos processos dos bots
+    START_TIME = time.time()
+    OVERRIDES = {"detail_tabs": args.tabs, "html_extraction": args.html, "parse_workers": args.parse_workers, "http_details": args.http}
+    if args.daemon:
+        reports = run_daemons(args.bots, DaemonOptions(interval=args.interval, recycle_cycles=args.recycle_cycles), overrides=OVERRIDES)
+    else:
+        reports = run_bots(args.bots, workers=args.workers, overrides=OVERRIDES)
+    print(format_summary(reports, time.time() - START_TIME))
@@ -1,6 +1,8 @@
 import asyncio
+import json
 from time import time
 
+from modules.bot.indeed import indeed_parser
 from modules.bot.indeed.indeed_job import IndeedJob
 from modules.core import JobBot, JobBotOptions, JobFilterKey, JobSearch
 
@@ -21,64 +23,82 @@ class IndeedSearch(JobSearch):
 
 
 class IndeedBot(JobBot):
+    BASE_URL = "https://br.indeed.com"
+    SESSION_COOKIES = ("SHOE", "SOCK", "PPID")
 
     def __init__(self, options: IndeedBotOptions):
         super().__init__(options)
 
-    async def _setup(self):
-        await super()._setup()
-        url = "https://br.indeed.com"
-        self._driver.uc_activate_cdp_mode(url)
-        self._close_cookie_popup()
+    async def _setup_browser(self):
+        url = self._base_url
+        await self._browser.uc_activate_cdp_mode(url)
+        await self._close_cookie_popup()
         if self._username:
-            await self._login()
+            await self._ensure_session()
 
     async def _start(self):
         try:
             CAPTCHA_SELECTOR = "#RInW4 div div"
             WRAPPER_SELECTOR = "//*[@id='jobsearch-ViewjobPaneWrapper']"
             self._captcha_task = asyncio.create_task(self._captcha(CAPTCHA_SELECTOR))
-            await asyncio.sleep(1)  # Pequeno delay para permitir a criação da task
+            await self._sleep(1, "captcha_task")  # Pequeno delay para permitir a criação da task
             
             self._logger.debug(f"Total de pesquisas para realizar: {len(self._searches)}")
             for index, search in enumerate(self._searches, start=1):
-                await asyncio.sleep(5)  # Aguarda a lista carregar...
-                self._search_job(search)
+                await self._begin_search(search)
+                with self._phase("search"):
+                    await self._search_job(search)
                 self._logger.info(f"[{index} de {len(self._searches)}] Pesquisando vagas: {search.job} | Localização: {search.location}.")
-                await asyncio.sleep(3)
+                await self._wait_for_page_load("search")
+                await self._wait_for_selector(WRAPPER_SELECTOR, "job_list")
                 async with self._captcha_condition:
                     await self._captcha_condition.wait_for(lambda: not self._captcha_active)
                 current_page = 1
-                if self._driver.cdp.is_element_present(WRAPPER_SELECTOR):
+                if await self._cdp.is_element_present(WRAPPER_SELECTOR):
                     retry = True
                     while True:
                         async with self._captcha_condition:
                             await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                        job_list_elements = self._get_job_list()
+                        with self._phase("listing"):
+                            job_list_elements = await self._get_job_list()
                         RESULT = len(job_list_elements)
                         self._logger.info(f"Página: {current_page} | Total de resultados encontrados: {RESULT}")
                         try:
-                            for index, job_element in enumerate(job_list_elements, start=1):
-                                async with self._captcha_condition:
-                                    await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                                JOB_ID = job_element.get_attribute("id").split("_")[1]  # TODO: Verificar se problema dos ~1800 segundos foi corrigido
-                                if not await self._job_exists(JOB_ID):
-                                    job = IndeedJob(id=JOB_ID)
-                                    job.url = f"https://br.indeed.com/viewjob?jk={JOB_ID}"
-                                    job_element.click()
+                            JOB_IDS = [await self._get_job_id(job_element) for job_element in job_list_elements]
+                            await self._resolve_existing(JOB_IDS)
+                            if await self._reached_watermark(JOB_IDS):
+                                self._logger.info(f"Página {current_page} contém apenas jobs já conhecidos. Encerrando a pesquisa.")
+                                break
+                            if self._parallel_details:
+                                await self._extract_jobs([self._new_job(JOB_ID) for JOB_ID in JOB_IDS if not await self._job_exists(JOB_ID)])
+                            else:
+                                CARDS = await self._read_cards([JOB_ID for JOB_ID in JOB_IDS if not await self._job_exists(JOB_ID)])
+                                for index, (job_element, JOB_ID) in enumerate(zip(job_list_elements, JOB_IDS), start=1):
                                     async with self._captcha_condition:
                                         await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                                    if not await self._get_job_data(job):
-                                        retry = False
-                                        raise Exception(f"Erro ao extrair dados do job de ID {JOB_ID}")
-                                    if self._filter_job(job):
-                                        self._append_job(job)
-                                        self._logger.info(f"[{index} de {RESULT}] {job.title}: {job.url}")
+                                    if not await self._job_exists(JOB_ID):
+                                        job = self._new_job(JOB_ID)
+                                        if not self._prefilter_job(job, CARDS.get(JOB_ID)):
+                                            self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} foi descartado pela listagem")
+                                            continue
+                                        await job_element.click()
+                                        async with self._captcha_condition:
+                                            await self._captcha_condition.wait_for(lambda: not self._captcha_active)
+                                        with self._phase("details"):
+                                            success = await self._get_job_data(job)
+                                        if not success:
+                                            retry = False
+                                            raise Exception(f"Erro ao extrair dados do job de ID {JOB_ID}")
+                                        if self._filter_job(job):
+                                            await self._append_job(job)
+                                            self._logger.info(f"[{index} de {RESULT}] {job.title}: {job.url}")
+                                        else:
+                                            self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} foi descartado")
+                                        CURRENT_URL = await self._cdp.get_current_url()
+                                        await self._cdp.go_back()
+                                        await self._wait_for_url_change(CURRENT_URL, "go_back")
                                     else:
-                                        self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} foi descartado")
-                                    self._driver.cdp.go_back()
-                                else:
-                                    self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} já foi extraído")
+                                        self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} já foi extraído")
                         except Exception as err:
                             if retry:
                                 retry = False
@@ -88,14 +108,18 @@ class IndeedBot(JobBot):
                             self._logger.error(f"Não foi possivel extrair jobs da página {current_page}: {err}")
                             raise err
                         await self._save_jobs()
-                        next_button = self._next_page()
+                        next_button = await self._next_page()
                         if next_button is None:
                             break
-                        next_button.click()
+                        CURRENT_URL = await self._cdp.get_current_url()
+                        await next_button.click()
+                        await self._wait_for_url_change(CURRENT_URL, "next_page")
+                        await self._wait_for_selector(WRAPPER_SELECTOR, "job_list")
                         retry = True
                         current_page += 1
                 else:
                     self._logger.debug(f"Nenhum resultado encontrado para essa pesquisa")
+                await self._finish_search(search)
         except Exception as err:
             self._logger.error(err)
             await self._save_jobs()
@@ -125,20 +149,27 @@ class IndeedBot(JobBot):
         ALERT_SELECTOR = "//*[@id='label-passcode-input-error']/div/div"
         try:
             async with self._captcha_condition:
-                self._driver.cdp.click(LOGIN_BUTTON_SELECTOR)
+                await self._cdp.click(LOGIN_BUTTON_SELECTOR)
                 await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                self._driver.cdp.type(EMAIL_INPUT_SELECTOR, f"{self._username}\n")
-                await asyncio.sleep(10)
+                await self._cdp.type(EMAIL_INPUT_SELECTOR, f"{self._username}\n")
 
-                if self._driver.cdp.is_element_present(ALERT_SELECTOR):
-                    text = (self._driver.cdp.find_element(ALERT_SELECTOR).text).strip()
+                async def login_step_loaded():
+                    for selector in [ALERT_SELECTOR, BUTTON_SUBMIT_SELECTOR, CODE_INPUT_SELECTOR]:
+                        if await self._cdp.is_element_present(selector):
+                            return True
+                    return False
+
+                await self._wait_for("login_email", login_step_loaded, timeout=10)
+
+                if await self._cdp.is_element_present(ALERT_SELECTOR):
+                    text = (await (await self._cdp.find_element(ALERT_SELECTOR)).text()).strip()
                     if len(text) > 0:
-                        url = self._driver.cdp.get_current_url()
+                        url = await self._cdp.get_current_url()
                         self._logger.warning(f"Aviso detectado na página {url}: {text}")
                         raise Exception(text)
 
-                if self._driver.cdp.is_element_present(BUTTON_SUBMIT_SELECTOR):
-                    self._driver.cdp.click(BUTTON_SUBMIT_SELECTOR)
+                if await self._cdp.is_element_present(BUTTON_SUBMIT_SELECTOR):
+                    await self._cdp.click(BUTTON_SUBMIT_SELECTOR)
 
                 await self._captcha_condition.wait_for(lambda: not self._captcha_active)
                 self._logger.info(f"Código enviado para o e-mail: {self._username} | Timeout: {timeout}s")
@@ -181,60 +212,87 @@ class IndeedBot(JobBot):
     async def _submit_verification_code(self, input_selector: str, code: str):
         """Submete o código de verificação."""
         BUTTON_SELECTOR = "//*[@id='passpage-container']/main/div/div/div[2]/div/button[1]"
-        self._driver.cdp.type(input_selector, code)
-        self._driver.cdp.click(BUTTON_SELECTOR)
-        await asyncio.sleep(2)  # Aguarda possível redirecionamento
+        CURRENT_URL = await self._cdp.get_current_url()
+        await self._cdp.type(input_selector, code)
+        await self._cdp.click(BUTTON_SELECTOR)
+        await self._wait_for_url_change(CURRENT_URL, "login_redirect", timeout=5)  # Aguarda possível redirecionamento
 
     async def _is_login_successful(self):
         """Verifica se o login foi bem sucedido."""
-        return not self._driver.cdp.is_element_present("//*[@class='css-1un0a8q e1wnkr790']")
+        return not await self._cdp.is_element_present("//*[@class='css-1un0a8q e1wnkr790']")
 
-    def _close_cookie_popup(self):
+    async def _close_cookie_popup(self):
         BUTTON_COOKIE_REJECT_ID = "#onetrust-reject-all-handler"
         self._logger.debug(f"Aguardando popup de cookies...")
-        if self._driver.is_element_present(BUTTON_COOKIE_REJECT_ID):
-            self._driver.cdp.click(BUTTON_COOKIE_REJECT_ID)
+        if await self._browser.is_element_present(BUTTON_COOKIE_REJECT_ID):
+            await self._cdp.click(BUTTON_COOKIE_REJECT_ID)
             self._logger.debug(f"Popup de cookies fechado")
             return
         self._logger.debug(f"Popup não encontrado")
 
-    def _search_job(self, search: JobSearch):
-        url = f"https://br.indeed.com/jobs?q={search.job}"
+    async def _search_job(self, search: JobSearch):
+        url = f"{self._base_url}/jobs?q={search.job}"
         if search.location is not None:
             url += f"&l={search.location}"
-        self._driver.cdp.get(f"{url}&sort=date")
+        await self._cdp.get(f"{url}&sort=date")
 
-    def _get_pages(self):
+    async def _get_pages(self):
         SELECTOR_PAGINATION = "//*[@id='jobsearch-JapanPage']//nav//li/a"
-        if self._driver.cdp.is_element_present(SELECTOR_PAGINATION):
-            elements = self._driver.cdp.find_elements(SELECTOR_PAGINATION)
+        if await self._cdp.is_element_present(SELECTOR_PAGINATION):
+            elements = await self._cdp.find_elements(SELECTOR_PAGINATION)
             return elements
         else:
             return []
 
-    def _next_page(self):
-        elements = self._get_pages()
+    async def _next_page(self):
+        elements = await self._get_pages()
         for i, el in enumerate(elements):
-            if el.get_attribute("aria-current") == "page":
+            if await el.get_attribute("aria-current") == "page":
                 if i < (len(elements) - 1):
                     return elements[i + 1]
 
-    def _get_job_list(self):
+    async def _get_job_list(self):
         SELECTOR_JOB_LIST = "//*[@id='mosaic-jobResults']//ul//a"
-        return [
-            *filter(
-                lambda el: el.get_attribute("id") is not None and el.get_attribute("id").startswith("job_"),
-                self._driver.cdp.find_elements(SELECTOR_JOB_LIST, timeout=15),
-            )
-        ]
-
-    async def _get_job_data(self, job: IndeedJob, backoff: int = 1):
+        elements = await self._cdp.find_elements(SELECTOR_JOB_LIST, timeout=15)
+        return [el for el in elements if ((await el.get_attribute("id")) or "").startswith("job_")]
+
+    async def _get_cards_data(self, ids: list[str]) -> dict[str, dict]:
+        # Uma única chamada ao navegador para todos os cards da página. A localização fica de fora: o card a
+        # formata de outro jeito (ex.: "Remoto em São Paulo, SP") e os filtros de localização reprovariam jobs
+        # que passam com a localização dos detalhes ("São Paulo, SP - Remoto")
+        SCRIPT = """
+        ((ids) => Object.fromEntries(ids.map((id) => {
+            const link = document.getElementById(`job_${id}`);
+            const card = link && (link.closest("li") || link.parentElement);
+            const text = (selector) => card?.querySelector(selector)?.innerText?.trim() || null;
+            return [id, {title: link?.innerText?.trim() || null, company: text("[data-testid='company-name']")}];
+        })))(%s)
+        """
+        return await self._cdp.evaluate(SCRIPT % json.dumps(ids)) or {}
+
+    async def _get_job_id(self, job_element):
+        return (await job_element.get_attribute("id")).split("_")[1]
+
+    def _new_job(self, id: str):
+        job = IndeedJob(id=id)
+        job.url = f"{self._base_url}/viewjob?jk={id}"
+        return job
+
+    async def _extract_job_detail(self, job: IndeedJob):
+        return await self._get_job_data(job, standalone=True)
+
+    async def _parse_detail_page(self, job: IndeedJob, html: str):
+        return await self._parse_html(job, indeed_parser.parse_job, html, True)
+
+    async def _get_job_data(self, job: IndeedJob, backoff: int = 1, standalone: bool = False):
         try:
+            # Na página da vaga (viewjob) o conteúdo não fica no painel lateral da listagem
+            WRAPPER = "//*[contains(@class, 'jobsearch-JobComponent')]" if standalone else "//*[@id='jobsearch-ViewjobPaneWrapper']"
             SELECTORS = {
-                "title": "//*[@id='jobsearch-ViewjobPaneWrapper']//h2/span",
+                "title": f"{WRAPPER}//h1/span" if standalone else f"{WRAPPER}//h2/span",
                 "location": [
-                    "//*[@id='jobsearch-ViewjobPaneWrapper']//div[contains(@data-testid, 'company')]/div",
-                    "//*[@id='jobsearch-ViewjobPaneWrapper']/div[2]/div[3]/div/div/div[1]/div[3]/div[1]/div[2]/div/div/div/div",
+                    f"{WRAPPER}//div[contains(@data-testid, 'company')]/div",
+                    f"{WRAPPER}/div[2]/div[3]/div/div/div[1]/div[3]/div[1]/div[2]/div/div/div/div",
                 ],
                 "company": "//*[@data-company-name]",
                 "button": '//*[@id="jobsearch-ViewJobButtons-container"]//button',
@@ -243,29 +301,36 @@ class IndeedBot(JobBot):
                 "description": "//*[@id='jobDescriptionText']",
             }
             TIMEOUT = 15
-            BUTTON_ELEMENT = self._driver.cdp.find_element(SELECTORS["button"], timeout=TIMEOUT)
-            assert job.id in self._driver.cdp.get_current_url()
-            job.easy_application = "indeedApplyButton" == BUTTON_ELEMENT.get_attribute("id")
-            job.title = self._driver.cdp.find_element(SELECTORS["title"], timeout=TIMEOUT).text_fragment
-            job.company = self._driver.cdp.find_element(SELECTORS["company"], timeout=TIMEOUT).text
-            if self._driver.cdp.is_element_present(SELECTORS["location"][0]):
-                elements_location = self._driver.cdp.find_elements(SELECTORS["location"][0], timeout=TIMEOUT)
+            if self._html_extraction:
+                await self._wait_for_selector(SELECTORS["description"], "job_detail", timeout=TIMEOUT)
+                assert job.id in await self._cdp.get_current_url()
+                HTML = await self._cdp.get_element_html(WRAPPER)
+                assert await self._parse_html(job, indeed_parser.parse_job, HTML, standalone)
+                return True
+            BUTTON_ELEMENT = await self._cdp.find_element(SELECTORS["button"], timeout=TIMEOUT)
+            assert job.id in await self._cdp.get_current_url()
+            job.easy_application = "indeedApplyButton" == await BUTTON_ELEMENT.get_attribute("id")
+            job.title = await (await self._cdp.find_element(SELECTORS["title"], timeout=TIMEOUT)).text_fragment()
+            job.company = await (await self._cdp.find_element(SELECTORS["company"], timeout=TIMEOUT)).text()
+            if await self._cdp.is_element_present(SELECTORS["location"][0]):
+                elements_location = await self._cdp.find_elements(SELECTORS["location"][0], timeout=TIMEOUT)
             else:
-                elements_location = self._driver.cdp.find_elements(SELECTORS["location"][1], timeout=TIMEOUT)
-            job.location = " - ".join([el.text for el in elements_location[1:] if len(el.text) > 0])
-            job.description = self._driver.cdp.find_element(SELECTORS["description"], timeout=TIMEOUT).text
-            if self._driver.cdp.is_element_present(SELECTORS["details"]):
+                elements_location = await self._cdp.find_elements(SELECTORS["location"][1], timeout=TIMEOUT)
+            locations = [await el.text() for el in elements_location[1:]]
+            job.location = " - ".join([text for text in locations if len(text) > 0])
+            job.description = await (await self._cdp.find_element(SELECTORS["description"], timeout=TIMEOUT)).text()
+            if await self._cdp.is_element_present(SELECTORS["details"]):
                 details = dict()
-                sections = self._driver.cdp.find_elements(SELECTORS["details"] + '//div[@role="group"]', timeout=TIMEOUT)
+                sections = await self._cdp.find_elements(SELECTORS["details"] + '//div[@role="group"]', timeout=TIMEOUT)
                 for section in sections:
-                    key = section.get_attribute("aria-label")
+                    key = await section.get_attribute("aria-label")
                     SELECTOR_SECTION = f"{SELECTORS["details"]}//div[@aria-label='{key}']"
-                    values = self._driver.cdp.find_elements(SELECTOR_SECTION + "//ul/li//span")
-                    details[key] = [*map(lambda v: v.text, values)]
+                    values = await self._cdp.find_elements(SELECTOR_SECTION + "//ul/li//span")
+                    details[key] = [await v.text() for v in values]
                 job.details = details
-            if self._driver.cdp.is_element_present(SELECTORS["benefits"]):
-                BENEFIT_ELEMENTS = self._driver.cdp.find_elements(SELECTORS["benefits"])
-                job.benefits = [*map(lambda s: s.text, BENEFIT_ELEMENTS)]
+            if await self._cdp.is_element_present(SELECTORS["benefits"]):
+                BENEFIT_ELEMENTS = await self._cdp.find_elements(SELECTORS["benefits"])
+                job.benefits = [await s.text() for s in BENEFIT_ELEMENTS]
             return True
         except Exception as err:
             EXPONENCIAL_BACKOFF = 5
@@ -273,8 +338,8 @@ class IndeedBot(JobBot):
             self._logger.warning(f"Erro durante a coleta de dados do job: {job.id}")
             if backoff < MAX_RETRIES:
                 self._logger.warning(f"Tentando novamente em {EXPONENCIAL_BACKOFF ** backoff} segundos... (tentativas restantes: {MAX_RETRIES - backoff})")
-                await asyncio.sleep(EXPONENCIAL_BACKOFF ** backoff)
+                await self._sleep(EXPONENCIAL_BACKOFF ** backoff, "backoff")
                 await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                return await self._get_job_data(job, backoff + 1)
+                return await self._get_job_data(job, backoff + 1, standalone)
             self._logger.error(f"Não foi possivel coletar os dados do job: {job.id} | Erro: {err}")
             return False
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from modules.core import Job
 
 
-@dataclass
+@dataclass(slots=True)
 class IndeedJob(Job):
     benefits: str = None
     easy_application: bool = None
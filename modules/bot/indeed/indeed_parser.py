@@ -0,0 +1,39 @@
+from typing import Optional
+
+from modules.utils.html_handler import element_text, own_text, parse_html
+
+
+def parse_job(html: str, standalone: bool = False) -> Optional[dict]:
+    """Extrai os dados de um job do Indeed a partir do HTML do painel (ou da página) de detalhes.
+
+    Equivale ao `IndeedBot._get_job_data`, mas sem chamadas ao navegador. Pode ser executado em outro processo.
+
+    Args:
+        html: HTML do painel `#jobsearch-ViewjobPaneWrapper` ou da página `viewjob`.
+        standalone: Indica se o HTML é da página da vaga (título em `h1`) em vez do painel da listagem (`h2`).
+
+    Returns:
+        Os campos do job, ou `None` se o HTML não contém os detalhes da vaga.
+    """
+    soup = parse_html(html)
+    button = soup.select_one("#jobsearch-ViewJobButtons-container button")
+    title = soup.select_one("h1 > span" if standalone else "h2 > span")
+    description = soup.select_one("#jobDescriptionText")
+    if title is None or description is None:
+        return None
+    company = soup.select_one("[data-company-name]")
+    location = soup.select("div[data-testid*='company'] > div")
+    fields = {
+        "easy_application": button is not None and button.get("id") == "indeedApplyButton",
+        "title": own_text(title),
+        "company": element_text(company),
+        "location": " - ".join([text for text in map(element_text, location[1:]) if text]),
+        "description": element_text(description),
+    }
+    sections = soup.select("#jobDetailsSection div[role='group']")
+    if sections:
+        fields["details"] = {section.get("aria-label"): [*map(element_text, section.select("ul > li span"))] for section in sections}
+    benefits = soup.select("#benefits li")
+    if benefits:
+        fields["benefits"] = [*map(element_text, benefits)]
+    return fields
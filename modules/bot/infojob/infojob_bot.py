@@ -1,8 +1,10 @@
 import asyncio
+import json
 from datetime import datetime
 import re
 from time import time
 
+from modules.bot.infojob import infojob_parser
 from modules.bot.infojob.infojob_job import InfoJobJob
 from modules.core import JobBot, JobBotOptions, JobFilterKey, JobSearch
 from modules.utils.string_handler import normalize_string
@@ -24,17 +26,19 @@ class InfoJobSearch(JobSearch):
 
 
 class InfoJobBot(JobBot):
+    BASE_URL = "https://www.infojobs.com.br"
+    SELECTOR_JOB_LIST = "/html/body/main/div[2]/form/div/div[1]/div[2]/div/div/div"
+    SELECTOR_LOGIN_LINK = "//*[@class='css-7dcbld eu4oa1w0']//a"
 
     def __init__(self, options: InfoJobBotOptions):
         super().__init__(options)
 
-    async def _setup(self):
-        await super()._setup()
-        url = "https://www.infojobs.com.br"
-        self._driver.uc_activate_cdp_mode(url)
-        self._close_cookie_popup()
+    async def _setup_browser(self):
+        url = self._base_url
+        await self._browser.uc_activate_cdp_mode(url)
+        await self._close_cookie_popup()
         if self._username and self._password:
-            await self._login()
+            await self._ensure_session()
 
     async def _start(self):
         try:
@@ -44,50 +48,65 @@ class InfoJobBot(JobBot):
             # await asyncio.sleep(1)  # Pequeno delay para permitir a criação da task
             self._logger.debug(f"Total de pesquisas para realizar: {len(self._searches)}")
             for index, search in enumerate(self._searches, start=1):
-                self._driver.cdp.sleep(5)  # Aguarda a lista carregar...
-                self._search_job(search)
+                await self._begin_search(search)
+                with self._phase("search"):
+                    await self._search_job(search)
                 self._logger.info(f"[{index} de {len(self._searches)}] Pesquisando vagas: {search.job} | Localização: {search.location}.")
                 async with self._captcha_condition:
                     await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                self._driver.cdp.sleep(5)  # Aguarda a lista carregar...
-                if self._driver.cdp.is_element_present(WRAPPER_SELECTOR):
+                await self._wait_for_page_load("search")
+                if await self._wait_for_selector(WRAPPER_SELECTOR, "job_list"):
                     OFFSET = 0
                     while True:
-                        self._driver.cdp.sleep(5)
-                        job_list_elements = self._get_job_list()[OFFSET:]
+                        # Aguarda novos cards aparecerem (na primeira página ou após rolar a lista)
+                        await self._wait_for_count(f"{self.SELECTOR_JOB_LIST}[starts-with(@id, 'vacancy')]", OFFSET, "job_list_more")
+                        with self._phase("listing"):
+                            job_list_elements = (await self._get_job_list())[OFFSET:]
                         RESULT = len(job_list_elements)
                         if RESULT == 0:
                             break
                         self._logger.info(f"Total de resultados encontrados: {RESULT}")
-                        for index, job_element in enumerate(job_list_elements, start=1):
-                            JOB_ID = job_element.get_attribute("data-id")
-                            job_element.click()
-                            async with self._captcha_condition:
-                                await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                            if not await self._job_exists(JOB_ID):
-                                job = InfoJobJob(id=JOB_ID)
-                                job.url = f"https://www.infojobs.com.br{job_element.get_attribute('data-href')}"
-                                # posted_at = job_element.query_selector("div.d-flex > div.mr-8 > div:nth-child(1) > div")
-                                # posted_at = posted_at.get_attribute("data-value")
-                                # posted_at = datetime.strptime(posted_at, "%Y/%m/%d %H:%M:%S")
-                                # job.posted_at = posted_at
-                                self._get_job_data(job)
-                                if self._filter_job(job):
-                                    self._append_job(job)
-                                    self._logger.info(f"[{index} de {RESULT}] {job.title}: {job.url}")
+                        JOB_IDS = [await self._get_job_id(job_element) for job_element in job_list_elements]
+                        await self._resolve_existing(JOB_IDS)
+                        if self._parallel_details:
+                            JOBS = zip(job_list_elements, JOB_IDS)
+                            await self._extract_jobs([await self._new_job(JOB_ID, job_element) for job_element, JOB_ID in JOBS if not await self._job_exists(JOB_ID)])
+                        else:
+                            CARDS = await self._read_cards([JOB_ID for JOB_ID in JOB_IDS if not await self._job_exists(JOB_ID)])
+                            for index, (job_element, JOB_ID) in enumerate(zip(job_list_elements, JOB_IDS), start=1):
+                                if not await self._job_exists(JOB_ID):
+                                    job = await self._new_job(JOB_ID, job_element)
+                                    if not self._prefilter_job(job, CARDS.get(JOB_ID)):
+                                        self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} foi descartado pela listagem")
+                                        continue
+                                    # Os detalhes só são abertos para jobs novos que passaram pelo pré-filtro
+                                    await job_element.click()
+                                    async with self._captcha_condition:
+                                        await self._captcha_condition.wait_for(lambda: not self._captcha_active)
+                                    # posted_at = job_element.query_selector("div.d-flex > div.mr-8 > div:nth-child(1) > div")
+                                    # posted_at = posted_at.get_attribute("data-value")
+                                    # posted_at = datetime.strptime(posted_at, "%Y/%m/%d %H:%M:%S")
+                                    # job.posted_at = posted_at
+                                    with self._phase("details"):
+                                        await self._fetch_job_data(job)
+                                    if self._filter_job(job):
+                                        await self._append_job(job)
+                                        self._logger.info(f"[{index} de {RESULT}] {job.title}: {job.url}")
+                                    else:
+                                        self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} foi descartado")
                                 else:
-                                    self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} foi descartado")
-                            else:
-                                self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} já foi extraído")
+                                    self._logger.info(f"[{index} de {RESULT}] Job de ID {JOB_ID} já foi extraído")
                         await self._save_jobs()
-                        self._driver.cdp.scroll_to_bottom()
+                        await self._cdp.scroll_to_bottom()
                         self._logger.debug("Carregando mais vagas...")
                         OFFSET += RESULT
                 else:
                     self._logger.debug(f"Nenhum resultado encontrado para essa pesquisa")
+                await self._finish_search(search)
         except Exception as err:
             self._logger.error(err)
             await self._save_jobs()
+            raise err
         # finally:
         #     if self._captcha_task:
         #         self._captcha_task.cancel()
@@ -107,16 +126,16 @@ class InfoJobBot(JobBot):
             ValueError: Se o código for inválido.
         """
         # Inicia o fluxo de login
-        self._driver.cdp.click("//*[@class='css-7dcbld eu4oa1w0']//a")
+        await self._cdp.click(self.SELECTOR_LOGIN_LINK)
         # Preenche o email
         EMAIL_INPUT_SELECTOR = "//input[@type='email']"
         BUTTON_SELECTOR = "//*[@id='emailform']/button"
-        self._driver.cdp.type(EMAIL_INPUT_SELECTOR, f"{self._username}\n")
-        self._driver.cdp.sleep(10)
-        self._driver.cdp.click(BUTTON_SELECTOR)
+        await self._cdp.type(EMAIL_INPUT_SELECTOR, f"{self._username}\n")
+        await self._wait_for_selector(BUTTON_SELECTOR, "login_email", timeout=10)
+        await self._cdp.click(BUTTON_SELECTOR)
         # Aguarda o campo de código
         CODE_INPUT_SELECTOR = "//*[@id='passcode-input']"
-        if not self._driver.cdp.wait_for_element_visible(CODE_INPUT_SELECTOR, timeout=10):
+        if not await self._cdp.wait_for_element_visible(CODE_INPUT_SELECTOR, timeout=10):
             raise TimeoutError("Campo de código não apareceu após 10 segundos")
         # Processo de validação do código
         async with self._captcha_condition:
@@ -130,6 +149,11 @@ class InfoJobBot(JobBot):
             else:
                 raise ValueError("Falha no login - código inválido ou tempo excedido")
 
+    async def _is_logged_in(self) -> bool:
+        """O InfoJobs não tem um cookie de sessão conhecido: a sessão é válida se o cabeçalho não mostra o link de login."""
+        await self._wait_for_page_load("session_check")
+        return not await self._cdp.is_element_present(self.SELECTOR_LOGIN_LINK)
+
     # TODO: Ainda não foi testado!
     async def _get_user_code_async(self, timeout: int):
         """Obtém o código de verificação do usuário via CLI de forma assíncrona com timeout.
@@ -161,30 +185,31 @@ class InfoJobBot(JobBot):
     async def _submit_verification_code(self, input_selector: str, code: str):
         """Submete o código de verificação."""
         BUTTON_SELECTOR = "//*[@id='passpage-container']/main/div/div/div[2]/div/button[1]"
-        self._driver.cdp.type(input_selector, code)
-        self._driver.cdp.click(BUTTON_SELECTOR)
-        await asyncio.sleep(2)  # Aguarda possível redirecionamento
+        CURRENT_URL = await self._cdp.get_current_url()
+        await self._cdp.type(input_selector, code)
+        await self._cdp.click(BUTTON_SELECTOR)
+        await self._wait_for_url_change(CURRENT_URL, "login_redirect", timeout=5)  # Aguarda possível redirecionamento
 
     # TODO: Ainda não foi testado!
     async def _is_login_successful(self):
         """Verifica se o login foi bem sucedido."""
-        return not self._driver.cdp.is_element_present("//*[@class='css-1un0a8q e1wnkr790']")
+        return not await self._cdp.is_element_present("//*[@class='css-1un0a8q e1wnkr790']")
 
-    def _close_cookie_popup(self):
+    async def _close_cookie_popup(self):
         BUTTON_COOKIE_LEARN_MORE_ID = "//*[@id='didomi-notice-learn-more-button']"
         BUTTON_COOKIE_REJECT_ID = "//*[@id='btn-toggle-disagree']"
         self._logger.debug(f"Aguardando popup de cookies...")
         try:
-            self._driver.cdp.wait_for_element_visible(BUTTON_COOKIE_LEARN_MORE_ID, timeout=15)
+            await self._cdp.wait_for_element_visible(BUTTON_COOKIE_LEARN_MORE_ID, timeout=15)
         except:
             self._logger.debug(f"Popup não encontrado")
             return
-        self._driver.cdp.click(BUTTON_COOKIE_LEARN_MORE_ID)
-        self._driver.cdp.wait_for_element_visible(BUTTON_COOKIE_LEARN_MORE_ID, timeout=15)
-        self._driver.cdp.click(BUTTON_COOKIE_REJECT_ID)
+        await self._cdp.click(BUTTON_COOKIE_LEARN_MORE_ID)
+        await self._cdp.wait_for_element_visible(BUTTON_COOKIE_LEARN_MORE_ID, timeout=15)
+        await self._cdp.click(BUTTON_COOKIE_REJECT_ID)
         self._logger.debug(f"Rejeitando cookies...")
 
-    def _search_job(self, search: JobSearch):
+    async def _search_job(self, search: JobSearch):
         job = re.sub(r"\s+", "+", search.job)
         if search.location is not None:
             location = normalize_string(search.location).lower()
@@ -194,34 +219,65 @@ class InfoJobBot(JobBot):
                 location = f"{estado},-{uf}"
             else:
                 location = re.sub(r"\s+", "-", location.strip())
-            url = f"https://www.infojobs.com.br/empregos-em-{location}.aspx?palabra={job}"
+            url = f"{self._base_url}/empregos-em-{location}.aspx?palabra={job}"
         else:
-            url = f"https://www.infojobs.com.br/empregos.aspx?palabra={job}"
-        self._driver.cdp.get(url)
+            url = f"{self._base_url}/empregos.aspx?palabra={job}"
+        await self._cdp.get(url)
 
-    def _get_pages(self):
+    async def _get_pages(self):
         SELECTOR_PAGINATION = "//*[@id='jobsearch-JapanPage']//nav//li/a"
-        if self._driver.cdp.is_element_present(SELECTOR_PAGINATION):
-            elements = self._driver.cdp.find_elements(SELECTOR_PAGINATION)
+        if await self._cdp.is_element_present(SELECTOR_PAGINATION):
+            elements = await self._cdp.find_elements(SELECTOR_PAGINATION)
             return elements
 
-    def _next_page(self):
-        elements = self._get_pages()
+    async def _next_page(self):
+        elements = await self._get_pages()
         for i, el in enumerate(elements):
-            if el.get_attribute("aria-current") == "page":
+            if await el.get_attribute("aria-current") == "page":
                 if i < (len(elements) - 1):
                     return elements[i + 1]
 
-    def _get_job_list(self):
-        SELECTOR_JOB_LIST = "/html/body/main/div[2]/form/div/div[1]/div[2]/div/div/div"
-        return [
-            *filter(
-                lambda el: el.get_attribute("id") is not None and el.get_attribute("id").startswith("vacancy"),
-                self._driver.cdp.find_elements(SELECTOR_JOB_LIST, timeout=15),
-            )
-        ]
+    async def _get_job_list(self):
+        elements = await self._cdp.find_elements(self.SELECTOR_JOB_LIST, timeout=15)
+        return [el for el in elements if ((await el.get_attribute("id")) or "").startswith("vacancy")]
+
+    async def _get_cards_data(self, ids: list[str]) -> dict[str, dict]:
+        # Uma única chamada ao navegador para todos os cards carregados
+        SCRIPT = """
+        ((ids) => Object.fromEntries(ids.map((id) => {
+            const card = document.querySelector(`[id^='vacancy'][data-id='${id}']`);
+            const text = (selector) => card?.querySelector(selector)?.innerText?.trim() || null;
+            return [id, {title: text("h2"), company: text("h2 + div a, h2 + a")}];
+        })))(%s)
+        """
+        return await self._cdp.evaluate(SCRIPT % json.dumps(ids)) or {}
+
+    async def _get_job_id(self, job_element):
+        return await job_element.get_attribute("data-id")
+
+    async def _new_job(self, id: str, job_element):
+        job = InfoJobJob(id=id)
+        job.url = f"{self._base_url}{await job_element.get_attribute('data-href')}"
+        return job
+
+    async def _extract_job_detail(self, job: InfoJobJob):
+        # A página da vaga usa os mesmos blocos (#VacancyHeader, #vacancylistDetail) do painel da listagem
+        await self._fetch_job_data(job)
+        return True
+
+    async def _parse_detail_page(self, job: InfoJobJob, html: str):
+        return await self._parse_html(job, infojob_parser.parse_job, html)
+
+    async def _fetch_job_data(self, job: InfoJobJob):
+        if not self._html_extraction:
+            return await self._get_job_data(job)
+        await self._wait_for_selector("//*[@id='VacancyHeader']//h2", "job_detail")
+        HTML = await self._cdp.get_page_source()
+        if not await self._parse_html(job, infojob_parser.parse_job, HTML):
+            raise Exception(f"Detalhes do job de ID {job.id} não encontrados")
+        return job
 
-    def _get_job_data(self, job: InfoJobJob):
+    async def _get_job_data(self, job: InfoJobJob):
         SELECTORS = {
             "title": "//*[@id='VacancyHeader']/div[1]/div/h2",
             "company": "//*[@id='VacancyHeader']/div[1]/div/div[1]/div[1]/a",
@@ -235,45 +291,44 @@ class InfoJobBot(JobBot):
         }
         TIMEOUT = 15
 
-        job.title = self._driver.cdp.find_element(SELECTORS["title"], timeout=TIMEOUT).text_fragment
-        if self._driver.cdp.is_element_present(SELECTORS["company"]):
-            job.company = self._driver.cdp.find_element(SELECTORS["company"], timeout=TIMEOUT).text
+        job.title = await (await self._cdp.find_element(SELECTORS["title"], timeout=TIMEOUT)).text_fragment()
+        if await self._cdp.is_element_present(SELECTORS["company"]):
+            job.company = await (await self._cdp.find_element(SELECTORS["company"], timeout=TIMEOUT)).text()
         else:
-            text = self._driver.cdp.find_element(SELECTORS["company_confidential"], timeout=TIMEOUT).text
-            text = re.sub(r"\s+", " ", text).strip()
-            assert text.upper() == "EMPRESA CONFIDENCIAL"
-            job.company = self._driver.cdp.find_element(SELECTORS["company_confidential"], timeout=TIMEOUT).text
+            text = await (await self._cdp.find_element(SELECTORS["company_confidential"], timeout=TIMEOUT)).text()
+            assert re.sub(r"\s+", " ", text).strip().upper() == "EMPRESA CONFIDENCIAL"
+            job.company = text
 
-        job.location = self._driver.cdp.find_element(SELECTORS["location"], timeout=TIMEOUT).text_fragment
-        job.description = self._driver.cdp.find_element(SELECTORS["description"], timeout=TIMEOUT).text
+        job.location = await (await self._cdp.find_element(SELECTORS["location"], timeout=TIMEOUT)).text_fragment()
+        job.description = await (await self._cdp.find_element(SELECTORS["description"], timeout=TIMEOUT)).text()
 
         # Tipos de jobs: Home office, hibrido, presencial
-        type = self._driver.cdp.find_element(SELECTORS["job_type"], timeout=TIMEOUT).text_fragment
+        type = await (await self._cdp.find_element(SELECTORS["job_type"], timeout=TIMEOUT)).text_fragment()
         assert normalize_string(type).lower() in ["home office", "hibrido", "presencial"]
         job.type = type
 
-        job.salary = self._driver.cdp.find_element(SELECTORS["salary"], timeout=TIMEOUT).text
+        job.salary = await (await self._cdp.find_element(SELECTORS["salary"], timeout=TIMEOUT)).text()
         job.salary = re.sub(r"\s+", " ", job.salary).strip()
 
         details = dict()
-        elements = self._driver.cdp.find_elements(SELECTORS["details"], timeout=TIMEOUT)
+        elements = await self._cdp.find_elements(SELECTORS["details"], timeout=TIMEOUT)
         if len(elements) > 1:
             for element in elements[1:]:
-                key, value = [*map(lambda e: e.strip(), element.text.split(":", 1))]
+                key, value = [*map(lambda e: e.strip(), (await element.text()).split(":", 1))]
                 details[key] = value
-        elements = self._driver.cdp.find_elements(SELECTORS["details2"], timeout=TIMEOUT)
+        elements = await self._cdp.find_elements(SELECTORS["details2"], timeout=TIMEOUT)
         if len(elements) > 0 and len(elements) % 2 == 0:
             for index in range(0, len(elements), 2):
                 element = elements[index]
                 SELECTOR_DETAILS_VALUE = f"//*[@id='vacancylistDetail']/div[2]/div[{index + 2}]"
-                key = element.text_fragment
+                key = await element.text_fragment()
                 if key == "Habilidades":
-                    values = self._driver.cdp.find_elements(f"{SELECTOR_DETAILS_VALUE}//span", timeout=TIMEOUT)
-                    values = [*map(lambda e: e.text.strip(), values)]
+                    values = await self._cdp.find_elements(f"{SELECTOR_DETAILS_VALUE}//span", timeout=TIMEOUT)
+                    values = [(await e.text()).strip() for e in values]
                     details[key] = values
                     continue
-                values = self._driver.cdp.find_elements(f"{SELECTOR_DETAILS_VALUE}//ul/li", timeout=TIMEOUT)
-                values = [*map(lambda e: e.text.strip(), values)]
+                values = await self._cdp.find_elements(f"{SELECTOR_DETAILS_VALUE}//ul/li", timeout=TIMEOUT)
+                values = [(await e.text()).strip() for e in values]
                 if all(":" in v for v in values):
                     for value in values:
                         k, v = [*map(lambda e: e.strip(), value.split(":", 1))]
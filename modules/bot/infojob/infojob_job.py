@@ -4,7 +4,7 @@ from typing import Any
 from modules.core import Job
 
 
-@dataclass
+@dataclass(slots=True)
 class InfoJobJob(Job):
     type: str = None
     salary: str = None
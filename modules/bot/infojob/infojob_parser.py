@@ -0,0 +1,55 @@
+from typing import Optional
+
+from modules.utils import normalize_string
+from modules.utils.html_handler import collapse_spaces, element_text, own_text, parse_html
+
+HEADER = "#VacancyHeader > div:nth-of-type(1)"
+DETAIL = "#vacancylistDetail > div:nth-of-type(2)"
+
+
+def parse_job(html: str) -> Optional[dict]:
+    """Extrai os dados de um job do InfoJobs a partir do HTML da página.
+
+    Equivale ao `InfoJobBot._get_job_data`, mas sem chamadas ao navegador. Pode ser executado em outro processo.
+
+    Returns:
+        Os campos do job, ou `None` se o HTML não contém os detalhes da vaga.
+    """
+    soup = parse_html(html)
+    title = soup.select_one(f"{HEADER} > div > h2")
+    if title is None:
+        return None
+    company = soup.select_one(f"{HEADER} > div > div:nth-of-type(1) > div:nth-of-type(1) > a")
+    if company is None:
+        company = soup.select_one(f"{HEADER} > div > div:nth-of-type(1) > div")
+        assert collapse_spaces(element_text(company)).upper() == "EMPRESA CONFIDENCIAL"
+    type = own_text(soup.select_one(f"{HEADER} > div > div:nth-of-type(2) > div:nth-of-type(3)"))
+    assert normalize_string(type).lower() in ["home office", "hibrido", "presencial"]
+    fields = {
+        "title": own_text(title),
+        "company": element_text(company),
+        "location": own_text(soup.select_one(f"{HEADER} > div:nth-of-type(1) > div:nth-of-type(2) > div:nth-of-type(1)")),
+        "description": element_text(soup.select_one(f"{DETAIL} > p:nth-of-type(1)")),
+        "type": type,
+        "salary": collapse_spaces(element_text(soup.select_one(f"{HEADER} > div:nth-of-type(1) > div:nth-of-type(2) > div:nth-of-type(2)"))),
+    }
+    details = dict()
+    for element in soup.select(f"{DETAIL} > p")[1:]:
+        key, value = [*map(lambda e: e.strip(), element_text(element).split(":", 1))]
+        details[key] = value
+    elements = soup.select(f"{DETAIL} > div")
+    if len(elements) > 0 and len(elements) % 2 == 0:
+        for index in range(0, len(elements), 2):
+            key = own_text(elements[index])
+            if key == "Habilidades":
+                details[key] = [element_text(e).strip() for e in elements[index + 1].select("span")]
+                continue
+            values = [element_text(e).strip() for e in elements[index + 1].select("ul > li")]
+            if all(":" in v for v in values):
+                for value in values:
+                    k, v = [*map(lambda e: e.strip(), value.split(":", 1))]
+                    details[key] = {k: v}
+                continue
+            details[key] = values
+    fields["details"] = details
+    return fields
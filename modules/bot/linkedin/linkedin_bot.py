@@ -1,7 +1,9 @@
 import asyncio
+import json
 import re
 from dataclasses import dataclass
 
+from modules.bot.linkedin import linkedin_parser
 from modules.bot.linkedin.linkedin_job import LinkedinJob
 from modules.core import JobBot, JobBotOptions
 from modules.core.job_bot import JobFilterKey, JobSearch
@@ -25,16 +27,19 @@ class LinkedinSearch(JobSearch):
 
 
 class LinkedinBot(JobBot):
+    BASE_URL = "https://www.linkedin.com"
+    SESSION_COOKIES = ("li_at",)
+    SELECTOR_LOGGED_JOB_LIST = "//*[@id='main']/div/div[2]/div[1]/div/ul/li/div/div"
 
     def __init__(self, options: LinkedinBotOptions):
         super().__init__(options)
         self._logged = False
 
-    async def _setup(self):
-        url = "https://www.linkedin.com/jobs/search"
-        self._driver.uc_activate_cdp_mode(url)
+    async def _setup_browser(self):
+        url = f"{self._base_url}/jobs/search"
+        await self._browser.uc_activate_cdp_mode(url)
         if self._username and self._password:
-            self._logged = await self._login()
+            await self._ensure_session()
         else:
             await self._close_popup()
 
@@ -46,40 +51,60 @@ class LinkedinBot(JobBot):
             if self._logged:
                 WRAPPER_SELECTOR = "//*[contains(@class, 'jobs-details__main-content')]"
             for index, search in enumerate(self._searches, start=1):
-                self._driver.cdp.sleep(5)
-                self._search_job(search)
+                await self._begin_search(search)
+                with self._phase("search"):
+                    await self._search_job(search)
                 self._logger.info(f"[{index} de {len(self._searches)}] Pesquisando vagas: {search.job} | Localização: {search.location}")
                 async with self._captcha_condition:
                     await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                self._driver.cdp.sleep(5)
-                if self._driver.cdp.is_element_present(WRAPPER_SELECTOR):
+                await self._wait_for_page_load("search")
+                if await self._wait_for_selector(WRAPPER_SELECTOR, "search_results"):
                     contador = 0
                     max_page = 5
                     current_page = 1
                     while True:
-                        self._driver.cdp.sleep(10)
-                        job_list_elements = self._get_job_list()
+                        with self._phase("listing"):
+                            job_list_elements = await self._get_job_list()
                         RESULT = len(job_list_elements)
                         if RESULT > 0:
                             self._logger.info(f"Página: {current_page} | Total de resultados encontrados: {RESULT}")
-                            for i, job_element in enumerate(job_list_elements, start=1):
-                                await asyncio.sleep(1.5)
+                            JOB_IDS = [await self._get_job_id(job_element) for job_element in job_list_elements]
+                            await self._resolve_existing([*filter(None, JOB_IDS)])
+                            if None not in JOB_IDS and await self._reached_watermark(JOB_IDS):
+                                self._logger.info(f"Página {current_page} contém apenas jobs já conhecidos. Encerrando a pesquisa.")
+                                break
+                            if self._parallel_details:
+                                await self._extract_jobs([self._new_job(JOB_ID) for JOB_ID in JOB_IDS if JOB_ID is not None and not await self._job_exists(JOB_ID)])
+                            CARDS = {}
+                            if not self._parallel_details:
+                                CARDS = await self._read_cards([JOB_ID for JOB_ID in JOB_IDS if JOB_ID is not None and not await self._job_exists(JOB_ID)])
+                            for i, (job_element, JOB_ID) in enumerate(zip(job_list_elements, JOB_IDS), start=1):
+                                if JOB_ID is not None and self._parallel_details:
+                                    continue  # Já processado pelo pool de abas
+                                if JOB_ID is not None and await self._job_exists(JOB_ID):
+                                    self._logger.info(f"[{i} de {RESULT}] Job de ID {JOB_ID} já foi extraído")
+                                    continue
+                                if JOB_ID is not None and not self._prefilter_job(self._new_job(JOB_ID), CARDS.get(JOB_ID)):
+                                    self._logger.info(f"[{i} de {RESULT}] Job de ID {JOB_ID} foi descartado pela listagem")
+                                    continue
                                 async with self._captcha_condition:
                                     await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                                job_element.click()
-                                await asyncio.sleep(1)
+                                PREVIOUS_URL = await self._cdp.get_current_url()
+                                await job_element.click()
+                                await self._wait_for_url_change(PREVIOUS_URL, "card", timeout=3)
                                 async with self._captcha_condition:
                                     await self._captcha_condition.wait_for(lambda: not self._captcha_active)
-                                CURRENT_URL = self._driver.cdp.get_current_url()
+                                CURRENT_URL = await self._cdp.get_current_url()
                                 URL_PATTERN = r"currentJobId=(\d+)"
                                 JOB_ID = re.search(URL_PATTERN, CURRENT_URL)[1]
                                 if not await self._job_exists(JOB_ID):
-                                    job = LinkedinJob(id=JOB_ID)
-                                    job.url = f"https://www.linkedin.com/jobs/view/{JOB_ID}"
-                                    if self._get_job_data(job) is None:
+                                    job = self._new_job(JOB_ID)
+                                    with self._phase("details"):
+                                        job = await self._fetch_job_data(job)
+                                    if job is None:
                                         self._logger.info(f"[{i} de {RESULT}] Job de ID {JOB_ID} expirou")
                                     elif self._filter_job(job):
-                                        self._append_job(job)
+                                        await self._append_job(job)
                                         self._logger.info(f"[{i} de {RESULT}] {job.title}: {job.url}")
                                     else:
                                         self._logger.info(f"[{i} de {RESULT}] Job de ID {JOB_ID} foi descartado")
@@ -91,16 +116,22 @@ class LinkedinBot(JobBot):
                             break
                         if self._logged:
                             contador += 1
-                            btn_next = self._next_page()
+                            btn_next = await self._next_page()
                             if btn_next is None:
                                 break
                             if contador >= max_page:
                                 self._logger.debug("LIMITE DE PÁGINAS ATINGIDO.")
                                 break
-                            btn_next.click()
+                            PREVIOUS_URL = await self._cdp.get_current_url()
+                            await btn_next.click()
+                            # A lista da página atual continua no DOM até a próxima ser carregada
+                            if not await self._wait_for_next_page(PREVIOUS_URL, JOB_IDS[0] if JOB_IDS else None):
+                                self._logger.warning(f"A página {current_page + 1} não foi carregada. Encerrando a pesquisa.")
+                                break
                             current_page += 1
                         else:
                             break
+                await self._finish_search(search)
         except Exception as err:
             self._logger.error(err)
             await self._save_jobs()
@@ -113,33 +144,56 @@ class LinkedinBot(JobBot):
             #     except asyncio.CancelledError:
             #         pass
 
-    def _next_page(self):
+    async def _next_page(self):
         NEXT_BUTTON_SELECTOR = "//*[@id='main-content']/section[2]/button"
         if self._logged:
             NEXT_BUTTON_SELECTOR = "//*[@id='jobs-search-results-footer']/div[2]/button"
-        if self._driver.cdp.is_element_present(NEXT_BUTTON_SELECTOR):
-            return self._driver.cdp.find_element(NEXT_BUTTON_SELECTOR)
+        if await self._cdp.is_element_present(NEXT_BUTTON_SELECTOR):
+            return await self._cdp.find_element(NEXT_BUTTON_SELECTOR)
+
+    async def _wait_for_next_page(self, previous_url: str, previous_first_id: str = None) -> bool:
+        """Aguarda a próxima página substituir os cards da atual: o primeiro card passa a ser outro (ou, se a página
+        atual não expõe o ID dos cards, a URL muda)."""
+        if previous_first_id is None:
+            return await self._wait_for_url_change(previous_url, "next_page")
+
+        async def condition():
+            return await self._first_card_id() not in (None, previous_first_id)
+
+        return await self._wait_for("next_page", condition)
+
+    async def _first_card_id(self):
+        """ID do primeiro card da lista de resultados (logado), lido com uma única chamada ao navegador."""
+        SCRIPT = """
+        (() => {
+            const card = document.evaluate(%s, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            const urn = card?.getAttribute("data-entity-urn");
+            return urn ? urn.split(":").pop() : card?.getAttribute("data-job-id") || null;
+        })()
+        """
+        return await self._cdp.evaluate(SCRIPT % json.dumps(self.SELECTOR_LOGGED_JOB_LIST))
 
     async def _login(self):
         try:
             MODAL_SELECTOR = "//*[@id='base-contextual-sign-in-modal']"
             LOGIN_BUTTON_POPUP_SELECTOR = f"{MODAL_SELECTOR}//div[@class='sign-in-modal']/button"
             LOGIN_BUTTON_2 = f"/html/body/div[2]/a[1]"
-            if self._driver.cdp.is_element_present(LOGIN_BUTTON_POPUP_SELECTOR):
+            if await self._cdp.is_element_present(LOGIN_BUTTON_POPUP_SELECTOR):
                 INPUT_USERNAME_SELECTOR = "//*[@id='base-sign-in-modal_session_key']"
                 INPUT_PASSWORD_SELECTOR = "//*[@id='base-sign-in-modal_session_password']"
                 BUTTON_SELECTOR = "//*[@id='base-sign-in-modal']/div/section/div/div/form/div[2]/button"
-                self._driver.cdp.click(LOGIN_BUTTON_POPUP_SELECTOR)
+                await self._cdp.click(LOGIN_BUTTON_POPUP_SELECTOR)
             else:
                 INPUT_USERNAME_SELECTOR = "//*[@id='username']"
                 INPUT_PASSWORD_SELECTOR = "//*[@id='password']"
                 BUTTON_SELECTOR = "//*[@id='organic-div']/form/div[4]/button"
-                self._driver.cdp.click(LOGIN_BUTTON_2)
+                await self._cdp.click(LOGIN_BUTTON_2)
             self._logger.info("Inicializando processo de login no linkedin...")
-            self._driver.cdp.type(INPUT_USERNAME_SELECTOR, self._username)
-            self._driver.cdp.type(INPUT_PASSWORD_SELECTOR, self._password)
-            self._driver.cdp.click(BUTTON_SELECTOR)
+            await self._cdp.type(INPUT_USERNAME_SELECTOR, self._username)
+            await self._cdp.type(INPUT_PASSWORD_SELECTOR, self._password)
+            await self._cdp.click(BUTTON_SELECTOR)
             self._logger.info("Login realizado com sucesso!")
+            self._logged = True
             return True  # TODO: Usar um elemento para determina se o login foi bem sucedido
         except Exception as err:
             self._logger.error(f"Erro durante o login: {err}")
@@ -148,13 +202,13 @@ class LinkedinBot(JobBot):
     async def _close_popup(self):
         CLOSE_BUTTON_POPUP_SELECTOR = "//*[@id='base-contextual-sign-in-modal']/div/section/button"
         self._logger.debug(f"Aguardando popup inicial...")
-        if self._driver.is_element_present(CLOSE_BUTTON_POPUP_SELECTOR):
-            self._driver.cdp.click(CLOSE_BUTTON_POPUP_SELECTOR)
+        if await self._browser.is_element_present(CLOSE_BUTTON_POPUP_SELECTOR):
+            await self._cdp.click(CLOSE_BUTTON_POPUP_SELECTOR)
             self._logger.debug(f"Popup fechado com sucesso!")
             return
         self._logger.debug(f"Popup não encontrado")
 
-    def _search_job(self, search: JobSearch):
+    async def _search_job(self, search: JobSearch):
         INPUT_JOB_ID = "#job-search-bar-keywords"
         INPUT_LOCATION_ID = "#job-search-bar-location"
         BUTTON_SEARCH_XPATH = "//*[@id='jobs-search-panel']/form/button"
@@ -162,51 +216,95 @@ class LinkedinBot(JobBot):
             INPUT_JOB_ID = "//input[contains(@id, 'jobs-search-box-keyword')]"
             INPUT_LOCATION_ID = "//input[contains(@id, 'jobs-search-box-location')]"
             BUTTON_SEARCH_XPATH = "//*[@id='global-nav-search']/div/div[2]/button[1]"
-        self._driver.cdp.type(INPUT_JOB_ID, search.job)
-        self._driver.cdp.type(INPUT_LOCATION_ID, search.location)
-        self._driver.cdp.click(BUTTON_SEARCH_XPATH)  # FIXME: Esse botão não tem efeito nenhum...
+        await self._cdp.type(INPUT_JOB_ID, search.job)
+        await self._cdp.type(INPUT_LOCATION_ID, search.location)
+        await self._cdp.click(BUTTON_SEARCH_XPATH)  # FIXME: Esse botão não tem efeito nenhum...
 
-    def _get_job_list(self):
+    async def _get_job_list(self):
         SELECTORS = {
             "container": "//*[@id='main-content']/section[2]",
             "job_list": "//*[@class='jobs-search__results-list']//li/div",
         }
         if self._logged:
             SELECTORS["container"] = "//*[@id='main']/div/div[2]/div[1]/div"
-            SELECTORS["job_list"] = SELECTORS["container"] + "/ul/li/div/div"
+            SELECTORS["job_list"] = self.SELECTOR_LOGGED_JOB_LIST
             SELECTORS["footer"] = "//*[@id='jobs-search-results-footer']"
             sort_by_date = "sortBy=DD"
-            url = self._driver.cdp.get_current_url()
+            url = await self._cdp.get_current_url()
             if sort_by_date not in url:
-                url = "&".join([self._driver.cdp.get_current_url(), sort_by_date])
-                self._driver.cdp.get(url)
-                self._driver.cdp.sleep(3)
-            footer = self._driver.cdp.find_element(SELECTORS["footer"])
-            footer.scroll_into_view()
-            self._driver.cdp.sleep(3)
-        last_count = 0
-        stable_count = 0
+                url = "&".join([url, sort_by_date])
+                await self._cdp.get(url)
+                await self._wait_for_page_load("sort_by_date")
+            footer = await self._cdp.find_element(SELECTORS["footer"])
+            await footer.scroll_into_view()
+        await self._wait_for_selector(SELECTORS["job_list"], "job_list")
         while True:
-            elements = self._driver.cdp.find_elements(SELECTORS["job_list"], timeout=15)
+            elements = await self._cdp.find_elements(SELECTORS["job_list"], timeout=15)
             current_count = len(elements)
-            if current_count == last_count:
-                stable_count += 1
-                if stable_count >= 3:
-                    break
-            else:
-                stable_count = 0
-                self._logger.debug(f"Carregando jobs... (jobs: {current_count})")
+            self._logger.debug(f"Carregando jobs... (jobs: {current_count})")
             if elements:
-                for el in elements:
-                    el.scroll_into_view()
-            self._driver.cdp.sleep(3)
-            last_count = current_count
+                await elements[-1].scroll_into_view()
+            # Encerra quando a rolagem não carrega mais nenhum card
+            if not await self._wait_for_count(SELECTORS["job_list"], current_count, "job_list_scroll", timeout=5):
+                break
         if elements:
-            elements[0].scroll_into_view()
+            await elements[0].scroll_into_view()
         return elements
 
-    def _get_job_data(self, job: LinkedinJob, timeout=15):
-        WRAPPER = "//*[contains(@class, 'details-pane__content')]"
+    async def _get_cards_data(self, ids: list[str]) -> dict[str, dict]:
+        # Uma única chamada ao navegador para todos os cards carregados
+        SCRIPT = """
+        ((ids, logged) => Object.fromEntries(ids.map((id) => {
+            const card = document.querySelector(`[data-entity-urn$=':${id}'], [data-job-id='${id}']`);
+            const text = (selector) => card?.querySelector(selector)?.innerText?.trim() || null;
+            if (logged) {
+                return [id, {title: text("[class*='job-card-list__title']"), company: text("[class*='entity-lockup__subtitle']"), location: text("[class*='entity-lockup__caption']")}];
+            }
+            return [id, {title: text("[class*='search-card__title']"), company: text("[class*='search-card__subtitle']"), location: text("[class*='search-card__location']")}];
+        })))(%s, %s)
+        """
+        return await self._cdp.evaluate(SCRIPT % (json.dumps(ids), json.dumps(self._logged))) or {}
+
+    async def _get_job_id(self, job_element):
+        """Obtém o ID do job a partir do card, sem precisar clicar nele.
+
+        Returns:
+            O ID do job, ou `None` se o card não expõe o ID (nesse caso ele é obtido pela URL após o clique).
+        """
+        urn = await job_element.get_attribute("data-entity-urn")  # Ex.: urn:li:jobPosting:4123456789
+        if urn:
+            return urn.rsplit(":", 1)[-1]
+        return await job_element.get_attribute("data-job-id")
+
+    def _new_job(self, id: str):
+        job = LinkedinJob(id=id)
+        job.url = f"{self._base_url}/jobs/view/{id}"
+        return job
+
+    async def _extract_job_detail(self, job: LinkedinJob):
+        if await self._fetch_job_data(job, standalone=True) is None:
+            self._logger.debug(f"Job de ID {job.id} expirou")
+            return False
+        return True
+
+    async def _parse_detail_page(self, job: LinkedinJob, html: str):
+        # Sem navegador a página é sempre a versão pública (não conectada)
+        return await self._parse_html(job, linkedin_parser.parse_job, html, False)
+
+    async def _fetch_job_data(self, job: LinkedinJob, standalone: bool = False):
+        if not self._html_extraction:
+            return await self._get_job_data(job, standalone=standalone)
+        if self._logged:
+            WRAPPER = "//*[contains(@class, 'jobs-details__main-content')]"
+        else:
+            WRAPPER = "//main" if standalone else "//*[contains(@class, 'details-pane__content')]"
+        await self._wait_for_selector(f"{WRAPPER}//*[contains(@class, 'description')]", "job_detail")
+        HTML = await self._cdp.get_element_html(WRAPPER)
+        return job if await self._parse_html(job, linkedin_parser.parse_job, HTML, self._logged) else None
+
+    async def _get_job_data(self, job: LinkedinJob, timeout=15, standalone: bool = False):
+        # A página da vaga (/jobs/view) usa os mesmos blocos "topcard" do painel, mas fora do painel de detalhes
+        WRAPPER = "//main" if standalone else "//*[contains(@class, 'details-pane__content')]"
         SELECTORS = {
             "title": f"{WRAPPER}//*[contains(@class, 'topcard__title')]",
             "company": f"{WRAPPER}//*[@class='topcard__flavor-row'][1]/span[1]",
@@ -225,32 +323,32 @@ class LinkedinBot(JobBot):
             SELECTORS["description"] = f"{WRAPPER}//*[@id='job-details']/div"
             SELECTORS["details"] = f"{WRAPPER}//ul/li//span[contains(@class, 'ui-label')]/span"
             SELECTORS["alert"] = f"{WRAPPER}//span[contains(@class, '__message')]"
-        if self._driver.cdp.is_element_present(SELECTORS["button"]):
-            BUTTON_ELEMENT = self._driver.cdp.find_element(SELECTORS["button"], timeout)
-            job.easy_application = "simplificada" in BUTTON_ELEMENT.text
-        elif self._driver.cdp.is_element_present(SELECTORS["button_easy_application"]):
-            BUTTON_ELEMENT = self._driver.cdp.find_element(SELECTORS["button_easy_application"], timeout)
+        if await self._cdp.is_element_present(SELECTORS["button"]):
+            BUTTON_ELEMENT = await self._cdp.find_element(SELECTORS["button"], timeout=timeout)
+            job.easy_application = "simplificada" in await BUTTON_ELEMENT.text()
+        elif await self._cdp.is_element_present(SELECTORS["button_easy_application"]):
+            BUTTON_ELEMENT = await self._cdp.find_element(SELECTORS["button_easy_application"], timeout=timeout)
             job.easy_application = BUTTON_ELEMENT is not None
         else:
-            self._driver.cdp.assert_element_present(SELECTORS["alert"], timeout)
+            await self._cdp.assert_element_present(SELECTORS["alert"], timeout=timeout)
             return None
-        job.title = self._driver.cdp.find_element(SELECTORS["title"], timeout).text
-        job.company = self._driver.cdp.find_element(SELECTORS["company"], timeout).text
-        job.location = self._driver.cdp.find_element(SELECTORS["location"], timeout).text
-        job.description = self._driver.cdp.find_element(SELECTORS["description"], timeout).text
-        if self._driver.cdp.is_element_present(SELECTORS["details"]):
+        job.title = await (await self._cdp.find_element(SELECTORS["title"], timeout=timeout)).text()
+        job.company = await (await self._cdp.find_element(SELECTORS["company"], timeout=timeout)).text()
+        job.location = await (await self._cdp.find_element(SELECTORS["location"], timeout=timeout)).text()
+        job.description = await (await self._cdp.find_element(SELECTORS["description"], timeout=timeout)).text()
+        if await self._cdp.is_element_present(SELECTORS["details"]):
             details = dict()
-            sections = self._driver.cdp.find_elements(SELECTORS["details"], timeout)
+            sections = await self._cdp.find_elements(SELECTORS["details"], timeout=timeout)
             for index in range(0, len(sections), 2 if self._logged else 1):
                 if self._logged:
                     # TODO: Descobri o formato correto dos detalhes quando conectado
                     HIDDEN_VALUE = "Corresponde às suas preferências de vaga e o "
-                    value = sections[index].text
-                    key = sections[index + 1].text_fragment
+                    value = await sections[index].text()
+                    key = await sections[index + 1].text_fragment()
                     key = key[len(HIDDEN_VALUE) : str(key).index(" é")]
                 else:
-                    key = self._driver.cdp.find_element(f"{SELECTORS['details']}[{index + 1}]/h3").text
-                    value = self._driver.cdp.find_element(f"{SELECTORS['details']}[{index + 1}]/span").text
+                    key = await (await self._cdp.find_element(f"{SELECTORS['details']}[{index + 1}]/h3")).text()
+                    value = await (await self._cdp.find_element(f"{SELECTORS['details']}[{index + 1}]/span")).text()
                 details[key] = value
             job.details = details
         return job
@@ -4,7 +4,7 @@ from typing import Any
 from modules.core import Job
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedinJob(Job):
     easy_application: bool = None
     details: dict[str, Any] = None
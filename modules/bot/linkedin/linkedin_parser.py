@@ -0,0 +1,63 @@
+from typing import Optional
+
+from modules.utils.html_handler import element_text, own_text, parse_html
+
+HIDDEN_VALUE = "Corresponde às suas preferências de vaga e o "
+
+
+def parse_job(html: str, logged: bool = False) -> Optional[dict]:
+    """Extrai os dados de um job do LinkedIn a partir do HTML do painel (ou da página) de detalhes.
+
+    Equivale ao `LinkedinBot._get_job_data`, mas sem chamadas ao navegador. Pode ser executado em outro processo.
+
+    Args:
+        html: HTML do painel de detalhes ou da página `/jobs/view/{id}`.
+        logged: Indica se o HTML foi obtido com um usuário conectado (layout diferente).
+
+    Returns:
+        Os campos do job, ou `None` se a vaga expirou.
+    """
+    soup = parse_html(html)
+    if logged:
+        wrapper = soup.select_one("[class*='jobs-details__main-content']")
+        if wrapper is None:
+            return None
+        header = ":scope > div:nth-of-type(1) > div > div:nth-of-type(1) > div"
+        button = wrapper.select_one("#jobs-apply-button-id")
+        if button is None:
+            return None
+        fields = {
+            "easy_application": "simplificada" in element_text(button),
+            "title": element_text(wrapper.select_one("h1 a")),
+            "company": element_text(wrapper.select_one(f"{header} > div:nth-of-type(1) > div:nth-of-type(1) > div")),
+            "location": element_text(wrapper.select_one(f"{header} > div:nth-of-type(3) > div > span > span:nth-of-type(1)")),
+            "description": element_text(wrapper.select_one("#job-details > div")),
+        }
+        sections = wrapper.select("ul li span[class*='ui-label'] > span")
+        if sections:
+            details = dict()
+            for index in range(0, len(sections) - 1, 2):
+                # TODO: Descobri o formato correto dos detalhes quando conectado
+                key = own_text(sections[index + 1])
+                details[key[len(HIDDEN_VALUE) : key.index(" é")]] = element_text(sections[index])
+            fields["details"] = details
+        return fields
+    button = soup.select_one("button[class*='sign-up']")
+    if button is not None:
+        easy_application = "simplificada" in element_text(button)
+    elif soup.select_one("button[class*='apply']") is not None:
+        easy_application = True
+    else:
+        return None
+    flavor_row = soup.select_one(".topcard__flavor-row")
+    fields = {
+        "easy_application": easy_application,
+        "title": element_text(soup.select_one("[class*='topcard__title']")),
+        "company": element_text(flavor_row.select_one(":scope > span:nth-of-type(1)")) if flavor_row else None,
+        "location": element_text(flavor_row.select_one(":scope > span:nth-of-type(2)")) if flavor_row else None,
+        "description": element_text(soup.select_one("[class*='description__text'] > section > div")),
+    }
+    criteria = soup.select(".description__job-criteria-list > li")
+    if criteria:
+        fields["details"] = {element_text(li.select_one(":scope > h3")): element_text(li.select_one(":scope > span")) for li in criteria}
+    return fields
@@ -1 +1 @@
-from .jobot_config import JobotConfig
\ No newline at end of file
+from .jobot_config import CompiledConfig, ConfigError, JobotConfig, load_config
@@ -1,72 +1,189 @@
+import hashlib
 import os
-from abc import ABC, abstractmethod
-from multiprocessing import RLock
+import threading
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 import yaml
 
+from modules.core.filter_engine import FilterEngine
 from modules.core.job_bot import JobFilter, JobFilterKey, JobSearch
-from modules.meta.singleton import SingletonMeta
 
+_lock = threading.Lock()
+_cache: dict[str, "CompiledConfig"] = {}
+_errors: dict[str, tuple[int, int, "ConfigError"]] = {}  # Última versão inválida de cada arquivo (não é lida de novo)
 
-class SingletonABCMeta(SingletonMeta, type(ABC)):
+
+class ConfigError(Exception):
     pass
 
 
-class JobotConfig(ABC, metaclass=SingletonABCMeta):
-    # Variáveis de classe com lock separado
-    _shared_config = None
-    _shared_config_loaded = False
-    _shared_config_lock = RLock()  # Usando RLock que suporta context manager
-
-    def __init__(self):
-        self._load_shared_config()
-        self.bots = {}
-
-    def _load_shared_config(self):
-        # Usando gerenciador de contexto com RLock
-        with JobotConfig._shared_config_lock:
-            if JobotConfig._shared_config_loaded:
-                self.config = JobotConfig._shared_config
-                return
-            file = os.getenv("BOT_CONFIG_YML", "configs.yml")
-            if not os.path.exists(file):
-                raise Exception(f"Arquivo {file} não encontrado.")
-            with open(file, "r", encoding="utf-8") as f:
-                JobotConfig._shared_config = yaml.safe_load(f)
-            JobotConfig._shared_config_loaded = True
-            self.config = JobotConfig._shared_config
-
-    def get_searches(self, bot: str):
-        search_list = self.__get_bot(bot)
-        searches: list[JobSearch] = []
-        assert type(search_list) == list
-        for s in search_list:
-            for location in s["locations"]:
-                searches.append(JobSearch(s["job"], location))
-        return searches
-
-    def get_filters(self):
-        filters: list[JobFilter] = []
-        for f in self.config.get("filters", []):
-            key = f["key"]
-            includes = []
-            excludes = []
-            for include_list in f.get("include", []):
-                for l in include_list.values():
-                    includes += l
-            for exclude_list in f.get("exclude", []):
-                for l in exclude_list.values():
-                    excludes += l
-            full_match = f.get("full_match", False)
-            filters.append(JobFilter(self._get_filter_key(key), keywords=includes, exclude_keywords=excludes, full_match=full_match))
-        return filters
-
-    @abstractmethod
-    def _get_filter_key(self, value: str) -> JobFilterKey:
-        raise NotImplementedError(f"The method {self._get_filter_key.__name__} must be implemented.")
-
-    def __get_bot(self, bot: str):
+class ConfigFilterKey(JobFilterKey):
+    TITLE = "title"
+    DESCRIPTION = "description"
+    LOCATION = "location"
+    COMPANY = "company"
+
+
+FILTER_KEYS = frozenset(key.value for key in ConfigFilterKey)
+
+
+@dataclass(frozen=True)
+class CompiledConfig:
+    """Versão imutável e validada do `configs.yml`: pesquisas, filtros (já compilados) e settings de cada site.
+
+    Uma instância nunca é alterada: quando o arquivo muda, `load_config` cria outra e a troca no cache, então
+    quem já tem uma referência continua vendo uma configuração consistente.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    digest: str  # sha256 do conteúdo do arquivo
+    searches: Mapping[str, tuple[JobSearch, ...]]
+    filters: tuple[JobFilter, ...]
+    filter_engine: FilterEngine
+    settings: Mapping[str, Mapping]
+
+    def get_searches(self, bot: str) -> tuple[JobSearch, ...]:
         try:
-            return self.config["searches"][bot[:-3]]
-        except AttributeError as err:
-            raise Exception(f'Chave "{bot[:-3]}" não encontrado no arquivo de configuração.')
+            return self.searches[bot[:-3]]
+        except KeyError:
+            raise ConfigError(f'Chave "{bot[:-3]}" não encontrada no arquivo de configuração.')
+
+    def get_settings(self, bot: str) -> Mapping:
+        """Retorna as configurações de execução do bot (seção `settings` do arquivo)."""
+        return self.settings.get(bot[:-3], MappingProxyType({}))
+
+
+def load_config(path: Optional[str] = None) -> CompiledConfig:
+    """Retorna a configuração compilada do arquivo, recompilando-a apenas quando o conteúdo muda.
+
+    O cache é validado pelo `mtime` e pelo tamanho do arquivo; se eles mudaram, mas o sha256 do conteúdo é o mesmo
+    (ex.: arquivo salvo sem alterações), a configuração compilada é reaproveitada. Se o novo conteúdo for inválido,
+    `ConfigError` é levantado e a versão anterior permanece no cache.
+
+    Args:
+        path: Arquivo de configuração (padrão: `BOT_CONFIG_YML` ou `configs.yml`).
+    """
+    path = os.path.abspath(path or os.getenv("BOT_CONFIG_YML", "configs.yml"))
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise ConfigError(f"Arquivo {path} não encontrado.")
+    cached = _cache.get(path)
+    if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+        return cached
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+            return cached
+        error = _errors.get(path)
+        if error is not None and error[:2] == (stat.st_mtime_ns, stat.st_size):
+            raise error[2]
+        with open(path, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+        if cached is not None and cached.digest == digest:
+            config = replace(cached, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        else:
+            try:
+                config = _compile(path, stat, digest, content)
+            except ConfigError as err:
+                _errors[path] = (stat.st_mtime_ns, stat.st_size, err)
+                raise
+        _errors.pop(path, None)
+        _cache[path] = config  # Troca atômica: leitores sem o lock veem a versão anterior ou a nova
+        return config
+
+
+def _compile(path: str, stat: os.stat_result, digest: str, content: bytes) -> CompiledConfig:
+    try:
+        data = yaml.safe_load(content) or {}
+    except yaml.YAMLError as err:
+        raise ConfigError(f"Arquivo {path} inválido: {err}")
+    if not isinstance(data, dict):
+        raise ConfigError(f"Arquivo {path} inválido: esperado um mapeamento com as seções searches, filters e settings.")
+    for section, kind, expected in (("searches", dict, "esperado um mapeamento"), ("filters", list, "esperada uma lista"), ("settings", dict, "esperado um mapeamento")):
+        if not isinstance(data.get(section) or kind(), kind):
+            raise ConfigError(f'Seção "{section}" inválida: {expected}.')
+    for site, values in (data.get("settings") or {}).items():
+        if not isinstance(values or {}, dict):
+            raise ConfigError(f'Configurações de "{site}" inválidas: esperado um mapeamento.')
+    filters = tuple(_compile_filter(index, f) for index, f in enumerate(data.get("filters") or [], start=1))
+    return CompiledConfig(
+        path=path,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        digest=digest,
+        searches=MappingProxyType({site: _compile_searches(site, items) for site, items in (data.get("searches") or {}).items()}),
+        filters=filters,
+        filter_engine=FilterEngine(list(filters)),
+        settings=MappingProxyType({site: MappingProxyType(dict(values or {})) for site, values in (data.get("settings") or {}).items()}),
+    )
+
+
+def _compile_searches(site: str, items) -> tuple[JobSearch, ...]:
+    if not isinstance(items, list):
+        raise ConfigError(f'Pesquisas de "{site}" inválidas: esperada uma lista.')
+    searches = []
+    for item in items:
+        if not isinstance(item, dict) or not item.get("job"):
+            raise ConfigError(f'Pesquisa de "{site}" sem o campo "job": {item}')
+        interval = item.get("interval")
+        if interval is not None and (not isinstance(interval, (int, float)) or interval <= 0):
+            raise ConfigError(f'Pesquisa "{item["job"]}" de "{site}" com intervalo inválido: {interval}')
+        for location in item.get("locations") or [None]:
+            searches.append(JobSearch(item["job"], location, interval))
+    return tuple(searches)
+
+
+def _compile_filter(index: int, item) -> JobFilter:
+    if not isinstance(item, dict) or item.get("key") not in FILTER_KEYS:
+        raise ConfigError(f"Filtro Nº {index} inválido: a chave deve ser uma de {', '.join(sorted(FILTER_KEYS))}.")
+
+    def keywords(section: str) -> list[str]:
+        groups = item.get(section) or []
+        if not isinstance(groups, list):
+            raise ConfigError(f'Filtro Nº {index} inválido: "{section}" deve ser uma lista de grupos (ex.: - words: [python, java]).')
+        words = []
+        for group in groups:
+            if not isinstance(group, dict):
+                raise ConfigError(f'Filtro Nº {index} inválido: cada grupo de "{section}" deve ser um mapeamento de listas, recebido: {group!r}')
+            for name, values in group.items():
+                if not isinstance(values, list):
+                    raise ConfigError(f'Filtro Nº {index} inválido: "{section}.{name}" deve ser uma lista de palavras.')
+                words += [str(value) for value in values]
+        return words
+
+    return JobFilter(
+        ConfigFilterKey(item["key"]),
+        keywords=keywords("include"),
+        exclude_keywords=keywords("exclude"),
+        full_match=bool(item.get("full_match", False)),
+    )
+
+
+class JobotConfig:
+    """Acesso à configuração atual (`load_config`), mantido para compatibilidade.
+
+    Cada chamada consulta o cache, então o retorno reflete a última versão do arquivo.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.__path = path
+
+    @property
+    def config(self) -> CompiledConfig:
+        return load_config(self.__path)
+
+    def get_searches(self, bot: str) -> list[JobSearch]:
+        return list(self.config.get_searches(bot))
+
+    def get_filters(self) -> list[JobFilter]:
+        return list(self.config.filters)
+
+    def get_settings(self, bot: str) -> dict:
+        """Retorna as configurações de execução do bot (seção `settings` do arquivo)."""
+        return dict(self.config.get_settings(bot))
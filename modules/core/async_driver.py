@@ -0,0 +1,136 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# Métodos do CDP que retornam elementos (encapsulados em `AsyncElement`)
+ELEMENT_METHODS = {
+    "find_element",
+    "find_elements",
+    "find_visible_elements",
+    "find_element_by_text",
+    "find_elements_by_text",
+    "select",
+    "select_all",
+    "query_selector",
+    "query_selector_all",
+}
+
+
+class AsyncDriver:
+    """Fachada assíncrona do driver do SeleniumBase.
+
+    As chamadas ao navegador são síncronas (bloqueiam até o navegador responder). Aqui elas são executadas
+    em uma única thread dedicada, na ordem em que foram feitas, enquanto o loop do asyncio continua livre para
+    a task de captcha, as gravações no banco e as demais corrotinas.
+
+    Cada chamada tem um tempo máximo (`timeout`). Se ele for atingido (ou a corrotina for cancelada), quem
+    aguardava recebe o erro imediatamente, mas a chamada em andamento só termina quando o navegador responder,
+    e as próximas aguardam a sua vez.
+    """
+
+    def __init__(self, driver, timeout: float = 60):
+        self.__driver = driver
+        self.__timeout = timeout
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cdp")
+        self.__calls = 0
+        self.cdp = AsyncCDP(self)
+
+    @property
+    def driver(self):
+        """Driver síncrono do SeleniumBase."""
+        return self.__driver
+
+    @property
+    def calls(self) -> int:
+        """Total de chamadas feitas ao navegador."""
+        return self.__calls
+
+    async def run(self, func: Callable, *args, timeout: float = None, **kwargs) -> Any:
+        """Executa `func(*args, **kwargs)` na thread do navegador.
+
+        Raises:
+            TimeoutError: Se a chamada não terminar em `timeout` segundos (padrão do adaptador).
+        """
+        self.__calls += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.__executor, functools.partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, self.__timeout if timeout is None else timeout)
+
+    def close(self):
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __getattr__(self, name: str):
+        # Métodos do driver (ex.: `uc_activate_cdp_mode`, `is_element_present`)
+        method = getattr(self.__driver, name)
+
+        async def call(*args, **kwargs):
+            return await self.run(functools.partial(method, *args, **kwargs))
+
+        return call
+
+
+class AsyncCDP:
+    """Versão assíncrona de `driver.cdp`: `await cdp.get_current_url()`, `await cdp.find_element(...)` etc.
+
+    O `timeout` de cada chamada ao adaptador é estendido pelo `timeout` do próprio método, quando informado
+    (ex.: `find_element(selector, timeout=15)`), para que a espera do SeleniumBase não seja interrompida antes da hora.
+    """
+
+    def __init__(self, driver: AsyncDriver):
+        self.__driver = driver
+
+    def __getattr__(self, name: str):
+        driver = self.__driver
+
+        async def call(*args, **kwargs):
+            method = getattr(driver.driver.cdp, name)
+            timeout = kwargs.get("timeout")
+            call_timeout = None if timeout is None else timeout + 30
+            result = await driver.run(functools.partial(method, *args, **kwargs), timeout=call_timeout)
+            return wrap_elements(driver, result) if name in ELEMENT_METHODS else result
+
+        call.__name__ = name
+        return call
+
+
+class AsyncElement:
+    """Elemento do navegador com métodos assíncronos, executados pela thread do `AsyncDriver`."""
+
+    def __init__(self, driver: AsyncDriver, element):
+        self.__driver = driver
+        self.__element = element
+
+    @property
+    def element(self):
+        """Elemento síncrono do SeleniumBase."""
+        return self.__element
+
+    async def click(self):
+        return await self.__driver.run(self.__element.click)
+
+    async def scroll_into_view(self):
+        return await self.__driver.run(self.__element.scroll_into_view)
+
+    async def get_attribute(self, name: str):
+        return await self.__driver.run(self.__element.get_attribute, name)
+
+    async def text(self) -> str:
+        return await self.__driver.run(getattr, self.__element, "text")
+
+    async def text_fragment(self) -> str:
+        return await self.__driver.run(getattr, self.__element, "text_fragment")
+
+    async def query_selector(self, selector: str):
+        return wrap_elements(self.__driver, await self.__driver.run(self.__element.query_selector, selector))
+
+    async def query_selector_all(self, selector: str):
+        return wrap_elements(self.__driver, await self.__driver.run(self.__element.query_selector_all, selector))
+
+
+def wrap_elements(driver: AsyncDriver, result):
+    if result is None or isinstance(result, (bool, str, int, float, dict)):
+        return result
+    if isinstance(result, (list, tuple)):
+        return [AsyncElement(driver, element) for element in result]
+    return AsyncElement(driver, result)
@@ -4,10 +4,19 @@ from enum import Enum
 from time import time
 from datetime import datetime
 import asyncio
+import inspect
+import json
 import logging
 import os
 import time
+from contextlib import contextmanager
+from typing import Callable, Optional
 
+from modules.core.async_driver import AsyncCDP, AsyncDriver
+from modules.core.captcha_watcher import CaptchaWatcher
+from modules.core.metrics import MetricsExporter, MetricsRegistry
+from modules.core.profiler import Profiler
+from modules.core.wait_stats import WaitStats
 from modules.utils import get_logger, camel_case_split
 
 
@@ -21,15 +30,34 @@ class Bot(ABC):
 
     def __init__(self):
         self.__driver = None
+        self.__browser: AsyncDriver = None
+        self.__recycled_calls: int = 0  # Chamadas feitas aos navegadores já reciclados
+        self.__profiler: Optional[Profiler] = None
         self.__state = BotState.READY
-        self.__options: dict = {"binary_location": os.getenv("SB_BINARY_LOCATION")}
+        PROFILES_DIR = os.getenv("BOT_BROWSER_PROFILES", "./profiles")  # Vazio: perfil temporário a cada execução
+        self.__profile_dir = os.path.abspath(os.path.join(PROFILES_DIR, self.__class__.__name__)) if PROFILES_DIR else None
+        self.__options: dict = {"binary_location": os.getenv("SB_BINARY_LOCATION"), "user_data_dir": self.__profile_dir}
+        self.__duration: float = 0
+        self.__error: Exception = None
+        self.__wait_timeout: float = float(os.getenv("BOT_WAIT_TIMEOUT", 15))  # Tempo máximo padrão das esperas
+        self.__wait_stats = WaitStats()
+        self.__phase_stats = WaitStats()  # Tempo gasto em cada fase da execução (setup, busca, listagem, detalhes...)
+        self.__metrics = MetricsRegistry()
+        self.__metric_labels = {"bot": self.__class__.__name__, "search": ""}
+        self.__metrics_exporter = MetricsExporter(
+            self.__metrics,
+            f"./metrics/{self.__class__.__name__}",
+            interval=float(os.getenv("BOT_METRICS_INTERVAL", 15)),  # 0 desativa a gravação dos arquivos de métricas
+            collect=self._collect_metrics,
+        )
         self._captcha_task = None
         self._captcha_active = False  # Controle de estado do captcha
+        self.__captcha_watcher: CaptchaWatcher = None
         self.__captcha_condition = asyncio.Condition()
         self._logger: logging.Logger = get_logger(
             self.__class__.__name__,
-            level=logging.DEBUG,
-            file_name=f"./logs/{self.__class__.__name__}/{self.__class__.__name__}_{datetime.now().strftime("%d_%m_%Y")}.log",
+            level=os.getenv("LOG_LEVEL", "DEBUG").upper(),
+            file_name=f"./logs/{self.__class__.__name__}/{self.__class__.__name__}.log",  # Rotação diária (ou por tamanho)
         )
 
     @property
@@ -40,13 +68,64 @@ class Bot(ABC):
     def _driver(self):
         return self.__driver
 
+    @property
+    def _profile_dir(self) -> str:
+        """Perfil persistente do navegador (cookies, armazenamento local), ou `None` se ele é temporário."""
+        return self.__profile_dir
+
+    @property
+    def _browser(self) -> AsyncDriver:
+        """Driver assíncrono: as chamadas ao navegador não bloqueiam o loop do asyncio."""
+        return self.__browser
+
+    @property
+    def _cdp(self) -> AsyncCDP:
+        """Versão assíncrona de `driver.cdp`."""
+        return self.__browser.cdp
+
     @property
     def state(self):
         return self.__state
 
+    @property
+    def duration(self) -> float:
+        """Duração (em segundos) da última execução."""
+        return self.__duration
+
+    @property
+    def wait_stats(self) -> WaitStats:
+        return self.__wait_stats
+
+    @property
+    def phase_stats(self) -> WaitStats:
+        return self.__phase_stats
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Métricas da execução (contadores e histogramas de latência por bot e pesquisa)."""
+        return self.__metrics
+
+    @property
+    def browser_calls(self) -> int:
+        """Total de chamadas feitas ao navegador (somando os navegadores reciclados)."""
+        return self.__recycled_calls + (self.__browser.calls if self.__browser is not None else 0)
+
+    @property
+    def error(self) -> Exception:
+        """Erro que interrompeu a última execução, se houver."""
+        return self.__error
+
     async def _setup(self):
         pass
 
+    async def _setup_browser(self):
+        """Prepara um navegador recém-aberto (página inicial, popups, login). Executado também ao reciclar o navegador."""
+        pass
+
+    async def _teardown_browser(self):
+        """Libera os recursos ligados ao navegador atual (ex.: abas extras) antes de ele ser fechado."""
+        pass
+
     async def _teardown(self):
         pass
 
@@ -55,51 +134,303 @@ class Bot(ABC):
         raise NotImplementedError("O método _start deve ser implementado.")
 
     async def start(self):
+        """Executa o bot uma única vez: abre o navegador, executa `_start` e encerra."""
         if self.__state == BotState.READY:
+            START_TIME = time.time()
             try:
-                binary_location = self.__options["binary_location"]
-                self.__driver = Driver(uc=True, binary_location=binary_location)
-                if self.__driver is None:
-                    self._logger.critical("O driver não pôde ser inicializado.")
-                    return
-                self.__state = BotState.RUNNING
-                self._logger.debug(f"Inicializando a execução do bot...")
-                START_TIME = time.time()
+                if await self.open():
+                    await self.run()
+            finally:
+                await self.close()
+                DURATION = self.__duration = time.time() - START_TIME
+                self._logger.debug(f"Duração total de execução: {DURATION:.2f} segundos")
+
+    async def open(self) -> bool:
+        """Abre o navegador e prepara o bot (`_setup` e `_setup_browser`), sem executar as pesquisas.
+
+        Returns:
+            `True` se o bot está pronto para `run`. Em caso de erro, ele fica disponível em `error`.
+        """
+        if self.__state != BotState.READY:
+            return self.__state == BotState.RUNNING
+        self.__error = None
+        self.__start_profiler()
+        try:
+            if not await self.__launch():
+                return False
+            self.__state = BotState.RUNNING
+            self.__metrics_exporter.start()
+            self._logger.debug(f"Inicializando a execução do bot...")
+            with self._phase("setup"):
                 await self._setup()
+                await self._setup_browser()
+        except Exception as err:
+            await self.__fail(err)
+            return False
+        return True
+
+    async def run(self) -> bool:
+        """Executa `_start` com o navegador já aberto. Pode ser chamado várias vezes (modo daemon).
+
+        Returns:
+            `True` se a execução terminou sem erros. Em caso de erro, ele fica disponível em `error`.
+        """
+        if self.__state != BotState.RUNNING:
+            return False
+        self.__error = None
+        try:
+            with self._phase("run"):
                 await self._start()
+        except Exception as err:
+            await self.__fail(err)
+            return False
+        finally:
+            self._set_search_label("")
+        self._logger.debug(f"Bot executado com sucesso!")
+        return True
+
+    async def recycle(self) -> bool:
+        """Fecha o navegador e abre outro, preparando-o com `_setup_browser` (os demais recursos são mantidos).
+
+        Returns:
+            `True` se o novo navegador está pronto.
+        """
+        if self.__state != BotState.RUNNING:
+            return False
+        self._logger.info("Reciclando o navegador...")
+        self._count("browser_recycles_total")
+        try:
+            with self._phase("recycle"):
+                await self._teardown_browser()
+                await self.__quit()
+                self.__recycled_calls += self.__browser.calls
+                self.__driver = self.__browser = None
+                if not await self.__launch():
+                    return False
+                await self._setup_browser()
+        except Exception as err:
+            await self.__fail(err)
+            return False
+        return True
+
+    async def close(self):
+        """Libera os recursos (`_teardown`), grava as métricas e fecha o navegador."""
+        if self.__state == BotState.RUNNING:
+            # Executado também em caso de erro, para liberar recursos e gravar dados pendentes
+            self._set_search_label("")
+            with self._phase("teardown"):
+                try:
+                    await self._teardown_browser()
+                except Exception as err:
+                    self._logger.warning(f"Erro ao liberar os recursos do navegador: {err}")
                 await self._teardown()
-            except Exception as err:
-                data = datetime.fromtimestamp(time.time())
-                dir_name = f"./screenshots/{self.__class__.__name__}"
-                os.makedirs(dir_name, exist_ok=True)
-                self._driver.cdp.save_screenshot(f"{dir_name}/{data.strftime("%d_%m_%Y_%H_%M_%S")}_ERROR.png")
-                self._logger.error(err)
-            else:
-                self._logger.debug(f"Bot executado com sucesso!")
-            finally:
-                self._logger.debug(f"Finalizando a execução do bot.")
-                END_TIME = time.time()
-                DURATION = END_TIME - START_TIME
-                self._logger.debug(f"Duração total de execução: {DURATION:.2f} segundos")
-                await self.stop()
+        self._logger.debug(f"Finalizando a execução do bot.")
+        self._logger.debug(f"Tempo gasto em esperas:\n{self.__wait_stats.summary()}")
+        self._logger.debug(f"Tempo gasto por fase:\n{self.__phase_stats.summary()}")
+        self._logger.debug(f"Total de chamadas ao navegador: {self.browser_calls}")
+        try:
+            await self.__metrics_exporter.close()
+        except OSError as err:
+            self._logger.warning(f"Não foi possível gravar as métricas: {err}")
+        await self.stop()
+        self.__stop_profiler()
+
+    def __start_profiler(self):
+        """Inicia o perfil de CPU (`BOT_PROFILE`), que cobre de `open` a `close` (uma execução ou todo o modo daemon)."""
+        try:
+            self.__profiler = Profiler.from_env(f"./logs/{self.__class__.__name__}", self.__class__.__name__)
+        except ValueError as err:
+            self._logger.warning(f"Perfil de execução desativado: {err}")
+            self.__profiler = None
+        if self.__profiler is not None:
+            self.__profiler.start()
+
+    def __stop_profiler(self):
+        if self.__profiler is None:
+            return
+        PROFILER, self.__profiler = self.__profiler, None
+        self._logger.info(f"Perfil de execução ({PROFILER.mode}) gravado em: {', '.join(PROFILER.stop())}")
 
     async def stop(self):
         if self.__state == BotState.RUNNING:
-            self.__driver.quit()
+            await self.__quit()
             self.__state = BotState.STOPPED
 
+    async def __launch(self) -> bool:
+        if self.__profile_dir is not None:
+            os.makedirs(self.__profile_dir, mode=0o700, exist_ok=True)
+        self.__driver = Driver(uc=True, **self.__options)
+        if self.__driver is None:
+            self._logger.critical("O driver não pôde ser inicializado.")
+            return False
+        self.__browser = AsyncDriver(self.__driver)
+        return True
+
+    async def __quit(self):
+        if self.__driver is None:
+            return
+        try:
+            await self.__browser.run(self.__driver.quit, timeout=30)
+        except Exception:
+            # A thread do navegador está ocupada (chamada travada): encerra diretamente
+            self.__driver.quit()
+        finally:
+            self.__browser.close()
+
+    async def __fail(self, err: Exception):
+        self.__error = err
+        data = datetime.fromtimestamp(time.time())
+        dir_name = f"./screenshots/{self.__class__.__name__}"
+        os.makedirs(dir_name, exist_ok=True)
+        self._logger.error(err)
+        try:
+            await self._cdp.save_screenshot(f"{dir_name}/{data.strftime("%d_%m_%Y_%H_%M_%S")}_ERROR.png")
+        except Exception as screenshot_err:
+            self._logger.debug(f"Não foi possível salvar a captura de tela: {screenshot_err}")
+
     async def reset(self):
         if self.__state == BotState.STOPPED:
             self.__driver = None
+            self.__browser = None
             self.__state = BotState.READY
 
+    @contextmanager
+    def _phase(self, name: str):
+        """Mede o tempo gasto em uma fase da execução (as fases podem se sobrepor, ex.: "run" inclui "details")."""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start_time
+            self.__phase_stats.record(name, duration, True)
+            self._observe("phase_seconds", duration, phase=name)
+
+    def _set_search_label(self, search: str):
+        """Define a pesquisa em andamento, usada como label das métricas registradas a partir de agora."""
+        self.__metric_labels["search"] = search
+
+    def _count(self, name: str, value: float = 1, **labels):
+        """Incrementa um contador das métricas com os labels do bot e da pesquisa atual."""
+        self.__metrics.inc(name, value, **self.__metric_labels, **labels)
+
+    def _observe(self, name: str, seconds: float, **labels):
+        """Registra uma duração no histograma das métricas com os labels do bot e da pesquisa atual."""
+        self.__metrics.observe(name, seconds, **self.__metric_labels, **labels)
+
+    def _record_wait(self, name: str, duration: float, ready: bool):
+        """Registra uma espera nas estatísticas do log e nas métricas."""
+        self.__wait_stats.record(name, duration, ready)
+        self._observe("wait_seconds", duration, wait=name)
+        if not ready:
+            self._count("wait_timeouts_total", wait=name)
+
+    async def _sleep(self, seconds: float, name: str = "sleep"):
+        """Pausa fixa (ex.: backoff entre tentativas), contabilizada como espera."""
+        await asyncio.sleep(seconds)
+        self._record_wait(name, seconds, True)
+
+    def _collect_metrics(self):
+        """Atualiza os gauges antes de cada gravação das métricas."""
+        self.__metrics.set("browser_calls", self.browser_calls, bot=self.__class__.__name__)
+        self.__metrics.set("last_update_timestamp_seconds", time.time(), bot=self.__class__.__name__)
+
+    async def _wait_for(self, name: str, condition: Callable[[], bool], timeout: float = None, interval: float = 0.25) -> bool:
+        """Aguarda até que a condição seja satisfeita, registrando quanto tempo a espera realmente levou.
+
+        Args:
+            name: Nome da espera nas estatísticas (ex.: "search", "job_list").
+            condition: Função (ou corrotina) que retorna True quando a página está pronta. Exceções contam como False.
+            timeout: Tempo máximo de espera em segundos (padrão: BOT_WAIT_TIMEOUT).
+            interval: Intervalo entre as verificações em segundos.
+
+        Returns:
+            True se a condição foi satisfeita, False se o tempo máximo foi atingido.
+        """
+        timeout = self.__wait_timeout if timeout is None else timeout
+        start_time = time.perf_counter()
+        while True:
+            try:
+                ready = condition()
+                if inspect.isawaitable(ready):
+                    ready = await ready
+                ready = bool(ready)
+            except Exception:
+                ready = False
+            duration = time.perf_counter() - start_time
+            if ready or duration >= timeout:
+                break
+            await asyncio.sleep(interval)
+        self._record_wait(name, duration, ready)
+        if not ready:
+            self._logger.debug(f"Tempo de espera esgotado ({timeout}s): {name}")
+        return ready
+
+    async def _wait_for_selector(self, selector: str, name: str = "selector", timeout: float = None) -> bool:
+        """Aguarda o elemento estar presente na página."""
+        return await self._wait_for(name, lambda: self._cdp.is_element_present(selector), timeout)
+
+    async def _wait_for_count(self, xpath: str, minimum: int, name: str = "count", timeout: float = None) -> bool:
+        """Aguarda a página ter mais de `minimum` elementos (ex.: novos cards após rolar a lista)."""
+
+        async def condition():
+            return await self._count_elements(xpath) > minimum
+
+        return await self._wait_for(name, condition, timeout)
+
+    async def _count_elements(self, xpath: str) -> int:
+        """Conta os elementos de um XPath com uma única chamada ao navegador."""
+        SCRIPT = f"document.evaluate({json.dumps(f'count({xpath})')}, document, null, XPathResult.NUMBER_TYPE, null).numberValue"
+        return int(await self._cdp.evaluate(SCRIPT) or 0)
+
+    async def _wait_for_url_change(self, previous_url: str, name: str = "url_change", timeout: float = None) -> bool:
+        """Aguarda a URL atual ser diferente de `previous_url`."""
+
+        async def condition():
+            return await self._cdp.get_current_url() != previous_url
+
+        return await self._wait_for(name, condition, timeout)
+
+    async def _wait_for_page_load(self, name: str = "page_load", timeout: float = None) -> bool:
+        """Aguarda o documento terminar de carregar."""
+
+        async def condition():
+            return await self._cdp.evaluate("document.readyState") == "complete"
+
+        return await self._wait_for(name, condition, timeout)
+
+    async def _wait_for_network_idle(self, idle_time: float = 0.5, name: str = "network_idle", timeout: float = None) -> bool:
+        """Aguarda a página ficar `idle_time` segundos sem iniciar novas requisições."""
+        SCRIPT = "performance.getEntriesByType('resource').length"
+        state = {"count": -1, "since": time.perf_counter()}
+
+        async def idle():
+            count = await self._cdp.evaluate(SCRIPT)
+            now = time.perf_counter()
+            if count != state["count"]:
+                state["count"], state["since"] = count, now
+            return now - state["since"] >= idle_time
+
+        return await self._wait_for(name, idle, timeout, interval=min(idle_time / 2, 0.25))
+
     async def _captcha(self, selector_captcha: str):
+        """Task que pausa o processamento enquanto houver captcha na página.
+
+        A detecção é feita por eventos do navegador (`CaptchaWatcher`). Se o CDP não suportar o binding,
+        volta para a consulta periódica do seletor. Em ambos os casos, o seletor é verificado de tempos
+        em tempos como garantia contra eventos perdidos.
+        """
+        POLLING_INTERVAL = 0.5  # Intervalo de verificação sem eventos
+        SAFETY_INTERVAL = 30  # Intervalo da verificação de segurança com eventos
+        watcher = self.__captcha_watcher = CaptchaWatcher(self.__browser, selector_captcha)
         try:
-            self._logger.debug("▶ Task de captcha inicializada.")
+            try:
+                await watcher.install()
+                self._logger.debug("▶ Task de captcha inicializada (detecção por eventos).")
+            except Exception as err:
+                self._logger.warning(f"Detecção de captcha por eventos indisponível, usando verificação periódica: {err}")
             while True:
-                await asyncio.sleep(0.5)  # Verificação periódica
-                # Verificação mais robusta do elemento
-                if not self._driver.cdp.is_element_present(selector_captcha):
+                interval = SAFETY_INTERVAL if watcher.installed else POLLING_INTERVAL
+                if not await watcher.wait_change(interval) and not await watcher.check():
                     # Garante que _captcha_active seja False quando não há captcha
                     if self._captcha_active:
                         async with self._captcha_condition:
@@ -108,6 +439,7 @@ class Bot(ABC):
                     continue
                 self._logger.debug("🔍 Captcha detectado! Pausando processamento...")
                 # Ativação do estado de captcha
+                START_TIME = time.perf_counter()
                 async with self._captcha_condition:
                     self._captcha_active = True
                     self._captcha_condition.notify_all()
@@ -118,6 +450,8 @@ class Bot(ABC):
                     self._logger.warning(f"⚠️ Erro ao resolver captcha: {str(e)}")
                     # Continue sem resetar _captcha_active aqui - será resetado na próxima verificação
                     continue
+                finally:
+                    self._record_wait("captcha", time.perf_counter() - START_TIME, not watcher.present)
                 # Só reseta se chegou até aqui (resolução bem-sucedida)
                 async with self._captcha_condition:
                     self._captcha_active = False
@@ -128,7 +462,17 @@ class Bot(ABC):
         except Exception as e:
             self._logger.error(f"Erro inesperado na task de captcha: {str(e)}", exc_info=True)
         finally:
-            self._logger.debug("🛑 Captcha task finalizada")
+            self._logger.debug(f"🛑 Captcha task finalizada (eventos recebidos: {watcher.events})")
+
+    async def _watch_tab(self, tab):
+        """Estende a detecção de captcha por eventos (se ativa) a uma aba extra do navegador."""
+        watcher = self.__captcha_watcher
+        if watcher is None or not watcher.installed:
+            return
+        try:
+            await watcher.install(tab)
+        except Exception as err:
+            self._logger.warning(f"Não foi possível detectar captcha na aba extra: {err}")
 
     async def _captcha_resolve(self, captcha_selector: str):
         """
@@ -139,26 +483,35 @@ class Bot(ABC):
         """
         # Tempos configuráveis (em segundos)
         WAIT_AUTO_RESOLUTION = 25  # Tempo máximo para a solução automática
-        POLLING_INTERVAL = 3  # Intervalo entre verificações
+        POLLING_INTERVAL = 3  # Intervalo entre verificações (sem detecção por eventos)
         FALLBACK_TIMEOUT = 40  # Tempo máximo para o fallback
+        watcher = self.__captcha_watcher
+
+        async def wait_absent(timeout: float) -> bool:
+            if watcher.installed:
+                # Acordado pelo evento de remoção do captcha, sem consultar o navegador
+                return await watcher.wait_absent(timeout) or not await watcher.check()
+            start_time = time.perf_counter()
+            while await watcher.check():
+                if (time.perf_counter() - start_time) >= timeout:
+                    return False
+                await asyncio.sleep(min(POLLING_INTERVAL, timeout))
+            return True
+
         try:
-            # 1. Espera pela resolução automática (com polling discreto)
-            start_time = time.time()
-            while (time.time() - start_time) < WAIT_AUTO_RESOLUTION:
-                if not self._driver.cdp.is_element_present(captcha_selector):
-                    self._logger.debug("✅ Captcha resolvido automaticamente!")
-                    return
-                await asyncio.sleep(POLLING_INTERVAL)
+            # 1. Espera pela resolução automática
+            if await wait_absent(WAIT_AUTO_RESOLUTION):
+                self._logger.debug("✅ Captcha resolvido automaticamente!")
+                return
             # 2. Se chegou aqui, a solução automática falhou
             self._logger.debug("⏳ Solução automática falhou - Acionando fallback...")
             start_time = time.time()
             while (time.time() - start_time) < FALLBACK_TIMEOUT:
                 try:
                     # Exemplo: Recarregar o captcha e tentar novamente
-                    self._driver.cdp.gui_click_element(captcha_selector)
-                    await asyncio.sleep(5)  # Tempo para recarregar
-                    # Verifique se o captcha persiste
-                    if not self._driver.cdp.is_element_present(captcha_selector):
+                    await self._cdp.gui_click_element(captcha_selector)
+                    # Verifique se o captcha persiste (tempo para recarregar)
+                    if await wait_absent(5):
                         self._logger.debug("🎉 Fallback resolveu o captcha!")
                         return
                     # Implemente aqui alternativas como:
@@ -167,7 +520,7 @@ class Bot(ABC):
                     # - Solicitar intervenção manual
                 except Exception as e:
                     self._logger.debug(f"⚠️ Tentativa de fallback falhou: {str(e)}")
-                    await asyncio.sleep(10)  # Intervalo entre tentativas
+                    await self._sleep(10, "captcha_retry")  # Intervalo entre tentativas
         except Exception as e:
             self._logger.debug(f"🚨 Erro no processo de resolução: {str(e)}")
             raise
@@ -0,0 +1,60 @@
+import json
+import os
+import time
+from typing import Optional
+
+import mycdp
+
+
+class BrowserSession:
+    """Cópia dos cookies do navegador em `<perfil>/session.json`, restaurada quando o perfil não tem a sessão.
+
+    O perfil persistente do navegador já guarda os cookies com data de expiração; a cópia cobre os cookies de
+    sessão (descartados ao fechar o navegador) e perfis apagados ou corrompidos. O arquivo contém credenciais de
+    acesso: é gravado apenas com permissão de leitura para o usuário atual.
+    """
+
+    def __init__(self, file_path: str):
+        self.__file_path = file_path
+
+    @property
+    def file_path(self) -> str:
+        return self.__file_path
+
+    def save(self, cookies: list) -> int:
+        """Grava os cookies (objetos `mycdp.network.Cookie`) ainda válidos.
+
+        Returns:
+            Quantidade de cookies gravados.
+        """
+        NOW = time.time()
+        data = [cookie.to_json() for cookie in cookies if cookie.session or cookie.expires > NOW]
+        os.makedirs(os.path.dirname(self.__file_path) or ".", mode=0o700, exist_ok=True)
+        temp_path = f"{self.__file_path}.tmp"
+        with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.__file_path)
+        return len(data)
+
+    def load(self) -> Optional[list["mycdp.network.CookieParam"]]:
+        """Retorna os cookies ainda válidos no formato aceito por `cdp.set_all_cookies`, ou `None` se não há cópia."""
+        try:
+            with open(self.__file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        NOW = time.time()
+        cookies = []
+        for item in data:
+            if item.get("session") or item.get("expires", -1) <= 0:
+                item.pop("expires", None)  # Sem data de expiração: volta a ser um cookie de sessão
+            elif item["expires"] <= NOW:
+                continue
+            cookies.append(mycdp.network.CookieParam.from_json(item))
+        return cookies or None
+
+    def clear(self):
+        try:
+            os.remove(self.__file_path)
+        except FileNotFoundError:
+            pass
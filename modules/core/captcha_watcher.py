@@ -0,0 +1,151 @@
+import asyncio
+import functools
+import json
+import time
+from typing import Optional
+
+import mycdp
+
+from modules.core.async_driver import AsyncDriver
+
+BINDING_NAME = "__jobotCaptcha"
+
+# Observa o DOM e avisa o bot (via binding do CDP) somente quando o captcha aparece ou desaparece.
+# As mutações são agrupadas em intervalos de 100ms para não verificar o seletor a cada alteração.
+OBSERVER_SCRIPT = """
+(() => {
+    if (window.__jobotCaptchaObserver) return;
+    const selector = %s;
+    let present = null;
+    let scheduled = false;
+    const check = () => {
+        scheduled = false;
+        const current = document.querySelector(selector) !== null;
+        if (current === present) return;
+        present = current;
+        try { window.%s(current ? "1" : "0"); } catch (e) {}
+    };
+    const schedule = () => {
+        if (scheduled) return;
+        scheduled = true;
+        setTimeout(check, 100);
+    };
+    const start = () => {
+        window.__jobotCaptchaObserver = new MutationObserver(schedule);
+        window.__jobotCaptchaObserver.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+        check();
+    };
+    if (document.documentElement) start();
+    else document.addEventListener("DOMContentLoaded", start, {once: true});
+})();
+"""
+
+
+class CaptchaWatcher:
+    """Detecta o captcha por eventos do navegador, em vez de consultar o seletor periodicamente.
+
+    Um `MutationObserver` é injetado em todos os documentos (`Page.addScriptToEvaluateOnNewDocument`) e
+    chama um binding do CDP (`Runtime.addBinding`) apenas quando o estado do captcha muda. O evento
+    `Runtime.bindingCalled` atualiza o estado da aba e acorda quem estiver aguardando em `wait_change`.
+
+    O observer é instalado na aba principal e, com `install(tab)`, nas abas extras (ex.: `TabPool`); o captcha
+    está presente se estiver em qualquer uma delas. Os eventos só são entregues enquanto o loop do CDP está
+    rodando na thread do navegador, o que acontece durante as chamadas ao driver; durante a pausa por captcha,
+    em que nenhuma outra chamada é feita, `wait_absent` mantém o loop rodando em intervalos curtos.
+    """
+
+    PUMP_INTERVAL = 0.5  # Tempo (s) de cada execução do loop do CDP enquanto aguarda o captcha desaparecer
+
+    def __init__(self, driver: AsyncDriver, selector: str):
+        self.__driver = driver
+        self.__selector = selector
+        self.__states: dict[int, bool] = {}  # Presença do captcha em cada aba
+        self.__changed: Optional[asyncio.Event] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__installed = False
+        self.__events = 0
+
+    @property
+    def present(self) -> bool:
+        return any(self.__states.values())
+
+    @property
+    def installed(self) -> bool:
+        return self.__installed
+
+    @property
+    def events(self) -> int:
+        """Total de notificações recebidas do navegador."""
+        return self.__events
+
+    async def install(self, tab=None):
+        """Registra o binding e o observer na aba (padrão: a aba atual). Lança exceção se o CDP não suportar os comandos."""
+        if self.__loop is None:
+            self.__loop = asyncio.get_running_loop()
+            self.__changed = asyncio.Event()
+        script = OBSERVER_SCRIPT % (json.dumps(self.__selector), BINDING_NAME)
+
+        def install():
+            # Executado na thread do navegador, onde roda o loop do CDP
+            cdp = self.__driver.driver.cdp
+            target = cdp.page if tab is None else tab
+            target.add_handler(mycdp.runtime.BindingCalled, functools.partial(self.__on_binding_called, id(target)))
+            cdp.loop.run_until_complete(target.send(mycdp.runtime.add_binding(name=BINDING_NAME)))
+            cdp.loop.run_until_complete(target.send(mycdp.page.add_script_to_evaluate_on_new_document(source=script)))
+            if tab is None:
+                cdp.evaluate(script)  # Documento já carregado (as abas extras ainda vão navegar)
+
+        await self.__driver.run(install)
+        self.__installed = True
+
+    async def check(self) -> bool:
+        """Consulta o seletor na aba ativa (verificação de segurança, caso um evento tenha sido perdido)."""
+
+        def check():
+            cdp = self.__driver.driver.cdp
+            return id(cdp.page), cdp.is_element_present(self.__selector)
+
+        self.__set_present(*await self.__driver.run(check))
+        return self.present
+
+    async def wait_change(self, timeout: float) -> bool:
+        """Aguarda o captcha mudar de estado (ou o tempo máximo) e retorna se ele está presente."""
+        try:
+            await asyncio.wait_for(self.__changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.__changed.clear()
+        return self.present
+
+    async def wait_absent(self, timeout: float) -> bool:
+        """Aguarda o captcha desaparecer, mantendo o loop do CDP rodando. Retorna False se o tempo máximo foi atingido."""
+        deadline = time.perf_counter() + timeout
+        while self.present:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            await self.__pump(min(self.PUMP_INTERVAL, remaining))
+            await asyncio.sleep(0)  # Aplica os eventos repassados pela thread do navegador
+        return True
+
+    async def __pump(self, seconds: float):
+        """Roda o loop do CDP por `seconds` segundos, entregando os eventos recebidos (sem consultar a página)."""
+
+        def pump():
+            cdp = self.__driver.driver.cdp
+            cdp.loop.run_until_complete(asyncio.sleep(seconds))
+
+        await self.__driver.run(pump, timeout=seconds + 5)
+
+    def __on_binding_called(self, key: int, event: "mycdp.runtime.BindingCalled"):
+        if event.name != BINDING_NAME:
+            return
+        self.__events += 1
+        # O handler roda na thread do navegador (loop do CDP); o estado é repassado ao loop do bot com segurança
+        self.__loop.call_soon_threadsafe(self.__set_present, key, event.payload == "1")
+
+    def __set_present(self, key: int, present: bool):
+        PREVIOUS = self.present
+        self.__states[key] = present
+        if self.present != PREVIOUS:
+            self.__changed.set()
@@ -0,0 +1,183 @@
+import hashlib
+import random
+import re
+from typing import Optional
+
+from pymongo import UpdateOne
+
+from modules.core.filter_engine import normalize_field
+
+NUM_PERMUTATIONS = 64
+BANDS = 16  # 16 bandas de 4 linhas: pares com similaridade >= 0.7 colidem em pelo menos uma banda com ~99% de chance
+ROWS = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+TITLE_THRESHOLD = 0.6  # Semelhança mínima (Jaccard das palavras) entre os títulos de uma republicação da mesma empresa
+_PRIME = (1 << 61) - 1
+
+# Palavras que não distinguem uma vaga de outra (artigos, preposições, "pessoa desenvolvedora", modalidade)
+STOPWORDS = frozenset(
+    {"a", "o", "e", "de", "da", "do", "das", "dos", "em", "na", "no", "para", "com", "pessoa", "vaga", "remoto", "remota", "hibrido", "hibrida", "presencial"}
+)
+# Sufixos societários ignorados na comparação das empresas ("Empresa X Ltda" == "EMPRESA X S.A.")
+COMPANY_SUFFIXES = frozenset({"ltda", "sa", "s", "a", "me", "eireli", "epp", "inc", "ltd", "llc"})
+
+# Permutações fixas (a * x + b) % p, para que as assinaturas sejam comparáveis entre execuções e processos
+_random = random.Random(0x10B07)
+_PERMUTATIONS = [(_random.randrange(1, _PRIME), _random.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+
+def _hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _tokens(text: Optional[str]) -> list[str]:
+    """Palavras do texto normalizado (sem acentos nem pontuação)."""
+    return re.sub(r"[^a-z0-9+#]+", " ", normalize_field(text)).split()
+
+
+def _words(text: Optional[str]) -> list[str]:
+    """Palavras significativas: sem `STOPWORDS`, letras soltas ("desenvolvedor(a)") e com o feminino em "-ora" unificado."""
+    words = []
+    for word in _tokens(text):
+        if len(word) < 2 or word in STOPWORDS:
+            continue
+        if len(word) > 5 and word.endswith("ora"):
+            word = word[:-1]  # desenvolvedora -> desenvolvedor
+        words.append(word)
+    return words
+
+
+def title_words(title: Optional[str]) -> list[str]:
+    return sorted(set(_words(title)))
+
+
+def company_key(company: Optional[str]) -> str:
+    return " ".join(word for word in _tokens(company) if word not in COMPANY_SUFFIXES)
+
+
+def required_similarity(first: dict, second: dict, threshold: float, company_threshold: float) -> float:
+    """Similaridade mínima das assinaturas para que dois jobs sejam duplicados.
+
+    Entre empresas diferentes (ou o mesmo job em outro site), vale `threshold`. Para a mesma empresa com títulos
+    semelhantes (republicação com o título ou a descrição levemente editados), basta `company_threshold`.
+
+    Args:
+        first: Job com `title` (de `title_words`) e `company` (de `company_key`).
+        second: Idem, para o outro job.
+    """
+    if not first.get("company") or first.get("company") != second.get("company"):
+        return threshold
+    first_title, second_title = set(first.get("title") or ()), set(second.get("title") or ())
+    if not first_title or len(first_title & second_title) / len(first_title | second_title) < TITLE_THRESHOLD:
+        return threshold
+    return min(threshold, company_threshold)
+
+
+def _shingles(text: str) -> set[str]:
+    words = text.split()
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[index : index + SHINGLE_SIZE]) for index in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def fingerprint(title: Optional[str], company: Optional[str], description: Optional[str]) -> Optional[list[int]]:
+    """Calcula a assinatura MinHash do job a partir do título, empresa e descrição normalizados.
+
+    Returns:
+        A assinatura (`NUM_PERMUTATIONS` inteiros), ou `None` se o job não tem texto.
+    """
+    text = " ".join(word for field in (title, company, description) for word in _words(field))
+    hashes = [_hash(shingle) for shingle in _shingles(text)]
+    if not hashes:
+        return None
+    return [min((a * value + b) % _PRIME for value in hashes) for a, b in _PERMUTATIONS]
+
+
+def bands(signature: list[int]) -> list[str]:
+    """Divide a assinatura em bandas (chaves do índice LSH)."""
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS : (band + 1) * ROWS]
+        keys.append(f"{band}:{hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest()}")
+    return keys
+
+
+def similarity(first: list[int], second: list[int]) -> float:
+    """Estimativa da similaridade de Jaccard entre dois jobs a partir das assinaturas."""
+    return sum(a == b for a, b in zip(first, second)) / NUM_PERMUTATIONS
+
+
+class DedupIndex:
+    """Índice LSH (bandas de MinHash) compartilhado por todos os bots, na coleção `job_db.fingerprints`.
+
+    Cada job gravado registra suas bandas, as palavras do título e a empresa normalizada; um job novo só é
+    comparado com os jobs que colidem em alguma banda ou são da mesma empresa (consultas indexadas), em vez de
+    com todo o acervo. Veja `required_similarity` para os limites de similaridade.
+    """
+
+    def __init__(self, collection, bot: str, threshold: float = 0.7, company_threshold: float = 0.5):
+        self.__collection = collection
+        self.__bot = bot
+        self.__threshold = threshold
+        self.__company_threshold = company_threshold
+
+    async def ensure_index(self):
+        await self.__collection.create_index("bands")
+        await self.__collection.create_index("company")
+
+    async def find_duplicates(self, documents: list[dict]) -> dict[str, str]:
+        """Procura os duplicados de um lote de jobs (no índice e dentro do próprio lote) com uma única consulta.
+
+        Args:
+            documents: Documentos dos jobs, com `_id` e `fingerprint`.
+
+        Returns:
+            O ID no índice (`Bot:id`) do job original, por `_id` dos jobs duplicados.
+        """
+        documents = [document for document in documents if document.get("fingerprint")]
+        if not documents:
+            return {}
+        entries = {document["_id"]: self.__entry(document) for document in documents}
+        own_ids = [self.__key(id) for id in entries]
+        BANDS = [band for entry in entries.values() for band in entry["bands"]]
+        COMPANIES = [*{entry["company"] for entry in entries.values() if entry["company"]}]
+        query = {"$or": [{"bands": {"$in": BANDS}}, {"company": {"$in": COMPANIES}}], "_id": {"$nin": own_ids}}
+        candidates = [candidate async for candidate in self.__collection.find(query, {"signature": 1, "bands": 1, "title": 1, "company": 1})]
+        duplicates = {}
+        for document in documents:
+            entry = entries[document["_id"]]
+            document_bands = set(entry["bands"])
+            best, best_similarity = None, 0.0
+            for candidate in candidates:
+                if document_bands.isdisjoint(candidate["bands"]) and entry["company"] != candidate.get("company"):
+                    continue
+                score = similarity(entry["signature"], candidate["signature"])
+                if score >= required_similarity(entry, candidate, self.__threshold, self.__company_threshold) and score > best_similarity:
+                    best, best_similarity = candidate["_id"], score
+            if best is not None:
+                duplicates[document["_id"]] = best
+            # Jobs seguintes do mesmo lote também são comparados com este
+            candidates.append({"_id": self.__key(document["_id"]), **entry})
+        return duplicates
+
+    async def register(self, documents: list[dict]):
+        """Adiciona ao índice os jobs gravados."""
+        operations = [
+            UpdateOne({"_id": self.__key(document["_id"])}, {"$set": {"bot": self.__bot, "job_id": document["_id"], **self.__entry(document)}}, upsert=True)
+            for document in documents
+            if document.get("fingerprint") and not document.get("duplicate_of")  # O original continua sendo a referência
+        ]
+        if operations:
+            await self.__collection.bulk_write(operations, ordered=False)
+
+    @staticmethod
+    def __entry(document: dict) -> dict:
+        return {
+            "signature": document["fingerprint"],
+            "bands": bands(document["fingerprint"]),
+            "title": title_words(document.get("title")),
+            "company": company_key(document.get("company")),
+        }
+
+    def __key(self, id: str) -> str:
+        return f"{self.__bot}:{id}"
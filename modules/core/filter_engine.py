@@ -0,0 +1,96 @@
+import hashlib
+import json
+import re
+from typing import Optional
+
+from modules.utils import normalize_string
+
+
+def normalize_field(text: Optional[str]) -> str:
+    """Normaliza um campo de texto do job para comparação com os filtros."""
+    if not text:
+        return ""
+    return normalize_string(re.sub(r"\s+", " ", text.lower().strip()))
+
+
+def _compile_keywords(keywords: list[str]) -> Optional[re.Pattern]:
+    """Compila uma lista de palavras-chave em uma única alternância delimitada por `\\b`.
+
+    As palavras maiores vêm primeiro para que frases ("ingles avancado") tenham
+    prioridade sobre seus prefixos ("ingles").
+    """
+    words = sorted({normalize_field(word) for word in keywords if word}, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile(rf"\b(?:{'|'.join(map(re.escape, words))})\b", re.IGNORECASE)
+
+
+def _pattern(pattern: Optional[re.Pattern]) -> Optional[str]:
+    return pattern.pattern if pattern is not None else None
+
+
+class CompiledJobFilter:
+    """Versão pré-compilada de um `JobFilter`."""
+
+    __slots__ = ("key", "full_match", "_include", "_include_all", "_exclude")
+
+    def __init__(self, job_filter):
+        self.key: str = job_filter.key
+        self.full_match: bool = job_filter.full_match
+        keywords = job_filter.keywords or []
+        self._include: Optional[re.Pattern] = None
+        self._include_all: list[re.Pattern] = []
+        if self.full_match:
+            # Com full_match TODAS as palavras precisam estar presentes, então cada uma mantém seu padrão
+            self._include_all = [pattern for pattern in (_compile_keywords([word]) for word in keywords) if pattern is not None]
+        else:
+            self._include = _compile_keywords(keywords)
+        self._exclude: Optional[re.Pattern] = _compile_keywords(job_filter.exclude_keywords or [])
+
+    def match(self, text: str) -> bool:
+        """Verifica um texto já normalizado com `normalize_field`."""
+        if self._include is not None and self._include.search(text) is None:
+            return False
+        if self._include_all and not all(pattern.search(text) for pattern in self._include_all):
+            return False
+        return self._exclude is None or self._exclude.search(text) is None
+
+
+class FilterEngine:
+    """Conjunto de filtros compilados uma única vez na inicialização do bot."""
+
+    def __init__(self, filters: Optional[list] = None):
+        self.__filters = [CompiledJobFilter(job_filter) for job_filter in filters or []]
+        rules = [
+            [job_filter.key, job_filter.full_match, _pattern(job_filter._include), [*map(_pattern, job_filter._include_all)], _pattern(job_filter._exclude)]
+            for job_filter in self.__filters
+        ]
+        self.__digest = hashlib.sha256(json.dumps(rules).encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return len(self.__filters)
+
+    @property
+    def digest(self) -> str:
+        """Identifica as regras dos filtros: filtros equivalentes (mesmas palavras normalizadas) têm o mesmo digest."""
+        return self.__digest
+
+    def first_failure(self, job, keys: Optional[set[str]] = None) -> Optional[int]:
+        """Retorna o número (a partir de 1) do primeiro filtro reprovado, ou `None` se o job passou em todos.
+
+        Cada campo do job é normalizado no máximo uma vez, mesmo que vários filtros usem a mesma chave.
+
+        Args:
+            job: Job a ser verificado.
+            keys: Se informado, apenas os filtros dessas chaves são aplicados (ex.: campos disponíveis no card da listagem).
+        """
+        fields: dict[str, str] = {}
+        for index, job_filter in enumerate(self.__filters, start=1):
+            if keys is not None and job_filter.key not in keys:
+                continue
+            text = fields.get(job_filter.key)
+            if text is None:
+                text = fields[job_filter.key] = normalize_field(getattr(job, job_filter.key, None))
+            if not job_filter.match(text):
+                return index
+        return None
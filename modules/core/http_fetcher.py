@@ -0,0 +1,69 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules.core.job import Job
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+}
+
+
+class HttpDetailFetcher:
+    """Baixa as páginas de detalhes dos jobs sem navegador, com conexões keep-alive reaproveitadas.
+
+    As requisições são feitas por um pool de threads limitado a `concurrency` requisições simultâneas,
+    todas compartilhando a mesma `requests.Session` (e, portanto, o mesmo pool de conexões por host).
+    """
+
+    def __init__(self, concurrency: int = 8, timeout: float = 15):
+        self.__concurrency = concurrency
+        self.__timeout = timeout
+        self.__session = requests.Session()
+        self.__session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency, max_retries=2)
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+        self.__executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="http-fetcher")
+
+    def set_user_agent(self, user_agent: str):
+        self.__session.headers["User-Agent"] = user_agent
+
+    def set_cookies(self, cookies):
+        """Copia os cookies do navegador para a sessão (objetos com `name`, `value` e `domain`)."""
+        for cookie in cookies:
+            self.__session.cookies.set(cookie.name, cookie.value, domain=cookie.domain)
+
+    def fetch(self, url: str) -> Optional[str]:
+        """Baixa a página. Retorna `None` se a vaga não existe mais (404/410)."""
+        response = self.__session.get(url, timeout=self.__timeout)
+        if response.status_code in (404, 410):
+            return None
+        response.raise_for_status()
+        return response.text
+
+    async def map(self, jobs: list[Job]) -> AsyncIterator[tuple[Job, Optional[str], Optional[Exception]]]:
+        """Baixa as páginas de detalhes dos jobs em paralelo.
+
+        Yields:
+            Tuplas (job, html, erro) na ordem em que os downloads terminam.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def download(job: Job):
+            try:
+                return job, await loop.run_in_executor(self.__executor, self.fetch, job.url), None
+            except Exception as err:
+                return job, None, err
+
+        for future in asyncio.as_completed([download(job) for job in jobs]):
+            yield await future
+
+    def close(self):
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        self.__session.close()
@@ -2,8 +2,9 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
+    # Sem __dict__ por instância: os jobs ficam em memória no buffer e na fila de escrita até serem gravados
     id: str
     url: str = None
     title: str = None
@@ -11,3 +12,5 @@ class Job:
     location: str = None
     company: str = None
     posted_at: datetime = None
+    fingerprint: list[int] = None  # Assinatura MinHash (título, empresa e descrição) para detectar duplicados
+    duplicate_of: str = None  # Job original (`Bot:id`) quando este é um quase-duplicado
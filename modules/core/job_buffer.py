@@ -0,0 +1,93 @@
+import sys
+from dataclasses import fields
+from typing import Iterator
+
+from modules.core.job import Job
+
+# Campos com poucos valores distintos entre os jobs: uma única cópia de cada texto é mantida em memória
+INTERNED_FIELDS = ("company", "location")
+
+
+def job_size(job: Job) -> int:
+    """Estimativa (bytes) da memória ocupada pelo job, incluindo os textos, listas e dicionários dos campos."""
+    return sys.getsizeof(job) + sum(_value_size(getattr(job, field.name)) for field in fields(job))
+
+
+def _value_size(value) -> int:
+    if value is None or isinstance(value, (bool, int, float)):
+        return 0  # Objetos compartilhados ou pequenos o bastante para não pesar na estimativa
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_value_size(key) + _value_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(_value_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class JobBuffer:
+    """Jobs extraídos que aguardam o envio para a gravação, com limite de quantidade e de memória.
+
+    Os textos de `INTERNED_FIELDS` são internados (`sys.intern`), então jobs da mesma empresa ou localização
+    compartilham a string. `add` indica quando o buffer passou de `max_jobs` jobs ou `max_bytes` bytes
+    (estimados); nesse caso o bot envia os jobs para a gravação sem esperar o fim da página.
+    """
+
+    def __init__(self, max_jobs: int = 0, max_bytes: int = 0):
+        self.__max_jobs = max_jobs
+        self.__max_bytes = max_bytes
+        self.__jobs: dict[str, Job] = {}
+        self.__bytes = 0
+        self.__peak_jobs = 0
+        self.__peak_bytes = 0
+        self.__flushes = 0  # Envios antecipados por limite atingido
+
+    def __len__(self) -> int:
+        return len(self.__jobs)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.__jobs
+
+    def __iter__(self) -> Iterator[Job]:
+        return iter(self.__jobs.values())
+
+    @property
+    def bytes(self) -> int:
+        return self.__bytes
+
+    @property
+    def peak_jobs(self) -> int:
+        return self.__peak_jobs
+
+    @property
+    def peak_bytes(self) -> int:
+        return self.__peak_bytes
+
+    @property
+    def flushes(self) -> int:
+        return self.__flushes
+
+    def add(self, job: Job) -> bool:
+        """Adiciona o job (se o ID ainda não está no buffer).
+
+        Returns:
+            True se o buffer atingiu o limite de jobs ou de memória e deve ser esvaziado.
+        """
+        if job.id not in self.__jobs:
+            for name in INTERNED_FIELDS:
+                value = getattr(job, name)
+                if isinstance(value, str):
+                    setattr(job, name, sys.intern(value))
+            self.__jobs[job.id] = job
+            self.__bytes += job_size(job)
+            self.__peak_jobs = max(self.__peak_jobs, len(self.__jobs))
+            self.__peak_bytes = max(self.__peak_bytes, self.__bytes)
+        full = (self.__max_jobs and len(self.__jobs) >= self.__max_jobs) or (self.__max_bytes and self.__bytes >= self.__max_bytes)
+        if full:
+            self.__flushes += 1
+        return bool(full)
+
+    def drain(self) -> list[Job]:
+        """Remove e retorna os jobs do buffer, na ordem em que foram adicionados."""
+        jobs = list(self.__jobs.values())
+        self.__jobs.clear()
+        self.__bytes = 0
+        return jobs
@@ -0,0 +1,27 @@
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.collation import Collation
+
+# Comparação sem diferenciar maiúsculas nem acentos ("Itaú" == "itau"), usada nas consultas por empresa e localização
+TEXT_COLLATION = Collation(locale="pt", strength=1)
+
+JOB_INDEXES = [
+    IndexModel([("created_at", DESCENDING)], name="created_at"),
+    IndexModel([("updated_at", DESCENDING)], name="updated_at"),
+    IndexModel([("company", ASCENDING), ("created_at", DESCENDING)], name="company_created_at", collation=TEXT_COLLATION),
+    IndexModel([("location", ASCENDING), ("created_at", DESCENDING)], name="location_created_at", collation=TEXT_COLLATION),
+    IndexModel(
+        [("title", TEXT), ("description", TEXT)],
+        name="text",
+        weights={"title": 5, "description": 1},  # Palavras no título valem mais na ordenação por relevância
+        default_language="portuguese",
+    ),
+]
+
+
+async def ensure_job_indexes(collection) -> list[str]:
+    """Cria os índices da coleção de jobs de um bot. Índices já existentes com a mesma definição são mantidos.
+
+    Returns:
+        Os nomes dos índices.
+    """
+    return await collection.create_indexes(JOB_INDEXES)
@@ -0,0 +1,102 @@
+import gzip
+import json
+import os
+import zlib
+from datetime import datetime
+from typing import Iterator, Optional
+
+from modules.utils.json_handler import default_serializer, json_object_hook
+
+
+class JobSpool:
+    """Spool local (append-only, em segmentos JSONL) dos jobs que não puderam ser gravados no banco.
+
+    Cada segmento recebe documentos até atingir `segment_size` bytes (sem compressão); depois um novo
+    segmento é aberto. A sincronização com o disco (fsync) é feita a cada `fsync_every` documentos, em
+    vez de a cada escrita. Os segmentos são regravados no banco pelo `JobBot._setup` e então removidos.
+    """
+
+    def __init__(self, dir_path: str, compress: bool = True, segment_size: int = 16 * 1024 * 1024, fsync_every: int = 100):
+        self.__dir_path = dir_path
+        self.__compress = compress
+        self.__segment_size = segment_size
+        self.__fsync_every = fsync_every
+        self.__raw = None
+        self.__file = None
+        self.__segment: Optional[str] = None
+        self.__segment_bytes = 0
+        self.__pending_sync = 0
+        self.__sequence = 0
+
+    @property
+    def dir_path(self):
+        return self.__dir_path
+
+    def segments(self) -> list[str]:
+        """Segmentos já fechados, do mais antigo para o mais novo."""
+        if not os.path.isdir(self.__dir_path):
+            return []
+        names = sorted(name for name in os.listdir(self.__dir_path) if name.endswith((".jsonl", ".jsonl.gz")))
+        return [os.path.join(self.__dir_path, name) for name in names if os.path.join(self.__dir_path, name) != self.__segment]
+
+    def append(self, documents: list[dict]):
+        if not documents:
+            return
+        if self.__file is None or self.__segment_bytes >= self.__segment_size:
+            self.__open_segment()
+        data = "".join(json.dumps(document, default=default_serializer, ensure_ascii=False) + "\n" for document in documents)
+        data = data.encode("utf-8")
+        self.__file.write(data)
+        self.__segment_bytes += len(data)
+        self.__pending_sync += len(documents)
+        if self.__pending_sync >= self.__fsync_every:
+            self.sync()
+
+    def sync(self):
+        if self.__file is None or self.__pending_sync == 0:
+            return
+        if self.__compress:
+            self.__file.flush(zlib.Z_SYNC_FLUSH)
+        self.__raw.flush()
+        os.fsync(self.__raw.fileno())
+        self.__pending_sync = 0
+
+    def read(self, segment: str, batch_size: int = 500) -> Iterator[list[dict]]:
+        """Lê um segmento em lotes. Um final truncado (queda durante a escrita) é ignorado."""
+        opener = gzip.open if segment.endswith(".gz") else open
+        batch = []
+        with opener(segment, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    batch.append(json.loads(line, object_hook=json_object_hook))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+            except (EOFError, gzip.BadGzipFile, zlib.error):
+                pass
+        if batch:
+            yield batch
+
+    def remove(self, segment: str):
+        os.remove(segment)
+
+    def close(self):
+        if self.__file is None:
+            return
+        self.sync()
+        self.__file.close()
+        if self.__compress:
+            self.__raw.close()
+        self.__raw = self.__file = self.__segment = None
+
+    def __open_segment(self):
+        self.close()
+        os.makedirs(self.__dir_path, exist_ok=True)
+        self.__sequence += 1
+        name = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{os.getpid()}_{self.__sequence:04d}.jsonl"
+        self.__segment = os.path.join(self.__dir_path, f"{name}.gz" if self.__compress else name)
+        self.__raw = open(self.__segment, "ab")
+        self.__file = gzip.GzipFile(fileobj=self.__raw, mode="ab") if self.__compress else self.__raw
+        self.__segment_bytes = 0
@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, fields
+from typing import Awaitable, Callable, Optional
+
+from modules.core.job import Job
+
+_STOP = object()
+
+
+def job_to_document(job: Job) -> dict:
+    """Converte o job em documento do banco sem cópias profundas (os campos não são alterados depois de salvos)."""
+    document = {field.name: getattr(job, field.name) for field in fields(job)}
+    document["_id"] = document.pop("id")
+    return document
+
+
+# Campos que não descrevem a vaga (identificação, datas relativas à coleta, controle e deduplicação)
+NON_CONTENT_FIELDS = frozenset(
+    {"_id", "posted_at", "fingerprint", "duplicate_of", "content_hash", "created_at", "updated_at", "seen_at", "extracted_at", "history"}
+)
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def content_hash(document: dict) -> str:
+    """Hash do conteúdo da vaga (campos normalizados, sem os de controle), usado para detectar alterações."""
+    content = {key: _normalize(value) for key, value in document.items() if key not in NON_CONTENT_FIELDS and value is not None}
+    data = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def changed_fields(previous: dict, document: dict) -> list[str]:
+    """Campos de conteúdo com valores (normalizados) diferentes entre a versão gravada e a nova."""
+    keys = (previous.keys() | document.keys()) - NON_CONTENT_FIELDS
+    return sorted(key for key in keys if _normalize(previous.get(key)) != _normalize(document.get(key)))
+
+
+@dataclass
+class JobWriterStats:
+    batches: int = 0
+    jobs: int = 0
+    backpressure_waits: int = 0  # Quantas vezes o scraping aguardou a fila esvaziar
+    backpressure_time: float = 0  # Tempo total (s) que o scraping ficou aguardando a fila
+
+
+class JobWriter:
+    """Persistência em segundo plano (write-behind) dos jobs extraídos.
+
+    Os jobs entram em uma fila limitada e uma task os grava em lotes, quando o lote atinge `batch_size`
+    ou quando o job mais antigo do lote está há `max_age` segundos esperando. Assim a escrita no banco
+    acontece em paralelo com a navegação, e só bloqueia o scraping quando a fila está cheia.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[Job]], Awaitable[None]],
+        logger: logging.Logger,
+        batch_size: int = 50,
+        max_age: float = 5,
+        max_queue: int = 500,
+    ):
+        self.__write = write
+        self.__logger = logger
+        self.__batch_size = batch_size
+        self.__max_age = max_age
+        self.__queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.__task: Optional[asyncio.Task] = None
+        self.stats = JobWriterStats()
+
+    @property
+    def running(self) -> bool:
+        return self.__task is not None and not self.__task.done()
+
+    def start(self):
+        if not self.running:
+            self.__task = asyncio.create_task(self.__run())
+
+    async def put(self, job: Job):
+        if self.__queue.full():
+            start_time = time.perf_counter()
+            await self.__queue.put(job)
+            self.stats.backpressure_waits += 1
+            self.stats.backpressure_time += time.perf_counter() - start_time
+            return
+        self.__queue.put_nowait(job)
+
+    async def close(self):
+        """Grava todos os jobs pendentes e encerra a task."""
+        if not self.running:
+            return
+        await self.__queue.put(_STOP)
+        await self.__task
+        self.__task = None
+
+    async def __run(self):
+        loop = asyncio.get_running_loop()
+        batch: list[Job] = []
+        deadline = 0
+        while True:
+            timeout = max(0, deadline - loop.time()) if batch else None
+            try:
+                item = await asyncio.wait_for(self.__queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = None
+            if item is _STOP:
+                break
+            if item is not None:
+                if not batch:
+                    deadline = loop.time() + self.__max_age
+                batch.append(item)
+            if batch and (len(batch) >= self.__batch_size or loop.time() >= deadline):
+                await self.__flush(batch)
+                batch = []
+        if batch:
+            await self.__flush(batch)
+
+    async def __flush(self, batch: list[Job]):
+        try:
+            await self.__write(batch)
+        except Exception as err:
+            self.__logger.error(f"Erro inesperado ao gravar lote de jobs: {err}", exc_info=True)
+        self.stats.batches += 1
+        self.stats.jobs += len(batch)
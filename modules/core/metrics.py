@@ -0,0 +1,193 @@
+import asyncio
+import json
+import math
+import os
+from bisect import bisect_left
+from datetime import datetime
+from typing import Callable, Optional
+
+# Limites (em segundos) dos histogramas de latência: de operações locais (filtros) até esperas longas (captcha)
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # O último é o +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip((*self.buckets, math.inf), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """Contadores, gauges e histogramas de latência identificados por nome e labels (ex.: bot, pesquisa, fase).
+
+    Os nomes recebem o prefixo `prefix` na exportação. Contadores devem terminar em `_total` e histogramas
+    de tempo em `_seconds`, como nas convenções do Prometheus.
+    """
+
+    def __init__(self, prefix: str = "jobot", buckets: tuple[float, ...] = BUCKETS):
+        self.__prefix = prefix
+        self.__buckets = buckets
+        self.__counters: dict[str, dict[Labels, float]] = {}
+        self.__gauges: dict[str, dict[Labels, float]] = {}
+        self.__histograms: dict[str, dict[Labels, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        series = self.__counters.setdefault(name, {})
+        key = self.__key(labels)
+        series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        self.__gauges.setdefault(name, {})[self.__key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        series = self.__histograms.setdefault(name, {})
+        key = self.__key(labels)
+        if key not in series:
+            series[key] = Histogram(self.__buckets)
+        series[key].observe(value)
+
+    def snapshot(self) -> dict:
+        """Estado atual das métricas em um formato serializável em JSON."""
+        return {
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "counters": {self.__name(name): self.__values(series) for name, series in self.__counters.items()},
+            "gauges": {self.__name(name): self.__values(series) for name, series in self.__gauges.items()},
+            "histograms": {
+                self.__name(name): [
+                    {
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": round(histogram.sum, 6),
+                        "average": round(histogram.sum / histogram.count, 6) if histogram.count else 0,
+                        "max": round(histogram.max, 6),
+                        "buckets": {_format_bound(bound): count for bound, count in histogram.cumulative()},
+                    }
+                    for labels, histogram in series.items()
+                ]
+                for name, series in self.__histograms.items()
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Métricas no formato texto de exposição do Prometheus."""
+        lines = []
+        for kind, metrics in (("counter", self.__counters), ("gauge", self.__gauges)):
+            for name, series in metrics.items():
+                name = self.__name(name)
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in series.items())
+        for name, series in self.__histograms.items():
+            name = self.__name(name)
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in series.items():
+                for bound, count in histogram.cumulative():
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', _format_bound(bound)),))} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def __name(self, name: str) -> str:
+        return f"{self.__prefix}_{name}" if self.__prefix else name
+
+    @staticmethod
+    def __key(labels: dict) -> Labels:
+        return tuple(sorted((key, "" if value is None else str(value)) for key, value in labels.items()))
+
+    @staticmethod
+    def __values(series: dict[Labels, float]) -> list[dict]:
+        return [{"labels": dict(labels), "value": value} for labels, value in series.items()]
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else f"{bound:g}"
+
+
+def _format_value(value: float) -> str:
+    return f"{value:.6f}".rstrip("0").rstrip(".") if isinstance(value, float) else str(value)
+
+
+class MetricsExporter:
+    """Grava periodicamente as métricas em `<path>.json` e `<path>.prom` enquanto o bot executa.
+
+    O arquivo `.prom` segue o formato texto do Prometheus e pode ser coletado pelo textfile collector do
+    node_exporter. As gravações são atômicas (arquivo temporário + `os.replace`), então um leitor nunca vê
+    um arquivo pela metade.
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 15, collect: Optional[Callable[[], None]] = None):
+        self.__registry = registry
+        self.__path = path
+        self.__interval = interval
+        self.__collect = collect  # Atualiza os gauges (ex.: chamadas ao navegador) antes de cada gravação
+        self.__task: Optional[asyncio.Task] = None
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def start(self):
+        if self.__task is None and self.__interval > 0:
+            self.__task = asyncio.create_task(self.__run())
+
+    async def close(self):
+        """Encerra a gravação periódica e grava o estado final."""
+        if self.__interval <= 0:
+            return
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+        self.write()
+
+    def write(self):
+        if self.__collect is not None:
+            self.__collect()
+        os.makedirs(os.path.dirname(self.__path) or ".", exist_ok=True)
+        _write_atomic(f"{self.__path}.json", json.dumps(self.__registry.snapshot(), ensure_ascii=False, indent=2))
+        _write_atomic(f"{self.__path}.prom", self.__registry.to_prometheus())
+
+    async def __run(self):
+        while True:
+            await asyncio.sleep(self.__interval)
+            try:
+                self.write()
+            except OSError:
+                pass  # Disco cheio ou sem permissão: tenta novamente na próxima gravação
+
+
+def _write_atomic(file_path: str, content: str):
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, file_path)
@@ -0,0 +1,107 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+MODES = ("cprofile", "sample")
+TOP_FUNCTIONS = 30  # Funções listadas no resumo
+
+
+class Profiler:
+    """Perfil de CPU opcional da execução de um bot (variável de ambiente `BOT_PROFILE`).
+
+    Modos:
+        cprofile: perfil determinístico (`cProfile`). Gera `<arquivo>.prof` (abra com `snakeviz` ou `pstats`).
+        sample: amostragem da pilha da thread do bot a cada `BOT_PROFILE_INTERVAL` segundos (padrão: 5ms), com
+            custo baixo o bastante para execuções em produção. Gera `<arquivo>.folded` (pilhas no formato do
+            `flamegraph.pl`, também aceito pelo speedscope).
+
+    Nos dois modos também é gerado `<arquivo>_profile.txt`, com as funções de maior tempo próprio (self time).
+    Apenas a thread que iniciou o perfil (a do loop do asyncio) é medida: as chamadas ao navegador rodam
+    na thread do `AsyncDriver` e aparecem como espera.
+    """
+
+    def __init__(self, mode: str, dir_path: str, name: str, interval: float = 0.005):
+        if mode not in MODES:
+            raise ValueError(f"Modo de perfil inválido: {mode}. Opções: {', '.join(MODES)}")
+        self.__mode = mode
+        self.__file_path = os.path.join(dir_path, f"{name}_{datetime.now().strftime('%d_%m_%Y_%H_%M_%S')}")
+        self.__interval = interval
+        self.__profile: Optional[cProfile.Profile] = None
+        self.__samples: Counter[tuple[str, ...]] = Counter()
+        self.__sampler: Optional[threading.Thread] = None
+        self.__stopped = threading.Event()
+
+    @classmethod
+    def from_env(cls, dir_path: str, name: str) -> Optional["Profiler"]:
+        """Cria o perfil configurado em `BOT_PROFILE`, ou retorna `None` se ele está desativado."""
+        mode = os.getenv("BOT_PROFILE", "").strip().lower()
+        if mode in ("", "0", "false", "off"):
+            return None
+        return cls(mode, dir_path, name, float(os.getenv("BOT_PROFILE_INTERVAL", 0.005)))
+
+    @property
+    def mode(self) -> str:
+        return self.__mode
+
+    def start(self):
+        if self.__mode == "cprofile":
+            self.__profile = cProfile.Profile()
+            self.__profile.enable()
+            return
+        self.__stopped.clear()
+        target = threading.get_ident()
+        self.__sampler = threading.Thread(target=self.__sample, args=(target,), name="profiler", daemon=True)
+        self.__sampler.start()
+
+    def stop(self) -> list[str]:
+        """Encerra o perfil e grava os arquivos.
+
+        Returns:
+            Os caminhos dos arquivos gerados.
+        """
+        os.makedirs(os.path.dirname(self.__file_path) or ".", exist_ok=True)
+        summary_path = f"{self.__file_path}_profile.txt"
+        if self.__mode == "cprofile":
+            self.__profile.disable()
+            profile_path = f"{self.__file_path}.prof"
+            self.__profile.dump_stats(profile_path)
+            stream = io.StringIO()
+            pstats.Stats(self.__profile, stream=stream).sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+            summary = stream.getvalue()
+        else:
+            self.__stopped.set()
+            self.__sampler.join()
+            profile_path = f"{self.__file_path}.folded"
+            with open(profile_path, "w", encoding="utf-8") as f:
+                f.writelines(f"{';'.join(stack)} {count}\n" for stack, count in self.__samples.most_common())
+            summary = self.__sample_summary()
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(summary)
+        return [profile_path, summary_path]
+
+    def __sample(self, target: int):
+        while not self.__stopped.wait(self.__interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.__samples[tuple(reversed(stack))] += 1
+
+    def __sample_summary(self) -> str:
+        TOTAL = sum(self.__samples.values())
+        self_time: Counter[str] = Counter()
+        for stack, count in self.__samples.items():
+            self_time[stack[-1]] += count
+        lines = [f"Amostras: {TOTAL} (intervalo: {self.__interval * 1000:g}ms)", "", f"{'Amostras':>9} {'%':>6}  Função (tempo próprio)"]
+        for function, count in self_time.most_common(TOP_FUNCTIONS):
+            lines.append(f"{count:>9} {count / TOTAL * 100 if TOTAL else 0:>5.1f}%  {function}")
+        return "\n".join(lines) + "\n"
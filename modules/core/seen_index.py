@@ -0,0 +1,98 @@
+import heapq
+import mmap
+import os
+from typing import Iterable
+
+
+class SeenIndex:
+    """Índice local dos IDs de jobs já salvos por um bot.
+
+    Os IDs ficam em um arquivo ordenado (um ID por linha) que é mapeado em memória e consultado
+    por busca binária. Os IDs novos são anexados a um journal e incorporados ao arquivo ordenado
+    em `compact()`, evitando reescrever o índice inteiro a cada página salva.
+    """
+
+    def __init__(self, dir_path: str):
+        self.__path = os.path.join(dir_path, "seen_ids.idx")
+        self.__journal_path = os.path.join(dir_path, "seen_ids.log")
+        self.__file = None
+        self.__mmap: mmap.mmap | None = None
+        self.__size = 0
+        self.__added: set[str] = set()
+
+    def __len__(self):
+        return self.__size + len(self.__added)
+
+    def __contains__(self, id: str):
+        return id in self.__added or self.__search(id.encode("utf-8"))
+
+    def load(self):
+        """Mapeia o índice ordenado e carrega o journal pendente."""
+        os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+        self.__unmap()
+        if os.path.exists(self.__path) and os.path.getsize(self.__path) > 0:
+            self.__file = open(self.__path, "rb")
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__size = self.__mmap[:].count(b"\n")
+        self.__added.clear()
+        if os.path.exists(self.__journal_path):
+            with open(self.__journal_path, "r", encoding="utf-8") as f:
+                self.__added.update(line for line in f.read().splitlines() if line)
+            self.__added.difference_update([id for id in self.__added if self.__search(id.encode("utf-8"))])
+
+    def add(self, ids: Iterable[str]):
+        """Registra novos IDs no journal (persistido imediatamente)."""
+        new_ids = [id for id in ids if id not in self]
+        if not new_ids:
+            return
+        with open(self.__journal_path, "a", encoding="utf-8") as f:
+            f.write("".join(f"{id}\n" for id in new_ids))
+        self.__added.update(new_ids)
+
+    def compact(self):
+        """Incorpora o journal ao arquivo ordenado e remapeia o índice."""
+        if not self.__added:
+            return
+        tmp_path = f"{self.__path}.tmp"
+        added = sorted(id.encode("utf-8") for id in self.__added)
+        with open(tmp_path, "wb") as f:
+            existing = iter(self.__mmap[:].splitlines()) if self.__mmap is not None else iter(())
+            for id in heapq.merge(existing, added):
+                f.write(id + b"\n")
+        self.__unmap()
+        os.replace(tmp_path, self.__path)
+        if os.path.exists(self.__journal_path):
+            os.remove(self.__journal_path)
+        self.load()
+
+    def close(self):
+        self.__unmap()
+
+    def __unmap(self):
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        self.__size = 0
+
+    def __search(self, key: bytes) -> bool:
+        if self.__mmap is None:
+            return False
+        data = self.__mmap
+        low, high = 0, len(data)
+        while low < high:
+            middle = (low + high) // 2
+            start = data.rfind(b"\n", 0, middle) + 1
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = len(data)
+            line = data[start:end]
+            if line == key:
+                return True
+            if line < key:
+                low = end + 1
+            else:
+                high = start
+        return False
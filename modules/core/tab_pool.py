@@ -0,0 +1,101 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from modules.core.async_driver import AsyncDriver
+from modules.core.job import Job
+
+
+class TabPool:
+    """Pool de abas extras no mesmo navegador para extrair os detalhes dos jobs em paralelo.
+
+    A aba da listagem continua responsável apenas pela paginação. Cada aba do pool recebe a URL
+    de um job e começa a carregá-la imediatamente, de forma que até `size` páginas de detalhes
+    carregam ao mesmo tempo enquanto a extração acontece na aba que já terminou de carregar.
+    `on_open` é chamado com cada aba criada (ex.: para instalar a detecção de captcha).
+    """
+
+    def __init__(self, driver: AsyncDriver, size: int, load_timeout: int = 30, on_open: Optional[Callable[[Any], Awaitable]] = None):
+        self.__driver = driver
+        self.__size = size
+        self.__load_timeout = load_timeout
+        self.__on_open = on_open
+        self.__home = None
+        self.__tabs = []
+
+    @property
+    def size(self):
+        return self.__size
+
+    async def open(self):
+        if self.__tabs:
+            return
+        cdp = self.__driver.cdp
+        self.__home = await cdp.get_active_tab()
+        for _ in range(self.__size):
+            await cdp.open_new_tab(switch_to=False)
+        self.__tabs = [tab for tab in await cdp.get_tabs() if tab is not self.__home][: self.__size]
+        if self.__on_open is not None:
+            for tab in self.__tabs:
+                await self.__on_open(tab)
+        await cdp.switch_to_tab(self.__home)
+
+    async def close(self):
+        cdp = self.__driver.cdp
+        for tab in self.__tabs:
+            try:
+                await cdp.switch_to_tab(tab)
+                await cdp.close_active_tab()
+            except Exception:
+                pass
+        self.__tabs = []
+        if self.__home is not None:
+            await cdp.switch_to_tab(self.__home)
+
+    async def map(self, jobs: list[Job], extract: Callable[[Job], Awaitable[bool]]) -> AsyncIterator[tuple[Job, bool]]:
+        """Extrai os jobs usando as abas do pool, mantendo todas elas carregando páginas.
+
+        Args:
+            jobs: Jobs com a URL da página de detalhes preenchida.
+            extract: Corrotina que extrai os dados do job na aba ativa.
+
+        Yields:
+            Tuplas (job, sucesso) na ordem em que as extrações terminam.
+        """
+        await self.open()
+        queue = deque(jobs)
+        in_flight = deque()
+        try:
+            for tab in self.__tabs:
+                if not queue:
+                    break
+                job = queue.popleft()
+                await self.__navigate(tab, job)
+                in_flight.append((tab, job))
+            while in_flight:
+                tab, job = in_flight.popleft()
+                await self.__driver.cdp.switch_to_tab(tab)
+                success = await self.__wait_loaded(job) and await extract(job)
+                if queue:
+                    next_job = queue.popleft()
+                    await self.__navigate(tab, next_job)
+                    in_flight.append((tab, next_job))
+                yield job, success
+        finally:
+            await self.__driver.cdp.switch_to_tab(self.__home)
+
+    async def __navigate(self, tab, job: Job):
+        """Inicia a navegação sem aguardar o carregamento da página."""
+        await self.__driver.cdp.switch_to_tab(tab)
+        await self.__driver.cdp.evaluate(f"window.location.assign({json.dumps(job.url)})")
+
+    async def __wait_loaded(self, job: Job) -> bool:
+        """Aguarda a aba ativa terminar de carregar a página do job (e não a anterior)."""
+        deadline = time.time() + self.__load_timeout
+        while time.time() < deadline:
+            if job.id in await self.__driver.cdp.get_current_url() and await self.__driver.cdp.evaluate("document.readyState") == "complete":
+                return True
+            await asyncio.sleep(0.1)
+        return False
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class WaitStat:
+    count: int = 0
+    total: float = 0
+    max: float = 0
+    timeouts: int = 0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0
+
+
+class WaitStats:
+    """Registra quanto tempo cada tipo de espera realmente levou durante a execução."""
+
+    def __init__(self):
+        self.__stats: dict[str, WaitStat] = {}
+
+    def __getitem__(self, name: str) -> WaitStat:
+        return self.__stats[name]
+
+    def __iter__(self):
+        return iter(self.__stats.items())
+
+    def record(self, name: str, duration: float, ready: bool):
+        stat = self.__stats.setdefault(name, WaitStat())
+        stat.count += 1
+        stat.total += duration
+        stat.max = max(stat.max, duration)
+        if not ready:
+            stat.timeouts += 1
+
+    def summary(self) -> str:
+        lines = []
+        for name, stat in sorted(self.__stats.items(), key=lambda item: item[1].total, reverse=True):
+            lines.append(
+                f"{name}: {stat.count}x | total: {stat.total:.2f}s | média: {stat.average:.2f}s | máx: {stat.max:.2f}s | timeouts: {stat.timeouts}"
+            )
+        return "\n".join(lines)
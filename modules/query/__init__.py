@@ -0,0 +1 @@
+from .job_query import DEFAULT_PROJECTION, JobQuery
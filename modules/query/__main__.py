@@ -0,0 +1,83 @@
+"""Consulta os jobs gravados pelos bots. Cada resultado é impresso como uma linha JSON.
+
+Uso:
+    python -m modules.query new --since 2h
+    python -m modules.query company "Itaú" --since 2025-07-01 --bots indeedbot linkedinbot
+    python -m modules.query search "java -senior" --limit 20 --fields title company url description
+    python -m modules.query indexes
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from pymongo import AsyncMongoClient
+
+from modules.core.job_indexes import ensure_job_indexes
+from modules.query.job_query import JobQuery
+from modules.utils import default_serializer, get_db_host, get_db_name
+
+UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_since(value: str) -> datetime:
+    """Data ISO (`2025-07-01`, `2025-07-01T08:00`) ou tempo relativo (`30m`, `2h`, `7d`, `1w`)."""
+    match = re.fullmatch(r"(\d+)([mhdw])", value.strip())
+    if match:
+        return datetime.now() - timedelta(**{UNITS[match.group(2)]: int(match.group(1))})
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Data inválida: {value}. Use uma data ISO ou um tempo relativo (30m, 2h, 7d, 1w).")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Consulta os jobs gravados pelos bots.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--bots", nargs="*", help="Bots consultados (padrão: todos)")
+    common.add_argument("--limit", type=int, default=0, help="Quantidade máxima de resultados (padrão: sem limite)")
+    common.add_argument("--fields", nargs="*", help="Campos retornados (padrão: todos, exceto descrição e assinatura)")
+    common.add_argument("--since", type=parse_since, help="Data ISO ou tempo relativo (ex.: 2h, 7d)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("new", parents=[common], help="Jobs gravados a partir de --since (obrigatório)")
+    commands.add_parser("company", parents=[common], help="Jobs de uma empresa").add_argument("company")
+    commands.add_parser("location", parents=[common], help="Jobs de uma localização").add_argument("location")
+    commands.add_parser("search", parents=[common], help="Busca por palavras no título e na descrição").add_argument("keywords")
+    commands.add_parser("indexes", parents=[common], help="Cria os índices das coleções de jobs")
+    args = parser.parse_args()
+    if args.command == "new" and args.since is None:
+        parser.error("o comando new exige --since")
+    return args
+
+
+async def main(args):
+    client = AsyncMongoClient(get_db_host())
+    database = client[get_db_name()]
+    try:
+        query = JobQuery(database, bots=args.bots)
+        if args.command == "indexes":
+            for name in await query.collections():
+                print(f"{name}: {', '.join(await ensure_job_indexes(database[name]))}")
+            return
+        projection = {field: 1 for field in args.fields} if args.fields else None
+        if args.command == "new":
+            results = query.new_since(args.since, args.limit, projection)
+        elif args.command == "company":
+            results = query.by_company(args.company, args.since, args.limit, projection)
+        elif args.command == "location":
+            results = query.by_location(args.location, args.since, args.limit, projection)
+        else:
+            results = query.search(args.keywords, args.since, args.limit, projection)
+        async for document in results:
+            sys.stdout.write(json.dumps(document, default=default_serializer, ensure_ascii=False) + "\n")
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,112 @@
+import heapq
+from datetime import datetime
+from typing import AsyncIterator, Callable, Optional
+
+from modules.core.job_indexes import TEXT_COLLATION
+
+# Campos retornados por padrão: a descrição e a assinatura MinHash são grandes e raramente necessárias na listagem
+DEFAULT_PROJECTION = {
+    "title": 1,
+    "company": 1,
+    "location": 1,
+    "url": 1,
+    "posted_at": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "duplicate_of": 1,
+}
+
+
+class JobQuery:
+    """Consultas aos jobs gravados pelos bots, apoiadas nos índices de `modules.core.job_indexes`.
+
+    Cada consulta é feita nas coleções de todos os bots (ou dos informados em `bots`) e os resultados são
+    intercalados na ordem pedida. Os documentos são lidos dos cursores em lotes de `batch_size` e entregues
+    um a um, com o campo `bot` indicando a origem.
+    """
+
+    def __init__(self, database, bots: Optional[list[str]] = None, batch_size: int = 200):
+        self.__database = database
+        self.__bots = bots
+        self.__batch_size = batch_size
+
+    async def collections(self) -> list[str]:
+        """Coleções de jobs consultadas (uma por bot, ex.: `IndeedBot`)."""
+        names = [name for name in await self.__database.list_collection_names() if name.endswith("Bot")]
+        if self.__bots is None:
+            return sorted(names)
+        BOTS = {bot.lower() for bot in self.__bots}
+        return sorted(name for name in names if name.lower() in BOTS)
+
+    def new_since(self, since: datetime, limit: int = 0, projection: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Jobs gravados pela primeira vez a partir de `since`, dos mais recentes para os mais antigos."""
+        return self.__find({"created_at": {"$gte": since}}, limit, projection)
+
+    def by_company(self, company: str, since: Optional[datetime] = None, limit: int = 0, projection: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Jobs de uma empresa (sem diferenciar maiúsculas nem acentos), dos mais recentes para os mais antigos."""
+        return self.__find({"company": company, **_since(since)}, limit, projection, collation=True)
+
+    def by_location(self, location: str, since: Optional[datetime] = None, limit: int = 0, projection: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Jobs de uma localização (sem diferenciar maiúsculas nem acentos), dos mais recentes para os mais antigos."""
+        return self.__find({"location": location, **_since(since)}, limit, projection, collation=True)
+
+    def search(self, keywords: str, since: Optional[datetime] = None, limit: int = 0, projection: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Busca textual no título e na descrição, dos mais relevantes para os menos relevantes.
+
+        Args:
+            keywords: Palavras buscadas, na sintaxe do `$text` do MongoDB (`"frase exata"`, `-excluida`).
+        """
+        return self.__find({"$text": {"$search": keywords}, **_since(since)}, limit, projection, text=True)
+
+    async def __find(self, query: dict, limit: int, projection: Optional[dict], collation: bool = False, text: bool = False):
+        projection = dict(DEFAULT_PROJECTION if projection is None else projection)
+        if text:
+            projection["score"] = {"$meta": "textScore"}
+            sort = [("score", {"$meta": "textScore"})]
+            key = lambda document: -document["score"]
+        else:
+            if any(projection.values()):
+                projection.setdefault("created_at", 1)  # Usado para intercalar os resultados dos bots
+            sort = [("created_at", -1)]
+            key = lambda document: -document["created_at"].timestamp() if document.get("created_at") else 0
+        cursors = {}
+        for name in await self.collections():
+            cursor = self.__database[name].find(query, projection).sort(sort).batch_size(self.__batch_size)
+            if collation:
+                cursor = cursor.collation(TEXT_COLLATION)
+            if limit:
+                cursor = cursor.limit(limit)
+            cursors[name] = cursor
+        count = 0
+        try:
+            async for document in _merge(cursors, key):
+                yield document
+                count += 1
+                if limit and count >= limit:
+                    break
+        finally:
+            for cursor in cursors.values():
+                await cursor.close()
+
+
+def _since(since: Optional[datetime]) -> dict:
+    return {"created_at": {"$gte": since}} if since is not None else {}
+
+
+async def _merge(cursors: dict, key: Callable[[dict], float]) -> AsyncIterator[dict]:
+    """Intercala cursores já ordenados por `key`, lendo apenas o próximo documento de cada um."""
+    heap = []
+    for index, (name, cursor) in enumerate(cursors.items()):
+        document = await anext(cursor, None)
+        if document is not None:
+            heap.append((key(document), index, name, document))
+    heapq.heapify(heap)
+    while heap:
+        _, index, name, document = heap[0]
+        document["bot"] = name
+        yield document
+        following = await anext(cursors[name], None)
+        if following is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (key(following), index, name, following))
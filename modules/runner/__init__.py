@@ -0,0 +1,2 @@
+from .daemon import Daemon, DaemonOptions, run_daemon, run_daemons
+from .orchestrator import BOTS, BotReport, create_bot, format_summary, run_bot, run_bots
@@ -0,0 +1,207 @@
+import asyncio
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Optional
+
+import nest_asyncio
+from dotenv import load_dotenv
+
+from modules.core import JobBot, JobSearch
+from modules.runner.orchestrator import BotReport, create_bot
+from modules.utils import get_logger, stop_logging
+
+
+@dataclass
+class DaemonOptions:
+    interval: float = 900  # Intervalo padrão (s) entre as execuções de cada pesquisa
+    retry_delay: float = 60  # Espera (s) antes de repetir as pesquisas de um ciclo com erro
+    recycle_cycles: int = 50  # Ciclos até reciclar o navegador (0 = nunca)
+    recycle_age: float = 6 * 3600  # Idade máxima (s) do navegador antes de reciclá-lo (0 = sem limite)
+    max_failures: int = 3  # Ciclos seguidos com erro até recriar o bot (banco, índices e navegador)
+    poll_interval: float = 60  # Tempo máximo (s) ocioso sem verificar se o arquivo de configuração mudou
+
+
+class Daemon:
+    """Mantém um bot aberto (navegador aquecido e logado) e executa cada pesquisa no seu intervalo.
+
+    A cada ciclo, apenas as pesquisas vencidas são executadas, com o mesmo navegador. Ele só é reciclado após
+    um ciclo com erro, após `recycle_cycles` ciclos ou ao passar de `recycle_age` segundos; depois de
+    `max_failures` erros seguidos, o bot é recriado do zero.
+    """
+
+    def __init__(self, factory: Callable[[], JobBot], options: DaemonOptions):
+        self.__factory = factory
+        self.__options = options
+        self.__bot: Optional[JobBot] = None
+        self.__name = ""
+        self.__logger = None
+        self.__stopping = asyncio.Event()
+        self.__next_run: dict[tuple[str, str], float] = {}  # Próxima execução (time.monotonic) de cada pesquisa
+        self.__cycles = 0  # Ciclos executados pelo navegador atual
+        self.__browser_started_at = 0.0
+        self.__failures = 0
+        self.__inserted = 0
+        self.__updated = 0
+        self.__error: Optional[Exception] = None
+
+    def stop(self):
+        """Encerra o daemon ao fim do ciclo atual."""
+        if not self.__stopping.is_set() and self.__logger is not None:
+            self.__logger.info("Encerrando o daemon após o ciclo atual...")
+        self.__stopping.set()
+
+    async def run(self) -> BotReport:
+        START_TIME = time.time()
+        try:
+            while not self.__stopping.is_set():
+                if self.__bot is None and not await self.__open():
+                    await self.__wait(self.__options.retry_delay)
+                    continue
+                self.__bot.reload_config()
+                due = self.__due_searches()
+                if not due:
+                    await self.__wait(min(self.__time_to_next(), self.__options.poll_interval))
+                    continue
+                if self.__should_recycle() and not await self.__recycle():
+                    continue
+                await self.__run_cycle(due)
+        finally:
+            await self.__close()
+        error = str(self.__error) if self.__error is not None else None
+        return BotReport(self.__name, self.__inserted, self.__updated, time.time() - START_TIME, error)
+
+    async def __open(self) -> bool:
+        bot = self.__factory()
+        self.__name = bot.__class__.__name__.lower()
+        self.__logger = get_logger(f"{bot.__class__.__name__}.daemon", level=os.getenv("LOG_LEVEL", "DEBUG").upper())
+        self.__bot = bot
+        if not await bot.open():
+            self.__logger.error(f"Não foi possível abrir o bot: {bot.error}. Nova tentativa em {self.__options.retry_delay:g}s.")
+            self.__error = bot.error
+            await self.__close()
+            return False
+        self.__cycles = 0
+        self.__failures = 0
+        self.__browser_started_at = time.monotonic()
+        self.__logger.info(f"Daemon iniciado: {len(bot.searches)} pesquisa(s) a cada {self.__options.interval:g}s (padrão).")
+        return True
+
+    async def __close(self):
+        if self.__bot is None:
+            return
+        await self.__bot.close()
+        self.__inserted += self.__bot.jobs_inserted
+        self.__updated += self.__bot.jobs_updated
+        self.__bot = None
+
+    async def __recycle(self) -> bool:
+        if await self.__bot.recycle():
+            self.__cycles = 0
+            self.__browser_started_at = time.monotonic()
+            return True
+        self.__logger.error(f"Não foi possível reciclar o navegador: {self.__bot.error}. Recriando o bot.")
+        await self.__close()
+        return False
+
+    async def __run_cycle(self, searches: list[JobSearch]):
+        bot = self.__bot
+        START_TIME = time.monotonic()
+        INSERTED, UPDATED = bot.jobs_inserted, bot.jobs_updated
+        self.__logger.info(f"Iniciando ciclo: {len(searches)} pesquisa(s) vencida(s).")
+        ok = await bot.run(searches)
+        self.__cycles += 1
+        DURATION = time.monotonic() - START_TIME
+        bot.metrics.inc("daemon_cycles_total", bot=bot.__class__.__name__, result="ok" if ok else "error")
+        bot.metrics.observe("daemon_cycle_seconds", DURATION, bot=bot.__class__.__name__)
+        if ok:
+            self.__failures = 0
+            self.__error = None
+            for search in searches:
+                self.__next_run[self.__key(search)] = START_TIME + (search.interval or self.__options.interval)
+            self.__logger.info(
+                f"Ciclo concluído em {DURATION:.1f}s | Inseridos: {bot.jobs_inserted - INSERTED} | Atualizados: {bot.jobs_updated - UPDATED}"
+            )
+            return
+        self.__error = bot.error
+        self.__failures += 1
+        for search in searches:
+            self.__next_run[self.__key(search)] = time.monotonic() + self.__options.retry_delay
+        self.__logger.warning(f"Ciclo com erro ({self.__failures} seguido(s)): {bot.error}")
+        if self.__failures >= self.__options.max_failures:
+            self.__logger.error("Limite de erros seguidos atingido. Recriando o bot.")
+            await self.__close()
+        else:
+            await self.__recycle()
+
+    def __due_searches(self) -> list[JobSearch]:
+        NOW = time.monotonic()
+        return [search for search in self.__bot.searches if self.__next_run.get(self.__key(search), 0) <= NOW]
+
+    def __time_to_next(self) -> float:
+        NOW = time.monotonic()
+        return min((self.__next_run.get(self.__key(search), 0) - NOW for search in self.__bot.searches), default=self.__options.poll_interval)
+
+    def __should_recycle(self) -> bool:
+        if self.__options.recycle_cycles and self.__cycles >= self.__options.recycle_cycles:
+            return True
+        return bool(self.__options.recycle_age) and time.monotonic() - self.__browser_started_at >= self.__options.recycle_age
+
+    async def __wait(self, seconds: float):
+        try:
+            await asyncio.wait_for(self.__stopping.wait(), timeout=max(seconds, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    @staticmethod
+    def __key(search: JobSearch) -> tuple[str, str]:
+        return search.job, search.location
+
+
+async def _serve(name: str, options: DaemonOptions, overrides: dict) -> BotReport:
+    daemon = Daemon(partial(create_bot, name, **overrides), options)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, daemon.stop)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: o encerramento fica com o KeyboardInterrupt
+    return await daemon.run()
+
+
+def run_daemon(name: str, options: DaemonOptions, overrides: Optional[dict] = None) -> BotReport:
+    """Executa um bot em modo daemon até receber SIGINT/SIGTERM. Usado como alvo dos processos do orquestrador."""
+    nest_asyncio.apply()
+    load_dotenv()
+    try:
+        return asyncio.run(_serve(name, options, overrides or {}))
+    finally:
+        stop_logging()
+
+
+def run_daemons(names: list[str], options: DaemonOptions, overrides: Optional[dict] = None) -> list[BotReport]:
+    """Executa cada bot em modo daemon no seu próprio processo (e navegador), até Ctrl+C.
+
+    Args:
+        names: Bots a executar.
+        options: Agendamento e reciclagem dos navegadores.
+        overrides: Opções aplicadas a todos os bots (padrão: valores da seção `settings`).
+    """
+    reports: list[BotReport] = []
+    with ProcessPoolExecutor(max_workers=len(names)) as executor:
+        futures = {executor.submit(run_daemon, name, options, overrides): name for name in names}
+        pending = set(futures)
+        while pending:
+            try:
+                for future in as_completed(pending):
+                    pending.discard(future)
+                    try:
+                        reports.append(future.result())
+                    except Exception as err:
+                        reports.append(BotReport(futures[future], error=str(err)))
+            except KeyboardInterrupt:
+                pass  # Os processos dos bots também recebem o sinal e encerram após o ciclo atual
+    return sorted(reports, key=lambda report: names.index(report.bot))
@@ -0,0 +1,107 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Optional
+
+import nest_asyncio
+from dotenv import load_dotenv
+
+from modules.bot.indeed import IndeedBot, IndeedBotOptions
+from modules.bot.infojob import InfoJobBot, InfoJobBotOptions
+from modules.bot.linkedin import LinkedinBot, LinkedinBotOptions
+from modules.configs import load_config
+from modules.core import JobBot
+from modules.utils import stop_logging
+
+
+@dataclass
+class BotSpec:
+    bot_class: type
+    options_class: type
+    username_env: str
+    password_env: Optional[str] = None
+
+
+@dataclass
+class BotReport:
+    bot: str
+    inserted: int = 0
+    updated: int = 0
+    duration: float = 0
+    error: Optional[str] = None
+
+
+BOTS: dict[str, BotSpec] = {
+    "indeedbot": BotSpec(IndeedBot, IndeedBotOptions, "INDEED_USER"),
+    "infojobbot": BotSpec(InfoJobBot, InfoJobBotOptions, "INFOJOB_USER", "INFOJOB_PASS"),
+    "linkedinbot": BotSpec(LinkedinBot, LinkedinBotOptions, "LINKEDIN_USER", "LINKEDIN_PASS"),
+}
+
+
+def create_bot(name: str, **overrides) -> JobBot:
+    """Cria o bot a partir do `configs.yml` e das variáveis de ambiente.
+
+    Args:
+        name: Nome do bot (indeedbot, infojobbot, linkedinbot).
+        overrides: Opções do bot (ex.: `detail_tabs`, `searches`) que sobrescrevem a seção `settings` e as pesquisas do
+            arquivo de configuração. Pesquisas ou filtros sobrescritos desativam a recarga do arquivo durante a execução.
+    """
+    spec = BOTS[name]
+    config = load_config()
+    OPTIONS = {field.name for field in fields(spec.options_class)}
+    settings = {
+        "username": os.getenv(spec.username_env),
+        "password": os.getenv(spec.password_env) if spec.password_env else None,
+        "searches": list(config.get_searches(name)),
+        "filters": list(config.filters),
+    }
+    if overrides.get("searches") is None and overrides.get("filters") is None:
+        settings["config_source"] = partial(load_config, config.path)
+    settings.update({key: value for key, value in config.get_settings(name).items() if key in OPTIONS})
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+    options = spec.options_class(**settings)
+    return spec.bot_class(options)
+
+
+def run_bot(name: str, overrides: Optional[dict] = None) -> BotReport:
+    """Executa um bot até o fim. Usado como alvo dos processos do orquestrador."""
+    nest_asyncio.apply()
+    load_dotenv()
+    try:
+        bot = create_bot(name, **(overrides or {}))
+        asyncio.run(bot.start())
+    finally:
+        stop_logging()  # Os processos do pool não executam o atexit: grava os registros pendentes
+    error = str(bot.error) if bot.error is not None else None
+    return BotReport(name, bot.jobs_inserted, bot.jobs_updated, bot.duration, error)
+
+
+def run_bots(names: list[str], workers: Optional[int] = None, overrides: Optional[dict] = None) -> list[BotReport]:
+    """Executa os bots em paralelo, cada um em seu próprio processo (e navegador).
+
+    Args:
+        names: Bots a executar.
+        workers: Quantidade máxima de bots executando ao mesmo tempo (padrão: todos).
+        overrides: Opções aplicadas a todos os bots (padrão: valores da seção `settings`).
+    """
+    reports: list[BotReport] = []
+    with ProcessPoolExecutor(max_workers=workers or len(names)) as executor:
+        futures = {executor.submit(run_bot, name, overrides): name for name in names}
+        for future in as_completed(futures):
+            try:
+                reports.append(future.result())
+            except Exception as err:
+                reports.append(BotReport(futures[future], error=str(err)))
+    return sorted(reports, key=lambda report: names.index(report.bot))
+
+
+def format_summary(reports: list[BotReport], duration: float) -> str:
+    lines = [f"{'Bot':<12} {'Inseridos':>10} {'Atualizados':>12} {'Duração':>10}  Status"]
+    for report in reports:
+        status = f"ERRO: {report.error}" if report.error else "OK"
+        lines.append(f"{report.bot:<12} {report.inserted:>10} {report.updated:>12} {report.duration:>9.1f}s  {status}")
+    lines.append(f"{'Total':<12} {sum(r.inserted for r in reports):>10} {sum(r.updated for r in reports):>12} {duration:>9.1f}s")
+    return "\n".join(lines)
+
@@ -1,3 +1,4 @@
-from .get_logger import get_logger
+from .db_handler import get_db_host, get_db_name
+from .get_logger import get_logger, stop_logging
 from .json_handler import load_json, default_serializer
 from .string_handler import normalize_string, camel_case_split
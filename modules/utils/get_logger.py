@@ -1,24 +1,149 @@
+import atexit
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+
+ROOT_LOGGER = "jobot"
+DEFAULT_FORMAT = "%(asctime)s %(levelname)s %(funcName)s %(message)s"
+DEFAULT_DATE_FORMAT = "%d/%m/%Y %H:%M:%S"
+CONSOLE_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(funcName)s %(message)s"  # Vários bots no mesmo console
+
+_lock = threading.Lock()
+_pid: int = None
+_listener: QueueListener = None
+_dispatcher: "_Dispatcher" = None
+_queue: queue.SimpleQueue = None
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class _LazyQueueHandler(QueueHandler):
+    """Enfileira o registro sem aplicar o formato dos handlers: a formatação final e a escrita ficam com a thread do listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Como no `QueueHandler` da stdlib, a mensagem e o traceback são fixados agora: os argumentos podem mudar
+        # antes de o listener formatar o registro, e o traceback manteria os frames vivos
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _SwapFile:
+    """Troca do arquivo de um logger, enviada pela fila para ser aplicada na thread do listener."""
+
+    def __init__(self, name: str, handler: logging.Handler):
+        self.name = name
+        self.handler = handler
+
+
+class _Dispatcher(logging.Handler):
+    """Executado na thread do listener: envia cada registro ao console e ao arquivo do logger que o emitiu."""
+
+    def __init__(self, console: logging.Handler):
+        super().__init__()
+        self.console = console
+        self.files: dict[str, logging.Handler] = {}  # Usado apenas pela thread do listener
+        self.paths: dict[str, str] = {}  # Arquivo de cada logger, consultado por `get_logger` (com `_lock`)
+
+    def handle(self, record: logging.LogRecord):
+        if isinstance(record, _SwapFile):
+            # Na thread do listener, nenhum registro está sendo escrito no arquivo anterior
+            previous = self.files.get(record.name)
+            self.files[record.name] = record.handler
+            if previous is not None:
+                previous.close()
+            return
+        self.console.handle(record)
+        # Registros de loggers filhos (ex.: jobot.IndeedBot.writer) vão para o arquivo do bot
+        name = record.name
+        while name:
+            handler = self.files.get(name)
+            if handler is not None:
+                handler.handle(record)
+                return
+            name = name.rpartition(".")[0]
+
+    def close(self):
+        for handler in [self.console, *self.files.values()]:
+            handler.close()
+        super().close()
+
+
+def _file_handler(file_name: str) -> logging.Handler:
+    """Arquivo com rotação diária (padrão) ou por tamanho, se `LOG_MAX_BYTES` estiver definido."""
+    BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 14))
+    MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 0))
+    if MAX_BYTES > 0:
+        return RotatingFileHandler(file_name, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8")
+    return TimedRotatingFileHandler(file_name, when="midnight", backupCount=BACKUP_COUNT, encoding="utf-8")
+
+
+def _setup() -> "_Dispatcher":
+    """Cria (uma vez por processo) a fila de log e o listener que formata e grava os registros em segundo plano."""
+    global _pid, _listener, _dispatcher, _queue
+    if _pid == os.getpid():
+        return _dispatcher
+    # Em um processo filho (fork), o listener herdado não tem thread: uma nova fila é criada
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(fmt=CONSOLE_FORMAT, datefmt=DEFAULT_DATE_FORMAT))
+    _dispatcher = _Dispatcher(console)
+    _queue = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in [*root.handlers]:
+        root.removeHandler(handler)
+    root.addHandler(_LazyQueueHandler(_queue))
+    root.setLevel(logging.DEBUG)
+    root.propagate = False
+    _listener = QueueListener(_queue, _dispatcher)
+    _listener.start()
+    _pid = os.getpid()
+    return _dispatcher
+
+
+def stop_logging():
+    """Grava os registros pendentes e encerra o listener do processo (ex.: ao fim de um processo de bot)."""
+    global _pid, _listener, _dispatcher, _queue
+    with _lock:
+        if _pid != os.getpid():
+            return
+        _listener.stop()
+        _dispatcher.close()
+        logging.getLogger(ROOT_LOGGER).handlers.clear()
+        _pid = _listener = _dispatcher = _queue = None
+
+
+atexit.register(stop_logging)
 
 
 def get_logger(
     name: str,
     level: int = logging.WARNING,
-    date_format: str = "%d/%m/%Y %H:%M:%S",
-    format: str = "%(asctime)s %(levelname)s %(funcName)s %(message)s",
+    date_format: str = DEFAULT_DATE_FORMAT,
+    format: str = DEFAULT_FORMAT,
     file_name: str = None,
 ):
-    logger = logging.getLogger(name=name)
-    logger.setLevel(level=level)
-    formatter = logging.Formatter(fmt=format, datefmt=date_format)
-    if file_name is not None:
-        dirname = os.path.dirname(file_name)
-        os.makedirs(dirname, exist_ok=True)
-        file_handler = logging.FileHandler(filename=file_name, mode="w", encoding="utf-8")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    """Retorna o logger `jobot.<name>`, que compartilha a fila de log do processo.
+
+    Pode ser chamada várias vezes para o mesmo nome (ex.: um bot recriado): os handlers não são duplicados.
+
+    Args:
+        name: Nome do logger (ex.: nome do bot).
+        level: Nível mínimo dos registros. Registros abaixo dele são descartados antes de serem criados.
+        file_name: Arquivo do logger, com rotação diária (ou por tamanho, com `LOG_MAX_BYTES`).
+    """
+    with _lock:
+        dispatcher = _setup()
+        logger = logging.getLogger(f"{ROOT_LOGGER}.{name}")
+        logger.setLevel(level=level)
+        if file_name is not None and dispatcher.paths.get(logger.name) != os.path.abspath(file_name):
+            os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+            handler = _file_handler(file_name)
+            handler.setFormatter(logging.Formatter(fmt=format, datefmt=date_format))
+            dispatcher.paths[logger.name] = os.path.abspath(file_name)
+            # A troca (e o fechamento do arquivo anterior) passa pela fila: vale a partir dos próximos registros
+            _queue.put_nowait(_SwapFile(logger.name, handler))
     return logger
@@ -0,0 +1,33 @@
+import re
+from typing import Optional
+
+from bs4 import BeautifulSoup, Tag
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def element_text(element: Optional[Tag]) -> Optional[str]:
+    """Texto visível do elemento, equivalente ao `.text` dos elementos do driver."""
+    if element is None:
+        return None
+    return element.get_text("\n", strip=True)
+
+
+def own_text(element: Optional[Tag]) -> Optional[str]:
+    """Apenas o texto direto do elemento, sem o dos filhos (equivalente ao `.text_fragment`)."""
+    if element is None:
+        return None
+    return "".join(element.find_all(string=True, recursive=False)).strip() or element_text(element)
+
+
+def collapse_spaces(text: Optional[str]) -> Optional[str]:
+    return re.sub(r"\s+", " ", text).strip() if text is not None else None
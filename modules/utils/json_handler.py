@@ -1,5 +1,6 @@
 import json
 from dataclasses import asdict, is_dataclass
+from datetime import datetime
 
 
 def save_json(filepath: str, data):
@@ -9,10 +10,18 @@ def save_json(filepath: str, data):
 
 def load_json(filepath: str):
     with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return json.load(f, object_hook=json_object_hook)
 
 
 def default_serializer(obj):
     if is_dataclass(obj):
         return asdict(obj)
+    if isinstance(obj, datetime):
+        return {"$date": obj.isoformat()}
     raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def json_object_hook(obj: dict):
+    if len(obj) == 1 and "$date" in obj:
+        return datetime.fromisoformat(obj["$date"])
+    return obj